@@ -1,5 +1,11 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
+
 from .base import BaseModel
 from .base import CaseExact
+from .base import ColumnarList
 from .base import ComplexAttribute
 from .base import Context
 from .base import ExternalReference
@@ -10,45 +16,117 @@ from .base import Required
 from .base import Returned
 from .base import Uniqueness
 from .base import URIReference
-from .rfc7643.enterprise_user import EnterpriseUser
-from .rfc7643.enterprise_user import Manager
-from .rfc7643.group import Group
-from .rfc7643.group import GroupMember
-from .rfc7643.resource import AnyResource
-from .rfc7643.resource import Meta
-from .rfc7643.resource import Resource
-from .rfc7643.resource_type import ResourceType
-from .rfc7643.resource_type import SchemaExtension
-from .rfc7643.schema import Attribute
-from .rfc7643.schema import Schema
-from .rfc7643.service_provider_config import AuthenticationScheme
-from .rfc7643.service_provider_config import Bulk
-from .rfc7643.service_provider_config import ChangePassword
-from .rfc7643.service_provider_config import ETag
-from .rfc7643.service_provider_config import Filter
-from .rfc7643.service_provider_config import Patch
-from .rfc7643.service_provider_config import ServiceProviderConfig
-from .rfc7643.service_provider_config import Sort
-from .rfc7643.user import Address
-from .rfc7643.user import Email
-from .rfc7643.user import Entitlement
-from .rfc7643.user import GroupMembership
-from .rfc7643.user import Im
-from .rfc7643.user import Name
-from .rfc7643.user import PhoneNumber
-from .rfc7643.user import Photo
-from .rfc7643.user import Role
-from .rfc7643.user import User
-from .rfc7643.user import X509Certificate
-from .rfc7644.bulk import BulkOperation
-from .rfc7644.bulk import BulkRequest
-from .rfc7644.bulk import BulkResponse
-from .rfc7644.error import Error
-from .rfc7644.list_response import ListResponse
-from .rfc7644.message import Message
-from .rfc7644.patch_op import PatchOp
-from .rfc7644.patch_op import PatchOperation
-from .rfc7644.search_request import SearchRequest
+
+if TYPE_CHECKING:
+    from .cursor import CursorEncoder
+    from .mapper import RowMapper
+    from .rfc7643.enterprise_user import EnterpriseUser
+    from .rfc7643.enterprise_user import Manager
+    from .rfc7643.group import Group
+    from .rfc7643.group import GroupMember
+    from .rfc7643.resource import AnyResource
+    from .rfc7643.resource import Meta
+    from .rfc7643.resource import Resource
+    from .rfc7643.resource_type import ResourceType
+    from .rfc7643.resource_type import SchemaExtension
+    from .rfc7643.schema import Attribute
+    from .rfc7643.schema import Schema
+    from .rfc7643.service_provider_config import AuthenticationScheme
+    from .rfc7643.service_provider_config import Bulk
+    from .rfc7643.service_provider_config import ChangePassword
+    from .rfc7643.service_provider_config import ETag
+    from .rfc7643.service_provider_config import Filter
+    from .rfc7643.service_provider_config import Patch
+    from .rfc7643.service_provider_config import ServiceProviderConfig
+    from .rfc7643.service_provider_config import Sort
+    from .rfc7643.user import Address
+    from .rfc7643.user import Email
+    from .rfc7643.user import Entitlement
+    from .rfc7643.user import GroupMembership
+    from .rfc7643.user import Im
+    from .rfc7643.user import Name
+    from .rfc7643.user import PhoneNumber
+    from .rfc7643.user import Photo
+    from .rfc7643.user import Role
+    from .rfc7643.user import User
+    from .rfc7643.user import X509Certificate
+    from .rfc7644.bulk import BulkOperation
+    from .rfc7644.bulk import BulkRequest
+    from .rfc7644.bulk import BulkResponse
+    from .rfc7644.error import Error
+    from .rfc7644.error import ErrorTemplate
+    from .rfc7644.list_response import ListResponse
+    from .rfc7644.message import Message
+    from .rfc7644.patch_op import MultiValuedDiff
+    from .rfc7644.patch_op import PatchOp
+    from .rfc7644.patch_op import PatchOperation
+    from .rfc7644.patch_op import diff_multi_valued
+    from .rfc7644.search_request import SearchRequest
+    from .validation import validate_many
+
+# The models are imported on first access, so applications only pay the
+# import and the schema build of the models they use.
+LAZY_EXPORTS = {
+    "CursorEncoder": ".cursor",
+    "RowMapper": ".mapper",
+    "EnterpriseUser": ".rfc7643.enterprise_user",
+    "Manager": ".rfc7643.enterprise_user",
+    "Group": ".rfc7643.group",
+    "GroupMember": ".rfc7643.group",
+    "AnyResource": ".rfc7643.resource",
+    "Meta": ".rfc7643.resource",
+    "Resource": ".rfc7643.resource",
+    "ResourceType": ".rfc7643.resource_type",
+    "SchemaExtension": ".rfc7643.resource_type",
+    "Attribute": ".rfc7643.schema",
+    "Schema": ".rfc7643.schema",
+    "AuthenticationScheme": ".rfc7643.service_provider_config",
+    "Bulk": ".rfc7643.service_provider_config",
+    "ChangePassword": ".rfc7643.service_provider_config",
+    "ETag": ".rfc7643.service_provider_config",
+    "Filter": ".rfc7643.service_provider_config",
+    "Patch": ".rfc7643.service_provider_config",
+    "ServiceProviderConfig": ".rfc7643.service_provider_config",
+    "Sort": ".rfc7643.service_provider_config",
+    "Address": ".rfc7643.user",
+    "Email": ".rfc7643.user",
+    "Entitlement": ".rfc7643.user",
+    "GroupMembership": ".rfc7643.user",
+    "Im": ".rfc7643.user",
+    "Name": ".rfc7643.user",
+    "PhoneNumber": ".rfc7643.user",
+    "Photo": ".rfc7643.user",
+    "Role": ".rfc7643.user",
+    "User": ".rfc7643.user",
+    "X509Certificate": ".rfc7643.user",
+    "BulkOperation": ".rfc7644.bulk",
+    "BulkRequest": ".rfc7644.bulk",
+    "BulkResponse": ".rfc7644.bulk",
+    "Error": ".rfc7644.error",
+    "ErrorTemplate": ".rfc7644.error",
+    "ListResponse": ".rfc7644.list_response",
+    "Message": ".rfc7644.message",
+    "MultiValuedDiff": ".rfc7644.patch_op",
+    "PatchOp": ".rfc7644.patch_op",
+    "PatchOperation": ".rfc7644.patch_op",
+    "diff_multi_valued": ".rfc7644.patch_op",
+    "SearchRequest": ".rfc7644.search_request",
+    "validate_many": ".validation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "Address",
@@ -62,13 +140,16 @@ __all__ = [
     "BulkResponse",
     "CaseExact",
     "ChangePassword",
+    "ColumnarList",
     "ComplexAttribute",
     "Context",
+    "CursorEncoder",
     "ETag",
     "Email",
     "EnterpriseUser",
     "Entitlement",
     "Error",
+    "ErrorTemplate",
     "ExternalReference",
     "Filter",
     "Group",
@@ -81,6 +162,7 @@ __all__ = [
     "Meta",
     "Mutability",
     "MultiValuedComplexAttribute",
+    "MultiValuedDiff",
     "Name",
     "Patch",
     "PatchOp",
@@ -93,6 +175,7 @@ __all__ = [
     "ResourceType",
     "Returned",
     "Role",
+    "RowMapper",
     "Schema",
     "SchemaExtension",
     "SearchRequest",
@@ -102,4 +185,6 @@ __all__ = [
     "URIReference",
     "User",
     "X509Certificate",
+    "diff_multi_valued",
+    "validate_many",
 ]
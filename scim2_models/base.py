@@ -1,13 +1,22 @@
+import json
+import sys
+import threading
 from collections import UserString
+from copy import deepcopy
 from enum import Enum
 from enum import auto
 from inspect import isclass
+from typing import AbstractSet
 from typing import Annotated
 from typing import Any
+from typing import Callable
+from typing import ClassVar
 from typing import Dict
+from typing import FrozenSet
 from typing import Generic
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -18,8 +27,10 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import GetCoreSchemaHandler
+from pydantic import PrivateAttr
 from pydantic import SerializationInfo
 from pydantic import SerializerFunctionWrapHandler
+from pydantic import ValidationError
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
 from pydantic import field_serializer
@@ -28,12 +39,15 @@ from pydantic import model_serializer
 from pydantic import model_validator
 from pydantic.alias_generators import to_camel
 from pydantic_core import PydanticCustomError
+from pydantic_core import SchemaSerializer
 from pydantic_core import core_schema
+from pydantic_core import to_jsonable_python
 from typing_extensions import NewType
 from typing_extensions import Self
 
 from scim2_models.attributes import contains_attribute_or_subattributes
 from scim2_models.attributes import validate_attribute_urn
+from scim2_models.utils import class_cache
 
 ReferenceTypes = TypeVar("ReferenceTypes")
 URIReference = NewType("URIReference", str)
@@ -322,13 +336,503 @@ class CaseExact(Enum):
         return self.value
 
 
+model_creation_lock = threading.RLock()
+"""Lock held while building models at runtime.
+
+Pydantic model creation is not thread-safe: generic specializations
+caches could be filled concurrently, and the attribute docstrings
+extraction relies on :mod:`ast`, that is not thread-safe on every
+Python version."""
+
+
+class FailFastError(Exception):
+    """Exception interrupting a fail-fast validation at the first SCIM
+    error.
+
+    It is not a :class:`ValueError`, so pydantic does not collect it and
+    stops the validation right away. It is turned back into a
+    :class:`~pydantic.ValidationError` by
+    :meth:`BaseModel.model_validate <scim2_models.BaseModel.model_validate>`.
+    """
+
+    def __init__(self, error: PydanticCustomError, loc: Tuple, input_value: Any):
+        super().__init__(str(error))
+        self.error = error
+        self.loc: Optional[Tuple] = loc
+        self.input_value = input_value
+        self.model_input: Any = None
+
+    def locate(self, value: Any) -> None:
+        """Prefix the error location with the location, in `value`, of the
+        input of the nested model that raised the error.
+
+        `value` is the input of the model the error goes through. The nested
+        model input is looked up by identity, and the location is dropped if
+        it cannot be found.
+        """
+
+        nested_input, self.model_input = self.model_input, value
+        if nested_input is None or nested_input is value or self.loc is None:
+            return
+
+        for key, item in value.items() if isinstance(value, dict) else ():
+            if item is nested_input:
+                self.loc = (key, *self.loc)
+                return
+
+            if isinstance(item, list):
+                for index, sub_item in enumerate(item):
+                    if sub_item is nested_input:
+                        self.loc = (key, index, *self.loc)
+                        return
+
+        self.loc = None
+
+    def to_validation_error(self, title: str) -> ValidationError:
+        return ValidationError.from_exception_data(
+            title,
+            [{"type": self.error, "loc": self.loc or (), "input": self.input_value}],
+        )
+
+
+def make_mutability_error(
+    field_name: str, mutability: Mutability, context: Context
+) -> PydanticCustomError:
+    return PydanticCustomError(
+        "mutability_error",
+        "Field '{field_name}' has mutability '{field_mutability}' but this in not valid in {context} context",
+        {
+            "field_name": field_name,
+            "field_mutability": mutability,
+            "context": context.name.lower().replace("_", " "),
+        },
+    )
+
+
+def make_returned_error(
+    field_name: str, returnability: Returned
+) -> PydanticCustomError:
+    if returnability == Returned.always:
+        message = "Field '{field_name}' has returnability 'always' but value is missing or null"
+    else:
+        message = "Field '{field_name}' has returnability 'never' but value is set"
+
+    return PydanticCustomError("returned_error", message, {"field_name": field_name})
+
+
+def raise_scim_error(
+    error: PydanticCustomError,
+    info: ValidationInfo,
+    loc: Tuple = (),
+    input_value: Any = None,
+):
+    """Raise a SCIM validation error, or interrupt the validation if the
+    'scim_fail_fast' context flag is set."""
+
+    if info.context and info.context.get("scim_fail_fast"):
+        raise FailFastError(error, loc, input_value)
+
+    raise error
+
+
+class FrozenList(list):
+    """A list that cannot be modified, holding the multi-valued attributes of
+    frozen models."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"'{self.__class__.__name__}' object is immutable")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenList":
+        return FrozenList(deepcopy(item, memo) for item in self)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # lists are unpickled by appending their items, which is forbidden
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Freeze a model, and all the models and lists it holds, in place."""
+
+    if isinstance(value, BaseModel):
+        if value.is_frozen():
+            return value
+
+        for field_name in value.model_fields:
+            value.__dict__[field_name] = freeze(value.__dict__.get(field_name))
+        for key, item in (value.__pydantic_extra__ or {}).items():
+            value.__pydantic_extra__[key] = freeze(item)
+
+        value._frozen = True
+        if isinstance(value, ComplexAttribute) and value.compact_storage:
+            value.compact()
+
+    elif isinstance(value, list) and not isinstance(value, FrozenList):
+        return FrozenList(freeze(item) for item in value)
+
+    elif isinstance(value, ColumnarList):
+        value._frozen = True
+
+    return value
+
+
+SCIM_SERIALIZERS = {"scim_serializer", "model_serializer_exclude_none"}
+
+PLAIN_SERIALIZER_PARAMETERS = {
+    "mode",
+    "include",
+    "exclude",
+    "context",
+    "by_alias",
+    "exclude_unset",
+    "exclude_defaults",
+    "exclude_none",
+    "round_trip",
+    "indent",
+}
+"""The dump parameters supported by the serializers built by
+:meth:`BaseModel.get_plain_serializer`."""
+
+
+def without_scim_serializers(schema: Any) -> Any:
+    """Return a copy of a core schema, without the SCIM serializers."""
+
+    if isinstance(schema, dict):
+        return {
+            key: without_scim_serializers(value)
+            for key, value in schema.items()
+            if key != "serialization"
+            or getattr(value.get("function"), "__name__", None) not in SCIM_SERIALIZERS
+        }
+
+    if isinstance(schema, list):
+        return [without_scim_serializers(item) for item in schema]
+
+    return schema
+
+
+def make_request_exclude(
+    model: Type["BaseModel"], context: Context, parents: Tuple[Type, ...]
+) -> Optional[Dict[str, Any]]:
+    """Build the ``exclude`` structure of
+    :meth:`BaseModel.get_request_exclude`.
+
+    Return :data:`None` if the model is one of its own sub-attributes, or if
+    a sub-attribute can hold several models.
+    """
+
+    from scim2_models.rfc7643.resource import Resource
+
+    if model in parents:
+        return None
+
+    exclude = {}
+    for field_name, field in model.model_fields.items():
+        if model.is_excluded_from_request(field_name, context):
+            exclude[field_name] = True
+            continue
+
+        attribute_type = model.get_field_root_type(field_name)
+        if isinstance(attribute_type, TypeVar) or get_origin(attribute_type) in (
+            Union,
+            Annotated,
+        ):
+            return None
+
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = get_args(annotation)[0]
+
+        # columnar lists leave their items out by themselves
+        if (
+            not isclass(attribute_type)
+            or not issubclass(attribute_type, BaseModel)
+            or get_origin(annotation) is ColumnarList
+        ):
+            continue
+
+        sub_exclude = make_request_exclude(attribute_type, context, (*parents, model))
+        if sub_exclude is None:
+            return None
+
+        if sub_exclude:
+            is_multiple = get_origin(annotation) is list
+            exclude[field_name] = (
+                {"__all__": sub_exclude} if is_multiple else sub_exclude
+            )
+
+    if issubclass(model, Resource):
+        for schema, extension_model in model.get_extension_models().items():
+            sub_exclude = make_request_exclude(
+                extension_model, context, (*parents, model)
+            )
+            if sub_exclude is None:
+                return None
+
+            if sub_exclude:
+                exclude[schema] = sub_exclude
+
+    return exclude
+
+
+def intern_canonical_value(value: Any, canonical_values: AbstractSet[str]) -> Any:
+    """Intern a string if it is one of the canonical values."""
+
+    if type(value) is str and value in canonical_values:
+        return sys.intern(value)
+    return value
+
+
+@class_cache
+def get_sub_attribute_models(
+    model: Type["BaseModel"],
+) -> Tuple[Tuple[str, Type["BaseModel"], bool], ...]:
+    """Return the name, the model and the multiplicity of the complex
+    sub-attributes and of the extensions of a model.
+
+    Columnar lists are left out, as their items are always built from their
+    declared model.
+    """
+
+    from scim2_models.rfc7643.resource import Resource
+
+    attributes = []
+    for field_name, field in model.model_fields.items():
+        attribute_type = model.get_field_root_type(field_name)
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = get_args(annotation)[0]
+
+        if (
+            isclass(attribute_type)
+            and issubclass(attribute_type, BaseModel)
+            and get_origin(annotation) is not ColumnarList
+        ):
+            attributes.append(
+                (field_name, attribute_type, get_origin(annotation) is list)
+            )
+
+    if issubclass(model, Resource):
+        attributes.extend(
+            (schema, extension_model, False)
+            for schema, extension_model in model.get_extension_models().items()
+        )
+
+    return tuple(attributes)
+
+
+def has_declared_types(obj: "BaseModel") -> bool:
+    """Tell whether the complex sub-attributes of a model are instances of
+    their declared models, and not of subclasses with other annotations.
+
+    The :meth:`BaseModel.get_request_exclude` structures are built from the
+    declared models, and only apply to such models.
+    """
+
+    for name, attribute_model, multiple in get_sub_attribute_models(type(obj)):
+        value = obj.__dict__.get(name)
+        if value is None and obj.__pydantic_extra__:
+            value = obj.__pydantic_extra__.get(name)
+        if value is None:
+            continue
+
+        for item in value if multiple else (value,):
+            if type(item) is not attribute_model or not has_declared_types(item):
+                return False
+
+    return True
+
+
+MAX_CACHED_DUMPS = 32
+"""The number of JSON serializations memoized by each frozen model."""
+
+INTERNAL_PRIVATE_ATTRIBUTES = {"_frozen", "_cache", "_etag"}
+"""The private attributes holding the frozen flag and the memoized values of
+the models, that are ignored by model comparisons."""
+
+
+def get_compared_private_attributes(model: BaseModel) -> Optional[Dict[str, Any]]:
+    private = model.__pydantic_private__
+    if not private:
+        return private
+
+    return {
+        name: value
+        for name, value in private.items()
+        if name not in INTERNAL_PRIVATE_ATTRIBUTES
+    }
+
+
 class BaseModel(BaseModel):
     """Base Model for everything."""
 
     model_config = ConfigDict(
-        alias_generator=to_camel, populate_by_name=True, use_attribute_docstrings=True
+        alias_generator=to_camel,
+        populate_by_name=True,
+        use_attribute_docstrings=True,
+        defer_build=True,
     )
 
+    dump_cache_size: ClassVar[int] = 0
+    """The number of :meth:`~scim2_models.BaseModel.model_dump` and
+    :meth:`~scim2_models.BaseModel.model_dump_json` results memoized by each
+    instance, for instance for popular resources that are often dumped with the
+    same parameters.
+
+    The memoized results are dropped when an attribute of the instance is
+    assigned. Modifications of sub-attributes or of multi-valued attributes
+    items are not detected. :meth:`~scim2_models.BaseModel.frozen` instances
+    always memoize their :meth:`~scim2_models.BaseModel.model_dump_json`
+    results.
+
+    .. code-block:: python
+
+        Group.dump_cache_size = 4
+    """
+
+    _frozen: bool = PrivateAttr(default=False)
+    _cache: Optional[Dict[Any, Any]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+
+        if self.is_frozen():
+            raise ValidationError.from_exception_data(
+                self.__class__.__name__,
+                [{"type": "frozen_instance", "loc": (name,), "input": value}],
+            )
+        super().__setattr__(name, value)
+        if self._cache is not None:
+            self._cache = None
+
+    def __delattr__(self, name: str) -> None:
+        if not name.startswith("_") and self.is_frozen():
+            raise ValidationError.from_exception_data(
+                self.__class__.__name__,
+                [{"type": "frozen_instance", "loc": (name,), "input": None}],
+            )
+        super().__delattr__(name)
+        if self._cache is not None:
+            self._cache = None
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+
+        # memoized dumps and entity tags, and the frozen flag, do not take part
+        # in the comparison, so dumping or freezing a model keeps it equal to
+        # its copies
+        self_type = self.__pydantic_generic_metadata__["origin"] or self.__class__
+        other_type = other.__pydantic_generic_metadata__["origin"] or other.__class__
+        if (
+            self_type != other_type
+            or self.__pydantic_extra__ != other.__pydantic_extra__
+            or (
+                self.__pydantic_private__ != other.__pydantic_private__
+                and get_compared_private_attributes(self)
+                != get_compared_private_attributes(other)
+            )
+        ):
+            return False
+
+        return self.__dict__ == other.__dict__ or all(
+            self.__dict__.get(field_name) == other.__dict__.get(field_name)
+            for field_name in self.model_fields
+        )
+
+    def __hash__(self) -> int:
+        if not self.is_frozen():
+            raise TypeError(f"unhashable type: '{self.__class__.__name__}'")
+
+        from scim2_models.rfc7643.resource import get_canonical_value
+
+        return hash(json.dumps(get_canonical_value(self), sort_keys=True))
+
+    def __copy__(self) -> Self:
+        copy = super().__copy__()
+        copy._cache = None
+        return copy
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        copy = super().__deepcopy__(memo)
+        copy._cache = None
+        return copy
+
+    def is_frozen(self) -> bool:
+        private = self.__pydantic_private__
+        return bool(private and private.get("_frozen"))
+
+    def frozen(self) -> Self:
+        """Return a frozen copy of the model.
+
+        Frozen models, their sub-attributes and their multi-valued
+        attributes cannot be modified. They are hashable, can safely be
+        shared between threads, and memoize their
+        :meth:`~scim2_models.BaseModel.model_dump_json` results.
+
+        .. code-block:: python
+
+            >>> user = User(user_name="bjensen").frozen()
+            >>> user.user_name = "babs"
+            Traceback (most recent call last):
+                ...
+            pydantic_core._pydantic_core.ValidationError: 1 validation error for User
+            ...
+            >>> hash(user) == hash(User(user_name="bjensen").frozen())
+            True
+
+        :meth:`Resource.clone <scim2_models.Resource.clone>` can build
+        modified copies of frozen resources, that share the frozen values.
+        """
+
+        if self.is_frozen():
+            return self
+
+        return freeze(self.model_copy(deep=True))
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+
+        # Schemas are built on first use, but the field aliases are needed
+        # beforehand to look attributes up and to build schemas.
+        for field_name, field in cls.model_fields.items():
+            if field.alias_priority is None or field.alias_priority <= 1:
+                field.alias_priority = 1
+                field.alias = field.validation_alias = field.serialization_alias = (
+                    to_camel(field_name)
+                )
+
+    @classmethod
+    def model_rebuild(
+        cls, *, _parent_namespace_depth: int = 2, **kwargs: Any
+    ) -> Optional[bool]:
+        # Schemas are built on first use, possibly by several threads at the
+        # same time.
+        if _parent_namespace_depth > 0:
+            _parent_namespace_depth += 1
+        with model_creation_lock:
+            return super().model_rebuild(
+                _parent_namespace_depth=_parent_namespace_depth, **kwargs
+            )
+
+    def __class_getitem__(cls, typevar_values: Any) -> Type["BaseModel"]:
+        # Pydantic generic models specializations are cached, but two threads
+        # specializing the same model at the same time could build two
+        # different classes.
+        with model_creation_lock:
+            return super().__class_getitem__(typevar_values)
+
     @classmethod
     def get_field_annotation(cls, field_name: str, annotation_type: Type) -> Any:
         """Return the annotation of type 'annotation_type' of the field
@@ -365,8 +869,78 @@ class BaseModel(BaseModel):
         ):
             attribute_type = get_args(attribute_type)[0]
 
+        # extract 'x' from 'ColumnarList[x]'
+        if get_origin(attribute_type) is ColumnarList:
+            attribute_type = get_args(attribute_type)[0]
+
         return attribute_type
 
+    @classmethod
+    @class_cache
+    def get_forbidden_attributes(cls, context: Context) -> Dict[str, str]:
+        """Return the attributes that cannot be set in payloads validated in
+        a given context, by alias, with their field names.
+
+        Those are the :attr:`~scim2_models.Mutability.write_only` attributes
+        in query and search requests, the
+        :attr:`~scim2_models.Mutability.immutable` attributes in replacement
+        requests, and the :attr:`~scim2_models.Returned.never` attributes in
+        responses.
+        """
+
+        def is_forbidden(field_name: str) -> bool:
+            if context in (Context.RESOURCE_QUERY_REQUEST, Context.SEARCH_REQUEST):
+                mutability = cls.get_field_annotation(field_name, Mutability)
+                return mutability == Mutability.write_only
+
+            if context == Context.RESOURCE_REPLACEMENT_REQUEST:
+                mutability = cls.get_field_annotation(field_name, Mutability)
+                return mutability == Mutability.immutable
+
+            if Context.is_response(context):
+                returnability = cls.get_field_annotation(field_name, Returned)
+                return returnability == Returned.never
+
+            return False
+
+        return {
+            field.alias or field_name: field_name
+            for field_name, field in cls.model_fields.items()
+            if is_forbidden(field_name)
+        }
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_forbidden_attributes(cls, value: Any, info: ValidationInfo) -> Any:
+        """In fail-fast mode, look for forbidden attributes in the payload
+        keys, before the attributes values are validated."""
+
+        if (
+            not info.context
+            or not info.context.get("scim")
+            or not info.context.get("scim_fail_fast")
+            or not isinstance(value, dict)
+        ):
+            return value
+
+        context = info.context["scim"]
+        forbidden = cls.get_forbidden_attributes(context)
+        for alias, field_name in forbidden.items():
+            if alias not in value:
+                continue
+
+            if Context.is_response(context):
+                if value[alias] is None:
+                    continue
+                error = make_returned_error(field_name, Returned.never)
+            else:
+                mutability = cls.get_field_annotation(field_name, Mutability)
+                error = make_mutability_error(field_name, mutability, context)
+
+            raise_scim_error(error, info, (alias,), value[alias])
+
+        return value
+
     @field_validator("*")
     @classmethod
     def check_request_attributes_mutability(
@@ -385,27 +959,19 @@ class BaseModel(BaseModel):
 
         context = info.context.get("scim")
         mutability = cls.get_field_annotation(info.field_name, Mutability)
-        exc = PydanticCustomError(
-            "mutability_error",
-            "Field '{field_name}' has mutability '{field_mutability}' but this in not valid in {context} context",
-            {
-                "field_name": info.field_name,
-                "field_mutability": mutability,
-                "context": context.name.lower().replace("_", " "),
-            },
-        )
+        error = make_mutability_error(info.field_name, mutability, context)
 
         if (
             context in (Context.RESOURCE_QUERY_REQUEST, Context.SEARCH_REQUEST)
             and mutability == Mutability.write_only
         ):
-            raise exc
+            raise_scim_error(error, info, (info.field_name,), value)
 
         if (
             context == Context.RESOURCE_REPLACEMENT_REQUEST
             and mutability == Mutability.immutable
         ):
-            raise exc
+            raise_scim_error(error, info, (info.field_name,), value)
 
         if (
             context
@@ -436,22 +1002,12 @@ class BaseModel(BaseModel):
             alias = field.alias or field_name
 
             if returnability == Returned.always and value.get(alias) is None:
-                raise PydanticCustomError(
-                    "returned_error",
-                    "Field '{field_name}' has returnability 'always' but value is missing or null",
-                    {
-                        "field_name": field_name,
-                    },
-                )
+                error = make_returned_error(field_name, returnability)
+                raise_scim_error(error, info, (alias,), value)
 
             if returnability == Returned.never and value.get(alias) is not None:
-                raise PydanticCustomError(
-                    "returned_error",
-                    "Field '{field_name}' has returnability 'never' but value is set",
-                    {
-                        "field_name": field_name,
-                    },
-                )
+                error = make_returned_error(field_name, returnability)
+                raise_scim_error(error, info, (alias,), value)
 
         return handler(value)
 
@@ -478,16 +1034,87 @@ class BaseModel(BaseModel):
             alias = field.alias or field_name
 
             if necessity == Required.true and value.get(alias) is None:
-                raise PydanticCustomError(
+                error = PydanticCustomError(
                     "required_error",
                     "Field '{field_name}' is required but value is missing or null",
                     {
                         "field_name": field_name,
                     },
                 )
+                raise_scim_error(error, info, (alias,), value)
 
         return handler(value)
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def locate_fail_fast_errors(
+        cls, value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+    ) -> Self:
+        """In fail-fast mode, complete the location of the errors raised by
+        the nested models with their location in the payload."""
+
+        try:
+            return handler(value)
+        except FailFastError as exc:
+            exc.locate(value)
+            raise
+
+    @classmethod
+    @class_cache
+    def get_interned_fields(cls) -> Dict[str, FrozenSet[str]]:
+        """Return the canonical values of the fields whose values are interned
+        during validation, by field name.
+
+        Those are the known 'schemas' URNs and the canonical values of the
+        fields, so validated payloads share the same string objects for
+        them. Other values, such as the ones sent by clients, are not
+        interned as interned strings are never released.
+        """
+
+        from scim2_models.rfc7643.resource import Resource
+
+        interned = {}
+        for field_name, field in cls.model_fields.items():
+            if field_name == "schemas":
+                values = [*(field.default if isinstance(field.default, list) else [])]
+                if issubclass(cls, Resource):
+                    values.extend(cls.get_extension_models())
+            else:
+                values = field.examples or []
+
+            values = frozenset(value for value in values if isinstance(value, str))
+            if values:
+                interned[field_name] = values
+
+        return interned
+
+    @model_validator(mode="after")
+    def intern_canonical_values(self) -> Self:
+        """Intern the canonical values of the fields returned by
+        :meth:`~scim2_models.BaseModel.get_interned_fields`.
+
+        The attributes are only assigned when a value is replaced by its
+        interned copy, so validating an existing instance again, for instance
+        a frozen or shared one, does not modify it.
+        """
+
+        if self.is_frozen():
+            return self
+
+        for field_name, values in self.get_interned_fields().items():
+            value = self.__dict__.get(field_name)
+            if type(value) is str:
+                interned = intern_canonical_value(value, values)
+                if interned is not value:
+                    self.__dict__[field_name] = interned
+
+            elif isinstance(value, list):
+                interned = [intern_canonical_value(item, values) for item in value]
+                if any(item is not other for item, other in zip(interned, value)):
+                    self.__dict__[field_name] = interned
+
+        return self
+
     def mark_with_schema(self):
         """Navigate through attributes and subattributes of type
         ComplexAttribute, and mark them with a '_schema' attribute.
@@ -507,12 +1134,19 @@ class BaseModel(BaseModel):
             separator = ":" if isinstance(self, Resource) else "."
             schema = f"{main_schema}{separator}{field_name}"
 
-            if attr_value := getattr(self, field_name):
-                if isinstance(attr_value, list):
-                    for item in attr_value:
+            attr_value = getattr(self, field_name)
+            if isinstance(attr_value, ColumnarList):
+                attr_value._schema = schema
+
+            elif attr_value:
+                items = attr_value if isinstance(attr_value, list) else [attr_value]
+                for item in items:
+                    # already marked objects are not modified, so validating
+                    # objects shared between threads does not write on them
+                    if getattr(item, "_schema", None) != schema:
                         item._schema = schema
-                else:
-                    attr_value._schema = schema
+                    if item.compact_storage and not item.is_compact():
+                        item.compact()
 
     @field_serializer("*", mode="wrap")
     def scim_serializer(
@@ -538,14 +1172,23 @@ class BaseModel(BaseModel):
         """Serialize the fields according to mutability indications passed in
         the serialization context."""
 
-        mutability = self.get_field_annotation(info.field_name, Mutability)
-        context = info.context.get("scim")
+        if self.is_excluded_from_request(info.field_name, info.context.get("scim")):
+            return None
+
+        return value
+
+    @classmethod
+    def is_excluded_from_request(cls, field_name: str, context: Context) -> bool:
+        """Indicate whether a field should be left out of a payload serialized
+        in a request context, according to its mutability."""
+
+        mutability = cls.get_field_annotation(field_name, Mutability)
 
         if (
             context == Context.RESOURCE_CREATION_REQUEST
             and mutability == Mutability.read_only
         ):
-            return None
+            return True
 
         if (
             context
@@ -555,27 +1198,46 @@ class BaseModel(BaseModel):
             )
             and mutability == Mutability.write_only
         ):
-            return None
+            return True
 
         if context == Context.RESOURCE_REPLACEMENT_REQUEST and mutability in (
             Mutability.immutable,
             Mutability.read_only,
         ):
-            return None
+            return True
 
-        return value
+        return False
 
     def scim_response_serializer(self, value: Any, info: SerializationInfo) -> Any:
         """Serialize the fields according to returability indications passed in
         the serialization context."""
 
-        returnability = self.get_field_annotation(info.field_name, Returned)
-        attribute_urn = self.get_attribute_urn(info.field_name)
-        included_urns = info.context.get("scim_attributes", [])
-        excluded_urns = info.context.get("scim_excluded_attributes", [])
+        if self.is_excluded_from_response(
+            info.field_name,
+            self.get_attribute_urn(info.field_name),
+            info.context.get("scim_attributes", []),
+            info.context.get("scim_excluded_attributes", []),
+        ):
+            return None
+
+        return value
+
+    @classmethod
+    def is_excluded_from_response(
+        cls,
+        field_name: str,
+        attribute_urn: str,
+        included_urns: List[str],
+        excluded_urns: List[str],
+    ) -> bool:
+        """Indicate whether a field should be left out of a payload serialized
+        in a response context, according to its returnability and the
+        requested attributes."""
+
+        returnability = cls.get_field_annotation(field_name, Returned)
 
         if returnability == Returned.never:
-            return None
+            return True
 
         if returnability == Returned.default and (
             (
@@ -586,12 +1248,40 @@ class BaseModel(BaseModel):
             )
             or attribute_urn in excluded_urns
         ):
-            return None
+            return True
 
         if returnability == Returned.request and attribute_urn not in included_urns:
-            return None
+            return True
 
-        return value
+        return False
+
+    @classmethod
+    @class_cache
+    def get_request_exclude(cls, context: Context) -> Optional[Dict[str, Any]]:
+        """Return the fields left out of payloads serialized in a request
+        context, as a pydantic ``exclude`` structure.
+
+        The structure covers the sub-attributes and the extensions, and only
+        applies to instances whose sub-attributes are instances of their
+        declared models.
+        :data:`None` is returned for recursive models and for models holding
+        several kinds of sub-attributes, such as
+        :class:`~scim2_models.ListResponse`, that cannot be described by such
+        a structure.
+        """
+
+        return make_request_exclude(cls, context, ())
+
+    @classmethod
+    @class_cache
+    def get_plain_serializer(cls) -> SchemaSerializer:
+        """Return a serializer of the model without the
+        :meth:`~scim2_models.BaseModel.scim_serializer` and
+        :meth:`~scim2_models.BaseModel.model_serializer_exclude_none`
+        serializers, for contexts where they would have no effect."""
+
+        cls.model_rebuild()
+        return SchemaSerializer(without_scim_serializers(cls.__pydantic_core_schema__))
 
     @model_serializer(mode="wrap")
     def model_serializer_exclude_none(
@@ -605,13 +1295,33 @@ class BaseModel(BaseModel):
 
     @classmethod
     def model_validate(
-        cls, *args, scim_ctx: Optional[Context] = Context.DEFAULT, **kwargs
+        cls,
+        *args,
+        scim_ctx: Optional[Context] = Context.DEFAULT,
+        fail_fast: bool = False,
+        **kwargs,
     ) -> "BaseModel":
         """Validate SCIM payloads and generate model representation by using
-        Pydantic :code:`BaseModel.model_validate`."""
+        Pydantic :code:`BaseModel.model_validate`.
+
+        :param scim_ctx: The SCIM :class:`~scim2_models.Context` in which the
+            validation happens.
+        :param fail_fast: If :data:`True`, the validation stops at the first
+            SCIM error, and the raised :class:`~pydantic.ValidationError`
+            only contains this error. Forbidden attributes, as
+            returned by :meth:`get_forbidden_attributes`, are detected before
+            any attribute value is validated.
+        """
 
-        kwargs.setdefault("context", {}).setdefault("scim", scim_ctx)
-        return super().model_validate(*args, **kwargs)
+        kwargs["context"] = {
+            "scim": scim_ctx,
+            "scim_fail_fast": fail_fast,
+            **(kwargs.get("context") or {}),
+        }
+        try:
+            return super().model_validate(*args, **kwargs)
+        except FailFastError as exc:
+            raise exc.to_validation_error(cls.__name__) from None
 
     def model_dump(
         self,
@@ -627,24 +1337,147 @@ class BaseModel(BaseModel):
         :param scim_ctx: If a SCIM context is passed, some default values of
             Pydantic :code:`BaseModel.model_dump` are tuned to generate valid SCIM
             messages. Pass :data:`None` to get the default Pydantic behavior.
+
+        The results are memoized according to :attr:`dump_cache_size`.
+        Memoized results are shared and must not be modified.
+
+        Outside of request and response contexts, the SCIM serializers have
+        no effect and the models are serialized by pydantic-core alone, see
+        :meth:`get_plain_serializer`.
+        """
+
+        if scim_ctx:
+            kwargs.setdefault("mode", "json")
+
+        return self.scim_dump(
+            super().model_dump, args, scim_ctx, attributes, excluded_attributes, kwargs
+        )
+
+    def model_dump_json(
+        self,
+        *args,
+        scim_ctx: Optional[Context] = Context.DEFAULT,
+        attributes: Optional[List[str]] = None,
+        excluded_attributes: Optional[List[str]] = None,
+        **kwargs,
+    ) -> str:
+        """Create a JSON representation that can be included in SCIM messages
+        by using Pydantic :code:`BaseModel.model_dump_json`.
+
+        The parameters are the same as :meth:`~scim2_models.BaseModel.model_dump`.
+        The results are memoized according to :attr:`dump_cache_size`.
         """
 
-        kwargs.setdefault("context", {}).setdefault("scim", scim_ctx)
-        kwargs["context"]["scim_attributes"] = [
+        return self.scim_dump(
+            super().model_dump_json,
+            args,
+            scim_ctx,
+            attributes,
+            excluded_attributes,
+            kwargs,
+        )
+
+    def scim_dump(
+        self,
+        dump: Callable,
+        args: Tuple,
+        scim_ctx: Optional[Context],
+        attributes: Optional[List[str]],
+        excluded_attributes: Optional[List[str]],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Call a pydantic dump method with the SCIM context, and memoize the
+        result."""
+
+        attributes = [
             validate_attribute_urn(attribute, self.__class__)
             for attribute in (attributes or [])
         ]
-        kwargs["context"]["scim_excluded_attributes"] = [
+        excluded_attributes = [
             validate_attribute_urn(attribute, self.__class__)
             for attribute in (excluded_attributes or [])
         ]
 
+        cache_size = self.dump_cache_size
+        if self.is_frozen() and dump.__name__ == "model_dump_json":
+            # JSON strings are immutable, and can be shared between threads
+            cache_size = max(cache_size, MAX_CACHED_DUMPS)
+        cache_key = None
+        if cache_size and not args:
+            try:
+                cache_key = (
+                    dump.__name__,
+                    scim_ctx,
+                    frozenset(attributes),
+                    frozenset(excluded_attributes),
+                    frozenset(kwargs.items()),
+                )
+            except TypeError:
+                # unhashable parameters such as 'include' sets are not memoized
+                pass
+
+        cache = self._cache
+        if cache_key is not None and cache:
+            try:
+                # the most recently used results are moved at the end
+                result = cache[cache_key] = cache.pop(cache_key)
+                return result
+            except KeyError:
+                pass
+
+        kwargs["context"] = {
+            "scim": scim_ctx,
+            **(kwargs.get("context") or {}),
+            "scim_attributes": attributes,
+            "scim_excluded_attributes": excluded_attributes,
+        }
+
         if scim_ctx:
             kwargs.setdefault("exclude_none", True)
             kwargs.setdefault("by_alias", True)
-            kwargs.setdefault("mode", "json")
 
-        return super().model_dump(*args, **kwargs)
+        context = kwargs["context"].get("scim")
+        request_exclude = None
+        if (
+            Context.is_request(context)
+            and "exclude" not in kwargs
+            and has_declared_types(self)
+        ):
+            request_exclude = self.get_request_exclude(context)
+
+        if (
+            args
+            or (Context.is_request(context) and request_exclude is None)
+            or Context.is_response(context)
+            or not kwargs.keys() <= PLAIN_SERIALIZER_PARAMETERS
+        ):
+            result = dump(*args, **kwargs)
+
+        else:
+            # the SCIM serializers have no effect in this context, or their
+            # effect is described by the precomputed request exclusions, so
+            # the model can be serialized by pydantic-core alone
+            if request_exclude:
+                kwargs["exclude"] = request_exclude
+            serializer = self.get_plain_serializer()
+            kwargs["exclude_none"] = True
+            kwargs.setdefault("by_alias", False)
+            if dump.__name__ == "model_dump_json":
+                result = serializer.to_json(self, **kwargs).decode()
+            else:
+                result = serializer.to_python(self, **kwargs)
+
+        if cache_key is not None:
+            if cache is None:
+                cache = self._cache = {}
+            cache[cache_key] = result
+            while len(cache) > cache_size:
+                try:
+                    del cache[next(iter(cache))]
+                except (KeyError, RuntimeError, StopIteration):
+                    break
+
+        return result
 
     def get_attribute_urn(self, field_name: str) -> Returned:
         """Build the full URN of the attribute.
@@ -656,12 +1489,110 @@ class BaseModel(BaseModel):
         return f"{main_schema}:{alias}"
 
 
+class SharedFieldsSet(set):
+    """Fields set shared between several compacted
+    :class:`~scim2_models.ComplexAttribute` instances.
+
+    It must never be modified in place, instances get their own copy
+    before any assignment.
+    """
+
+
+class SharedPrivateAttributes(dict):
+    """Private attributes shared between several compacted
+    :class:`~scim2_models.ComplexAttribute` instances.
+
+    It must never be modified in place, instances get their own copy
+    before any assignment.
+    """
+
+
+_shared_fields_sets: Dict[frozenset, SharedFieldsSet] = {}
+_shared_privates: Dict[tuple, SharedPrivateAttributes] = {}
+
+
 class ComplexAttribute(BaseModel):
     """A complex attribute as defined in :rfc:`RFC7643 §2.3.8
     <7643#section-2.3.8>`."""
 
     _schema: str
 
+    compact_storage: ClassVar[bool] = False
+    """Whether instances should be compacted once validated.
+
+    Compacted instances share their bookkeeping structures (fields set
+    and private attributes) with the other instances holding the same
+    data layout, which noticeably reduces the memory footprint of large
+    multi-valued attributes such as :attr:`Group.members <scim2_models.Group.members>`.
+    Attribute access, assignment and serialization are unchanged.
+
+    .. code-block:: python
+
+        GroupMember.compact_storage = True
+    """
+
+    def compact(self) -> None:
+        """Replace the instance bookkeeping structures by shared ones.
+
+        The shared structures are copied back on the next assignment.
+        """
+
+        key = frozenset(self.__pydantic_fields_set__)
+        fields_set = _shared_fields_sets.get(key)
+        if fields_set is None:
+            fields_set = _shared_fields_sets.setdefault(key, SharedFieldsSet(key))
+        object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+
+        if self.__pydantic_private__ is not None:
+            values = self.__pydantic_private__
+            # memoized dumps are specific to the instance
+            if values.get("_cache") is not None:
+                values = {**values, "_cache": None}
+
+            key = tuple(values.items())
+            try:
+                private = _shared_privates.get(key)
+            except TypeError:
+                # unhashable private attributes cannot be shared
+                return
+
+            if private is None:
+                private = _shared_privates.setdefault(
+                    key, SharedPrivateAttributes(values)
+                )
+            object.__setattr__(self, "__pydantic_private__", private)
+
+    def is_compact(self) -> bool:
+        return isinstance(self.__pydantic_fields_set__, SharedFieldsSet)
+
+    def expand(self) -> None:
+        """Give back the instance its own bookkeeping structures, if it has
+        been compacted."""
+
+        if isinstance(self.__pydantic_fields_set__, SharedFieldsSet):
+            object.__setattr__(
+                self, "__pydantic_fields_set__", set(self.__pydantic_fields_set__)
+            )
+
+        if isinstance(self.__pydantic_private__, SharedPrivateAttributes):
+            object.__setattr__(
+                self, "__pydantic_private__", dict(self.__pydantic_private__)
+            )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.expand()
+        super().__setattr__(name, value)
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        copied.expand()
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        copied = super().__deepcopy__(memo)
+        copied.expand()
+        return copied
+
     def get_attribute_urn(self, field_name: str) -> Returned:
         """Build the full URN of the attribute.
 
@@ -690,6 +1621,219 @@ class MultiValuedComplexAttribute(ComplexAttribute):
     reference."""
 
 
+AnyComplexAttribute = TypeVar("AnyComplexAttribute", bound=ComplexAttribute)
+
+
+class ColumnarList(Generic[AnyComplexAttribute]):
+    """A list of complex attributes stored by columns.
+
+    Instead of keeping one model instance per item, each sub-attribute
+    is stored in its own list of values, and the values of the fields with
+    canonical values are interned. Items are materialized
+    as model instances on access, and the serialization is performed
+    straight from the columns. This is intended for very large multi-valued
+    attributes:
+
+    .. code-block:: python
+
+        class BigGroup(Group):
+            members: Optional[ColumnarList[GroupMember]] = None
+
+    Materialized items are copies: modifying them does not modify the
+    list, use item assignment instead.
+    """
+
+    def __init__(
+        self,
+        item_type: Type[AnyComplexAttribute],
+        items: Optional[List[AnyComplexAttribute]] = None,
+    ):
+        self.item_type = item_type
+        self._schema: Optional[str] = None
+        self._columns: Dict[str, List[Any]] = {
+            field_name: [] for field_name in item_type.model_fields
+        }
+        self._length = 0
+        self._index: Optional[Dict[Any, int]] = None
+        self._frozen = False
+        # unique values such as identifiers would not be shared
+        self._interned = item_type.get_interned_fields()
+        self.extend(items or [])
+
+    def _check_frozen(self) -> None:
+        if self._frozen:
+            raise TypeError(f"'{self.__class__.__name__}' object is immutable")
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source: type[Any],
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        item_type = get_args(source)[0]
+
+        def validate(
+            value: Any, handler: ValidatorFunctionWrapHandler
+        ) -> "ColumnarList":
+            if isinstance(value, cls):
+                return value
+            return cls(item_type, handler(value))
+
+        return core_schema.no_info_wrap_validator_function(
+            validate,
+            handler.generate_schema(List[item_type]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.serialize, info_arg=True
+            ),
+        )
+
+    def _store(self, index: int, item: AnyComplexAttribute) -> None:
+        for field_name, column in self._columns.items():
+            value = getattr(item, field_name)
+            if isinstance(value, UserString):
+                value = str(value)
+            if field_name in self._interned:
+                value = intern_canonical_value(value, self._interned[field_name])
+            column[index] = value
+
+    def append(self, item: AnyComplexAttribute) -> None:
+        self._check_frozen()
+        for column in self._columns.values():
+            column.append(None)
+        self._length += 1
+        self._store(self._length - 1, item)
+        self._index = None
+
+    def extend(self, items: List[AnyComplexAttribute]) -> None:
+        for item in items:
+            self.append(item)
+
+    def _materialize(self, index: int) -> AnyComplexAttribute:
+        values = {
+            field_name: column[index]
+            for field_name, column in self._columns.items()
+            if column[index] is not None
+        }
+
+        item = self.item_type.model_construct(**values)
+        if self._schema:
+            item._schema = self._schema
+        return item
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._materialize(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(self._length)[index]]
+
+        return self._materialize(range(self._length)[index])
+
+    def __setitem__(self, index: int, item: AnyComplexAttribute) -> None:
+        self._check_frozen()
+        self._store(range(self._length)[index], item)
+        self._index = None
+
+    def __copy__(self) -> "ColumnarList":
+        """Copy the columns, but not the values they hold.
+
+        Copies of frozen lists are not frozen.
+        """
+
+        copied = self.__class__.__new__(self.__class__)
+        copied.item_type = self.item_type
+        copied._schema = self._schema
+        copied._columns = {
+            field_name: list(column) for field_name, column in self._columns.items()
+        }
+        copied._length = self._length
+        copied._index = self._index
+        copied._frozen = False
+        copied._interned = self._interned
+        return copied
+
+    def get_column(self, field_name: str) -> List[Any]:
+        """Return the values of a sub-attribute for every item, without
+        materializing the items.
+
+        The returned list must not be modified.
+        """
+
+        return self._columns[field_name]
+
+    def __contains__(self, item: Any) -> bool:
+        """Check whether an item is present in the list.
+
+        Plain values are looked up in the ``value`` column with a hash
+        table, built on the first lookup.
+        """
+
+        if isinstance(item, BaseModel):
+            return any(item.__dict__ == other.__dict__ for other in self)
+
+        return self.index_of(item) is not None
+
+    def index_of(self, value: Any) -> Optional[int]:
+        """Return the index of the first item whose ``value`` sub-attribute
+        equals `value`, or :data:`None`."""
+
+        items_index = self._index
+        if items_index is None:
+            items_index = {}
+            for index, item_value in enumerate(self._columns.get("value", [])):
+                items_index.setdefault(item_value, index)
+            self._index = items_index
+
+        return items_index.get(value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ColumnarList, list)):
+            return len(self) == len(other) and all(
+                item.__dict__ == other_item.__dict__
+                for item, other_item in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.item_type.__name__}, {list(self)!r})"
+
+    def serialize(self, info: SerializationInfo) -> List[Dict[str, Any]]:
+        """Serialize the items without materializing them, according to the
+        SCIM context."""
+
+        context = (info.context or {}).get("scim")
+        columns = []
+        for field_name, column in self._columns.items():
+            if Context.is_request(context) and self.item_type.is_excluded_from_request(
+                field_name, context
+            ):
+                continue
+
+            alias = self.item_type.model_fields[field_name].alias or field_name
+            if Context.is_response(
+                context
+            ) and self.item_type.is_excluded_from_response(
+                field_name,
+                f"{self._schema}.{alias}",
+                info.context.get("scim_attributes", []),
+                info.context.get("scim_excluded_attributes", []),
+            ):
+                continue
+
+            key = alias if info.by_alias else field_name
+            columns.append((key, column))
+
+        result = [
+            {key: column[index] for key, column in columns if column[index] is not None}
+            for index in range(self._length)
+        ]
+        return to_jsonable_python(result) if info.mode == "json" else result
+
+
 def is_complex_attribute(type):
     # issubclass raise a TypeError with 'Reference' on python < 3.11
     return (
@@ -0,0 +1,70 @@
+import base64
+import hashlib
+import hmac
+import json
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+
+def b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class CursorEncoder:
+    """Build opaque and signed pagination cursors, as used by
+    :attr:`SearchRequest.cursor <scim2_models.SearchRequest.cursor>`,
+    :attr:`ListResponse.next_cursor <scim2_models.ListResponse.next_cursor>` and
+    :attr:`ListResponse.previous_cursor <scim2_models.ListResponse.previous_cursor>`.
+
+    Cursors hold JSON data, typically the sort keys of the last resource of a
+    page, so servers can seek the next page directly. They are signed so
+    clients cannot forge them.
+
+    :param secret: The secret key used to sign the cursors.
+    :param digestmod: The name of the :mod:`hashlib` algorithm used to sign
+        the cursors.
+
+    .. code-block:: python
+
+        >>> encoder = CursorEncoder(b"secret")
+        >>> cursor = encoder.encode({"after": ["bjensen", "2819c223"]})
+        >>> encoder.decode(cursor)
+        {'after': ['bjensen', '2819c223']}
+    """
+
+    def __init__(self, secret: bytes, digestmod: str = "sha256"):
+        self.secret = secret
+        self.digestmod = digestmod
+
+    def sign(self, payload: bytes) -> bytes:
+        return hmac.new(self.secret, payload, getattr(hashlib, self.digestmod)).digest()
+
+    def encode(self, data: Any) -> str:
+        """Build a cursor holding 'data'."""
+
+        payload = json.dumps(
+            to_jsonable_python(data), separators=(",", ":"), sort_keys=True
+        ).encode()
+        return f"{b64encode(payload)}.{b64encode(self.sign(payload))}"
+
+    def decode(self, cursor: str) -> Any:
+        """Return the data held by a cursor.
+
+        :raises ValueError: If the cursor is malformed or its signature is
+            invalid.
+        """
+
+        try:
+            payload, signature = (b64decode(part) for part in cursor.split("."))
+        except (ValueError, TypeError) as exc:
+            raise ValueError("Malformed cursor") from exc
+
+        if not hmac.compare_digest(signature, self.sign(payload)):
+            raise ValueError("Invalid cursor signature")
+
+        return json.loads(payload)
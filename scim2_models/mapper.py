@@ -0,0 +1,272 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Type
+from typing import Union
+from typing import get_args
+from typing import get_origin
+
+from .base import BaseModel
+from .base import ColumnarList
+from .rfc7643.resource import AnyResource
+from .rfc7643.resource import Resource
+from .rfc7643.resource import get_field_name
+from .rfc7643.resource import get_value_converter
+from .rfc7643.resource import is_multiple
+from .rfc7643.resource import make_instance
+
+
+def is_columnar(model: Type[BaseModel], field_name: str) -> bool:
+    annotation = model.model_fields[field_name].annotation
+    if get_origin(annotation) is Union:
+        annotation = get_args(annotation)[0]
+    return get_origin(annotation) is ColumnarList
+
+
+class ModelPlan:
+    """The columns used to build a model, and its sub-attributes."""
+
+    def __init__(self, model: Type[BaseModel], schema: Optional[str] = None):
+        self.model = model
+        self.schema = schema
+        self.columnar: Set[str] = set()
+        self.columns: List[Tuple[str, int, Optional[Callable]]] = []
+        self.complex: Dict[str, ModelPlan] = {}
+        self.multiple: Dict[str, Union[ModelPlan, Tuple[int, Optional[Callable]]]] = {}
+        self.extensions: Dict[str, ModelPlan] = {}
+
+    def add(self, names: List[str], column: int) -> None:
+        name, *names = names
+        field_name = get_field_name(self.model, name)
+        field = self.model.model_fields[field_name]
+        attribute_type = self.model.get_field_root_type(field_name)
+        is_model = isinstance(attribute_type, type) and issubclass(
+            attribute_type, BaseModel
+        )
+
+        if names and not is_model:
+            raise ValueError(f"Attribute '{name}' is not a complex attribute")
+
+        converter = None if is_model else get_value_converter(attribute_type)
+
+        if not is_multiple(field):
+            if not names:
+                self.columns.append((field_name, column, converter))
+            else:
+                if field_name not in self.complex:
+                    self.complex[field_name] = self.make_plan(field_name)
+                self.complex[field_name].add(names, column)
+
+        elif not is_model:
+            self.multiple[field_name] = (column, converter)
+
+        else:
+            if field_name not in self.multiple:
+                self.multiple[field_name] = self.make_plan(field_name)
+                if is_columnar(self.model, field_name):
+                    self.columnar.add(field_name)
+            # a multi-valued complex attribute mapped on a single column is
+            # mapped on its 'value' sub-attribute
+            self.multiple[field_name].add(names or ["value"], column)
+
+    def make_plan(self, field_name: str) -> "ModelPlan":
+        """Make the plan of a complex attribute.
+
+        Complex attributes of resources are marked with their schema,
+        as :meth:`~scim2_models.BaseModel.mark_with_schema` does.
+        """
+
+        schema = None
+        if issubclass(self.model, Resource):
+            main_schema = self.model.model_fields["schemas"].default[0]
+            schema = f"{main_schema}:{field_name}"
+        return ModelPlan(self.model.get_field_root_type(field_name), schema)
+
+    def get_columns(self) -> List[int]:
+        return [column for _, column, _ in self.columns] + [
+            column for plan in self.complex.values() for column in plan.get_columns()
+        ]
+
+    def build(self, rows: Sequence[Sequence[Any]]) -> Optional[BaseModel]:
+        """Construct a model from the first row, and the multi-valued
+        attributes from all the rows.
+
+        Return :data:`None` if no column holds a value.
+        """
+
+        row = rows[0]
+        values = {}
+        for field_name, column, converter in self.columns:
+            value = row[column]
+            if value is not None:
+                values[field_name] = converter(value) if converter else value
+
+        for field_name, plan in self.complex.items():
+            value = plan.build(rows)
+            if value is not None:
+                values[field_name] = value
+
+        for field_name, plan in self.multiple.items():
+            items = self.build_items(plan, rows)
+            if not items:
+                continue
+
+            if field_name in self.columnar:
+                items = ColumnarList(plan.model, items)
+                items._schema = plan.schema
+            values[field_name] = items
+
+        extensions = {}
+        for schema, plan in self.extensions.items():
+            value = plan.build(rows)
+            if value is not None:
+                extensions[schema] = value
+
+        if not values and not extensions:
+            return None
+
+        return make_instance(self.model, values, extensions, self.schema)
+
+    @staticmethod
+    def build_items(
+        plan: Union["ModelPlan", Tuple[int, Optional[Callable]]],
+        rows: Sequence[Sequence[Any]],
+    ) -> List[Any]:
+        """Build the distinct items of a multi-valued attribute, in the rows
+        order."""
+
+        if isinstance(plan, tuple):
+            column, converter = plan
+            return [
+                converter(value) if converter else value
+                for value in dict.fromkeys(row[column] for row in rows)
+                if value is not None
+            ]
+
+        columns = plan.get_columns()
+        items = []
+        seen = set()
+        for row in rows:
+            key = tuple(row[column] for column in columns)
+            if key in seen or all(value is None for value in key):
+                continue
+
+            seen.add(key)
+            items.append(plan.build([row]))
+        return items
+
+
+class RowMapper:
+    """Build resources from database rows, such as tuples returned by SQL
+    queries.
+
+    The resources are built without intermediate payloads nor validation,
+    as :meth:`Resource.from_trusted <scim2_models.Resource.from_trusted>`
+    does: the rows must hold trusted and valid data.
+
+    :param model: The resource model to build.
+    :param columns: The attribute path matching each column of the rows, or
+        :data:`None` for columns to ignore. Paths are made of attribute names
+        separated by dots, extension attributes are prefixed by their schema.
+    :param key: The index of the column identifying the resources. Defaults
+        to the ``id`` column if any.
+
+    Several rows can describe the same resource, for instance when a query
+    joins a table holding a multi-valued attribute. Consecutive rows with the
+    same key are merged by :meth:`map_rows`: the multi-valued attributes take
+    the distinct values of every row, and the other attributes take the values
+    of the first row.
+
+    .. code-block:: python
+
+        >>> mapper = RowMapper(User, ["id", "userName", "emails.value", "emails.type"])
+        >>> rows = [
+        ...     ("2819c223", "bjensen", "bjensen@example.com", "work"),
+        ...     ("2819c223", "bjensen", "babs@jensen.org", "home"),
+        ...     ("902c246b", "jsmith", None, None),
+        ... ]
+        >>> bjensen, jsmith = mapper.map_rows(rows)
+        >>> [email.value for email in bjensen.emails]
+        ['bjensen@example.com', 'babs@jensen.org']
+        >>> jsmith.emails is None
+        True
+    """
+
+    def __init__(
+        self,
+        model: Type[AnyResource],
+        columns: Sequence[Optional[str]],
+        key: Optional[int] = None,
+    ):
+        self.model = model
+        self.plan = ModelPlan(model)
+
+        main_schema = model.model_fields["schemas"].default[0]
+        extension_models = model.get_extension_models()
+        for column, path in enumerate(columns):
+            if path is None:
+                continue
+
+            plan = self.plan
+            for schema, extension_model in extension_models.items():
+                if path.startswith(f"{schema}:"):
+                    plan = self.plan.extensions.setdefault(
+                        schema, ModelPlan(extension_model)
+                    )
+                    path = path[len(schema) + 1 :]
+                    break
+            else:
+                if path.startswith(f"{main_schema}:"):
+                    path = path[len(main_schema) + 1 :]
+
+            plan.add(path.split("."), column)
+
+        if key is None:
+            key = next(
+                (
+                    column
+                    for field_name, column, _ in self.plan.columns
+                    if field_name == "id"
+                ),
+                None,
+            )
+        self.key = key
+
+    def build(self, rows: Sequence[Sequence[Any]]) -> AnyResource:
+        resource = self.plan.build(rows)
+        return make_instance(self.model, {}) if resource is None else resource
+
+    def map_row(self, row: Sequence[Any]) -> AnyResource:
+        """Build a resource from a single row."""
+
+        return self.build([row])
+
+    def map_rows(self, rows: Iterable[Sequence[Any]]) -> Iterator[AnyResource]:
+        """Build resources from rows, merging the consecutive rows having the
+        same key.
+
+        Rows are consumed lazily. Without key column, every row builds a
+        resource.
+        """
+
+        if self.key is None:
+            for row in rows:
+                yield self.map_row(row)
+            return
+
+        group: List[Sequence[Any]] = []
+        for row in rows:
+            if group and row[self.key] != group[0][self.key]:
+                yield self.build(group)
+                group = []
+            group.append(row)
+
+        if group:
+            yield self.build(group)
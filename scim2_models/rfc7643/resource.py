@@ -1,11 +1,24 @@
+import copy as copy_module
+import hashlib
+import json
+import re
+from collections import UserString
 from datetime import datetime
+from datetime import timezone
+from enum import Enum
+from functools import partial
+from inspect import isclass
 from typing import Annotated
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import ForwardRef
 from typing import Generic
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -14,16 +27,22 @@ from typing import get_origin
 
 from pydantic import ConfigDict
 from pydantic import Discriminator
+from pydantic import PrivateAttr
 from pydantic import Tag
+from pydantic import TypeAdapter
 from pydantic import ValidationInfo
 from pydantic import ValidatorFunctionWrapHandler
 from pydantic import field_serializer
+from pydantic import field_validator
 from pydantic import model_validator
+from pydantic_core import PydanticUndefined
+from pydantic_core import to_jsonable_python
 from typing_extensions import Self
 
 from ..base import AnyModel
 from ..base import BaseModel
 from ..base import CaseExact
+from ..base import ColumnarList
 from ..base import ComplexAttribute
 from ..base import ExternalReference
 from ..base import Mutability
@@ -31,7 +50,13 @@ from ..base import Required
 from ..base import Returned
 from ..base import Uniqueness
 from ..base import URIReference
+from ..base import intern_canonical_value
 from ..base import is_complex_attribute
+from ..utils import class_cache
+
+RESOURCE_TYPE_NAMES: Set[str] = set()
+"""The names of the resource models, that are the usual
+:attr:`Meta.resource_type` values."""
 
 
 class Meta(ComplexAttribute):
@@ -88,6 +113,14 @@ class Meta(ComplexAttribute):
     sensitive).
     """
 
+    @field_validator("resource_type")
+    @classmethod
+    def intern_resource_type(cls, value: Optional[str]) -> Optional[str]:
+        """Resource type names are shared by many resources, and the names
+        of the resource models are interned."""
+
+        return intern_canonical_value(value, RESOURCE_TYPE_NAMES)
+
 
 class Resource(BaseModel, Generic[AnyModel]):
     model_config = ConfigDict(extra="allow")
@@ -120,6 +153,148 @@ class Resource(BaseModel, Generic[AnyModel]):
     meta: Annotated[Optional[Meta], Mutability.read_only, Returned.default] = None
     """A complex attribute containing resource metadata."""
 
+    _etag: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        if not cls.__pydantic_generic_metadata__["origin"]:
+            RESOURCE_TYPE_NAMES.add(cls.__name__)
+
+    def __hash__(self) -> int:
+        if not self.is_frozen():
+            raise TypeError(f"unhashable type: '{self.__class__.__name__}'")
+        return hash(self.compute_etag())
+
+    def __copy__(self) -> Self:
+        copy = super().__copy__()
+        copy._etag = None
+        return copy
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Self:
+        copy = super().__deepcopy__(memo)
+        copy._etag = None
+        return copy
+
+    def compute_etag(self) -> str:
+        """Compute a strong entity tag of the resource, suitable for
+        :attr:`Meta.version <scim2_models.Meta.version>` and HTTP conditional
+        requests, as described in :rfc:`RFC7644 §3.14 <7644#section-3.14>`.
+
+        The tag is a hash of a canonical serialization of the resource, with
+        sorted keys, datetimes converted to UTC, and without the 'meta'
+        attribute and the :attr:`~scim2_models.Returned.never` attributes.
+
+        The tag is computed on each call, as modifications of sub-attributes
+        or of multi-valued attributes items cannot be detected. It is
+        only cached by :meth:`~scim2_models.BaseModel.frozen` resources.
+
+        .. code-block:: python
+
+            >>> user = User(user_name="bjensen")
+            >>> user.compute_etag()
+            '"..."'
+            >>> user.compute_etag() == User(user_name="bjensen").compute_etag()
+            True
+        """
+
+        if self._etag is not None:
+            return self._etag
+
+        payload = json.dumps(
+            get_canonical_value(self), sort_keys=True, separators=(",", ":")
+        ).encode()
+        etag = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+        if self.is_frozen():
+            self._etag = etag
+        return etag
+
+    def clone(self, updates: Optional[Dict[str, Any]] = None) -> Self:
+        """Return a copy of the resource, with some attributes replaced.
+
+        The copy shares its attribute values with the original resource.
+        Only the objects along the path of each updated attribute are copied,
+        so cloning a group with a large ``members`` attribute and updating
+        its ``displayName`` does not copy the members.
+
+        :param updates: A dict associating attribute paths with their new
+            values. Paths are made of attribute names, separated by dots, and
+            can filter multi-valued attributes items with ``[key eq value]``,
+            as in :rfc:`RFC7644 §3.5.2 <7644#section-3.5.2>`. Extension
+            attributes are prefixed by their schema. :data:`None` values
+            remove the attributes. Values are not validated.
+        :raises ValueError: If a path does not match an attribute.
+
+        .. code-block:: python
+
+            >>> group = Group(display_name="Tour Guides", members=[
+            ...     GroupMember(value="2819c223", display="Babs"),
+            ...     GroupMember(value="902c246b", display="Jim"),
+            ... ])
+            >>> clone = group.clone({'members[value eq "902c246b"].display': "James"})
+            >>> [member.display for member in clone.members]
+            ['Babs', 'James']
+            >>> clone.members[0] is group.members[0]
+            True
+
+        Values shared with the original resource must not be modified in
+        place, as the modifications would affect both resources. Clones of
+        :meth:`~scim2_models.BaseModel.frozen` resources are not frozen, but
+        share the frozen values of the original resource.
+        """
+
+        main_schema = self.model_fields["schemas"].default[0]
+        extension_models = self.get_extension_models()
+        copy = thaw(self.model_copy())
+
+        for path, value in (updates or {}).items():
+            for schema in extension_models:
+                if path == schema:
+                    setattr(copy, schema, value)
+                    break
+
+                if path.startswith(f"{schema}:"):
+                    extension = getattr(copy, schema, None)
+                    if extension is None:
+                        extension = extension_models[schema]()
+                    path = path[len(schema) + 1 :]
+                    setattr(copy, schema, clone_along_path(extension, path, value))
+                    break
+
+            else:
+                if path.startswith(f"{main_schema}:"):
+                    path = path[len(main_schema) + 1 :]
+                copy = clone_along_path(copy, path, value)
+
+        return copy
+
+    @classmethod
+    def from_trusted(cls, payload: Dict[str, Any]) -> Self:
+        """Build a resource from a trusted payload, such as a payload read
+        from the service provider storage, without validating it.
+
+        The resource, its complex attributes and its extensions are built
+        with :meth:`~pydantic.BaseModel.model_construct`, which is an order of
+        magnitude faster than :meth:`~scim2_models.BaseModel.model_validate`.
+        Only enumerations, dates and binary values are converted, the other
+        values are used as is: the payload must be valid.
+
+        .. code-block:: python
+
+            >>> user = User.from_trusted({
+            ...     "id": "2819c223",
+            ...     "userName": "bjensen",
+            ...     "emails": [{"value": "bjensen@example.com", "type": "work"}],
+            ...     "meta": {"created": "2010-01-23T04:56:22Z"},
+            ... })
+            >>> user.emails[0].type
+            <Type.work: 'work'>
+            >>> user.meta.created.year
+            2010
+        """
+
+        return construct_trusted(cls, payload)
+
     def __getitem__(self, item: Any):
         if not isinstance(item, type) or not issubclass(item, Resource):
             raise KeyError(f"{item} is not a valid extension type")
@@ -232,6 +407,386 @@ class Resource(BaseModel, Generic[AnyModel]):
 AnyResource = TypeVar("AnyResource", bound="Resource")
 
 
+def get_canonical_value(value: Any) -> Any:
+    """Return a JSON-compatible representation of a value, used to compute
+    resource entity tags."""
+
+    if isinstance(value, BaseModel):
+        payload = {
+            field.alias or field_name: getattr(value, field_name)
+            for field_name, field in value.model_fields.items()
+            if field_name != "meta"
+            and value.get_field_annotation(field_name, Returned) != Returned.never
+        }
+        payload.update(value.__pydantic_extra__ or {})
+        return {
+            key: get_canonical_value(item)
+            for key, item in payload.items()
+            if item is not None
+        }
+
+    if isinstance(value, (list, ColumnarList)):
+        return [get_canonical_value(item) for item in value]
+
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, UserString):
+        return str(value)
+
+    return to_jsonable_python(value)
+
+
+PATH_SEGMENT = re.compile(
+    r'(?P<name>[^.\[\]"]+)'
+    r'(?:\[(?P<key>[^\s\]]+) eq (?P<value>"(?:[^"\\]|\\.)*"|[^\]]+)\])?'
+    r"(?:\.|$)"
+)
+
+
+def parse_attribute_path(path: str) -> List[Tuple[str, Optional[str], Any]]:
+    """Split an attribute path in a list of attribute names, with their
+    optional ``[key eq value]`` filter."""
+
+    segments = []
+    position = 0
+    while position < len(path):
+        match = PATH_SEGMENT.match(path, position)
+        if not match:
+            raise ValueError(f"Invalid attribute path '{path}'")
+
+        value = match["value"]
+        if value is not None:
+            try:
+                value = json.loads(value)
+            except ValueError as exc:
+                raise ValueError(f"Invalid attribute path '{path}'") from exc
+
+        segments.append((match["name"], match["key"], value))
+        position = match.end()
+
+    if not segments:
+        raise ValueError(f"Invalid attribute path '{path}'")
+    return segments
+
+
+def get_field_name(model: Type[BaseModel], attribute_name: str) -> str:
+    """Find a field of a model by its name or its case insensitive alias."""
+
+    if attribute_name in model.model_fields:
+        return attribute_name
+
+    for field_name, field in model.model_fields.items():
+        if (field.alias or field_name).lower() == attribute_name.lower():
+            return field_name
+
+    raise ValueError(
+        f"Model '{model.__name__}' has no attribute named '{attribute_name}'"
+    )
+
+
+def get_value_converter(attribute_type: Any) -> Optional[Callable[[Any], Any]]:
+    """Return the function converting trusted values of an attribute type,
+    when their storage representation can differ from their model
+    representation."""
+
+    if not isinstance(attribute_type, type):
+        return None
+
+    if issubclass(attribute_type, Enum):
+        return attribute_type
+
+    if issubclass(attribute_type, (datetime, bytes)):
+        return TypeAdapter(attribute_type).validate_python
+
+    return None
+
+
+class TrustedField(NamedTuple):
+    field_name: str
+    model: Optional[Type[BaseModel]]
+    multiple: bool
+    columnar: bool
+    converter: Optional[Callable[[Any], Any]]
+    schema: Optional[str]
+    extension: bool
+
+
+class TrustedModel(NamedTuple):
+    fields: Dict[str, TrustedField]
+    """The fields, by alias and by name."""
+
+    defaults: Dict[str, Any]
+    """The default values of the fields, in the fields order."""
+
+    default_factories: Dict[str, Callable[[], Any]]
+    """The functions building the default values that cannot be shared."""
+
+    private: Dict[str, Any]
+    """The default values of the private attributes."""
+
+    extra: bool
+    """Whether the model allows extra attributes."""
+
+
+@class_cache
+def get_trusted_model(model: Type[BaseModel]) -> TrustedModel:
+    """Gather the information needed to build a model from trusted
+    payloads."""
+
+    # instances built without validation still need the model serializer
+    model.model_rebuild()
+
+    main_schema = None
+    if issubclass(model, Resource):
+        main_schema = model.model_fields["schemas"].default[0]
+
+    fields = {}
+    defaults = {}
+    default_factories = {}
+    for field_name, field in model.model_fields.items():
+        attribute_type = model.get_field_root_type(field_name)
+        is_model = isinstance(attribute_type, type) and issubclass(
+            attribute_type, BaseModel
+        )
+        annotation = field.annotation
+        if get_origin(annotation) is Union:
+            annotation = get_args(annotation)[0]
+
+        trusted_field = TrustedField(
+            field_name=field_name,
+            model=attribute_type if is_model else None,
+            multiple=is_multiple(field),
+            columnar=get_origin(annotation) is ColumnarList,
+            converter=None if is_model else get_value_converter(attribute_type),
+            schema=f"{main_schema}:{field_name}" if main_schema and is_model else None,
+            extension=False,
+        )
+        fields[field_name] = fields[field.alias or field_name] = trusted_field
+
+        if field.default_factory is not None:
+            defaults[field_name] = None
+            default_factories[field_name] = field.default_factory
+        elif field.default is not PydanticUndefined:
+            defaults[field_name] = field.default
+            if isinstance(field.default, (list, dict, set)):
+                default_factories[field_name] = partial(
+                    copy_module.deepcopy, field.default
+                )
+
+    if main_schema:
+        for schema, extension_model in model.get_extension_models().items():
+            fields[schema] = TrustedField(
+                schema, extension_model, False, False, None, None, True
+            )
+
+    private = {
+        name: private_attribute.get_default()
+        for name, private_attribute in model.__private_attributes__.items()
+        if private_attribute.get_default() is not PydanticUndefined
+    }
+
+    return TrustedModel(
+        fields,
+        defaults,
+        default_factories,
+        private,
+        model.model_config.get("extra") == "allow",
+    )
+
+
+def construct_trusted(
+    model: Type[AnyModel], payload: Dict[str, Any], schema: Optional[str] = None
+) -> AnyModel:
+    """Build a model and its sub-attributes from a trusted payload, without
+    validation."""
+
+    trusted = get_trusted_model(model)
+    values = {}
+    extra = {} if trusted.extra else None
+    for key, value in payload.items():
+        field = trusted.fields.get(key)
+        if field is None:
+            if extra is not None:
+                extra[key] = value
+            continue
+
+        if value is None:
+            pass
+
+        elif field.model is not None:
+            if field.multiple:
+                value = [
+                    construct_trusted(field.model, item, field.schema) for item in value
+                ]
+                if field.columnar:
+                    value = ColumnarList(field.model, value)
+                    value._schema = field.schema
+            else:
+                value = construct_trusted(field.model, value, field.schema)
+
+        elif field.converter is not None:
+            if field.multiple:
+                value = [field.converter(item) for item in value]
+            else:
+                value = field.converter(value)
+
+        if field.extension:
+            extra[key] = value
+        else:
+            values[field.field_name] = value
+
+    return make_instance(model, values, extra, schema)
+
+
+def make_instance(
+    model: Type[AnyModel],
+    values: Dict[str, Any],
+    extra: Optional[Dict[str, Any]] = None,
+    schema: Optional[str] = None,
+) -> AnyModel:
+    """Build a model from field values, without validation.
+
+    This does what :meth:`~pydantic.BaseModel.model_construct` does, with
+    the field information computed once per model.
+
+    :param values: The values of the fields, by field name.
+    :param extra: The extra attributes, such as extensions.
+    :param schema: The schema of a complex attribute, as set by
+        :meth:`~scim2_models.BaseModel.mark_with_schema`.
+    """
+
+    trusted = get_trusted_model(model)
+    data = dict(trusted.defaults)
+    for field_name, factory in trusted.default_factories.items():
+        if field_name not in values:
+            data[field_name] = factory()
+    data.update(values)
+
+    private = dict(trusted.private)
+    if schema:
+        private["_schema"] = schema
+
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", data)
+    extra = (extra or {}) if trusted.extra else None
+    object.__setattr__(obj, "__pydantic_fields_set__", set(values).union(extra or ()))
+    object.__setattr__(obj, "__pydantic_extra__", extra)
+    object.__setattr__(obj, "__pydantic_private__", private)
+
+    if schema and obj.compact_storage:
+        obj.compact()
+    return obj
+
+
+def thaw(copy: AnyModel) -> AnyModel:
+    """Make a shallow copy of a frozen model modifiable.
+
+    The values it holds stay frozen.
+    """
+
+    copy._frozen = False
+    copy._cache = None
+    if isinstance(copy, Resource):
+        copy._etag = None
+    return copy
+
+
+def clone_along_path(obj: AnyModel, path: str, value: Any) -> AnyModel:
+    """Return a shallow copy of a model, with the attribute at 'path' replaced
+    by 'value'.
+
+    The objects along the path are copied, the other attribute values
+    are shared with the original object.
+    """
+
+    segments = parse_attribute_path(path)
+
+    def mark(parent: BaseModel, field_name: str, child: Any) -> Any:
+        # new complex attributes of resources are marked as in 'mark_with_schema'
+        if (
+            isinstance(parent, Resource)
+            and isinstance(child, ComplexAttribute)
+            and getattr(child, "_schema", None) is None
+        ):
+            schema = parent.model_fields["schemas"].default[0]
+            child._schema = f"{schema}:{field_name}"
+        return child
+
+    def clone(obj: BaseModel, segments: List[Tuple[str, Optional[str], Any]]):
+        (attribute_name, key, key_value), *segments = segments
+        field_name = get_field_name(type(obj), attribute_name)
+        attribute_type = type(obj).get_field_root_type(field_name)
+        current = getattr(obj, field_name)
+        copy = thaw(obj.model_copy())
+
+        if key is None and not isinstance(current, (list, ColumnarList)):
+            if not segments:
+                setattr(copy, field_name, value)
+                return copy
+
+            if not isinstance(attribute_type, type) or not issubclass(
+                attribute_type, BaseModel
+            ):
+                raise ValueError(
+                    f"Attribute '{attribute_name}' is not a complex attribute"
+                )
+
+            child = clone(current or attribute_type(), segments)
+            setattr(copy, field_name, mark(obj, field_name, child))
+            return copy
+
+        if current is None:
+            raise ValueError(f"Attribute '{attribute_name}' has no value")
+
+        if key is None:
+            indexes = range(len(current))
+        else:
+            key_field_name = get_field_name(attribute_type, key)
+            column = (
+                current.get_column(key_field_name)
+                if isinstance(current, ColumnarList)
+                else [getattr(item, key_field_name) for item in current]
+            )
+            indexes = [
+                index
+                for index, item_value in enumerate(column)
+                if (
+                    str(item_value)
+                    if isinstance(item_value, UserString)
+                    else item_value
+                )
+                == key_value
+            ]
+
+        if value is None and not segments:
+            removed = set(indexes)
+            items = [item for index, item in enumerate(current) if index not in removed]
+            if isinstance(current, ColumnarList):
+                items = ColumnarList(current.item_type, items)
+                items._schema = current._schema
+            setattr(copy, field_name, items)
+            return copy
+
+        items = (
+            copy_module.copy(current)
+            if isinstance(current, ColumnarList)
+            else list(current)
+        )
+        for index in indexes:
+            item = clone(current[index], segments) if segments else value
+            items[index] = mark(obj, field_name, item)
+        setattr(copy, field_name, items)
+        return copy
+
+    return clone(obj, segments)
+
+
 def is_multiple(field):
     return "list" in str(field.annotation).lower()
 
@@ -285,7 +840,12 @@ def get_reference_types(type):
     first_arg = get_args(type)[0]
     types = get_args(first_arg) if get_origin(first_arg) == Union else [first_arg]
     formatted_types = [
-        t.__forward_arg__ if isinstance(t, ForwardRef) else t for t in types
+        t.__forward_arg__
+        if isinstance(t, ForwardRef)
+        else t.__name__
+        if isclass(t) and issubclass(t, Resource)
+        else t
+        for t in types
     ]
     scim_reference_types = [
         "uri" if ref_type == URIReference else ref_type for ref_type in formatted_types
@@ -344,6 +904,9 @@ def tagged_resource_union(resource_types: Resource):
         return resource_types
 
     def get_schema_from_payload(payload: Any):
+        if isinstance(payload, Resource):
+            return payload.model_fields["schemas"].default[0]
+
         try:
             return payload["schemas"][0]
         except KeyError:
@@ -25,6 +25,7 @@ from ..base import Returned
 from ..base import Uniqueness
 from ..base import URIReference
 from ..base import is_complex_attribute
+from ..base import model_creation_lock
 from ..constants import RESERVED_WORDS
 from .resource import Resource
 
@@ -61,7 +62,8 @@ def make_python_model(obj: Union["Schema", "Attribute"], multiple=False) -> "Res
         base = Resource
 
     model_name = to_pascal(to_snake(obj.name))
-    model = create_model(model_name, __base__=base, **pydantic_attributes)
+    with model_creation_lock:
+        model = create_model(model_name, __base__=base, **pydantic_attributes)
 
     # Set the ComplexType class as a member of the model
     # e.g. make Member an attribute of Group
@@ -1,15 +1,72 @@
+import asyncio
+import json
 from enum import Enum
+from typing import IO
 from typing import Annotated
 from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Type
+from typing import Union
 
 from pydantic import Field
 from pydantic import PlainSerializer
+from pydantic import ValidationError
 
+from ..base import BaseModel
 from ..base import ComplexAttribute
+from ..base import Context
+from ..rfc7643.service_provider_config import Bulk
 from ..utils import int_to_str
+from .error import Error
 from .message import Message
+from .patch_op import PatchOp
+
+BULK_ID_PREFIX = "bulkId:"
+
+
+def find_bulk_ids(value: Any) -> Set[str]:
+    """Recursively look for 'bulkId:xxx' temporary identifiers in a
+    payload."""
+
+    if isinstance(value, str):
+        if value.startswith(BULK_ID_PREFIX):
+            return {value[len(BULK_ID_PREFIX) :]}
+        return set()
+
+    if isinstance(value, dict):
+        return find_bulk_ids(list(value.values()))
+
+    if isinstance(value, list):
+        return set().union(*(find_bulk_ids(item) for item in value))
+
+    return set()
+
+
+def replace_bulk_ids(value: Any, resource_ids: Dict[str, str]) -> Any:
+    """Recursively replace 'bulkId:xxx' temporary identifiers in a payload by
+    the matching resource identifiers."""
+
+    if isinstance(value, str):
+        bulk_id = value[len(BULK_ID_PREFIX) :]
+        if value.startswith(BULK_ID_PREFIX) and bulk_id in resource_ids:
+            return resource_ids[bulk_id]
+        return value
+
+    if isinstance(value, dict):
+        return {
+            key: replace_bulk_ids(item, resource_ids) for key, item in value.items()
+        }
+
+    if isinstance(value, list):
+        return [replace_bulk_ids(item, resource_ids) for item in value]
+
+    return value
 
 
 class BulkOperation(ComplexAttribute):
@@ -45,6 +102,106 @@ class BulkOperation(ComplexAttribute):
     status: Annotated[Optional[int], PlainSerializer(int_to_str)] = None
     """The HTTP response status code for the requested operation."""
 
+    def get_bulk_id_references(self) -> Set[str]:
+        """Return the 'bulkId' temporary identifiers the operation 'path' and
+        'data' refer to, as defined in :rfc:`RFC7644 §3.7.2
+        <7644#section-3.7.2>`."""
+
+        path_segments = self.path.split("/") if self.path else []
+        return find_bulk_ids(path_segments) | find_bulk_ids(self.data)
+
+    def resolve_bulk_ids(self, resource_ids: Dict[str, str]) -> "BulkOperation":
+        """Return a copy of the operation where the 'bulkId' references in the
+        'path' and 'data' attributes are replaced by the identifiers of the
+        resources created by the operations they refer to.
+
+        :param resource_ids: The resource identifiers, by 'bulkId'.
+        """
+
+        path = self.path
+        for bulk_id, resource_id in resource_ids.items():
+            path = path and path.replace(f"{BULK_ID_PREFIX}{bulk_id}", resource_id)
+
+        return self.model_copy(
+            update={"path": path, "data": replace_bulk_ids(self.data, resource_ids)}
+        )
+
+    def get_data_model(
+        self, resource_types: Dict[str, Type[BaseModel]]
+    ) -> Optional[Type[BaseModel]]:
+        """Return the model of the operation 'data' attribute, depending on the
+        operation 'method' and on the resource type targeted by 'path'.
+
+        :param resource_types: The resource models, by endpoint, for instance
+            ``{"/Users": User, "/Groups": Group}``.
+        :return: The resource model for POST and PUT operations,
+            :class:`~scim2_models.PatchOp` for PATCH operations, or
+            :data:`None` if the operation has no data or if the endpoint is
+            unknown.
+        """
+
+        if self.method == BulkOperation.Method.patch:
+            return PatchOp
+
+        if self.method not in (BulkOperation.Method.post, BulkOperation.Method.put):
+            return None
+
+        endpoint = "/" + (self.path or "").strip("/").split("/")[0]
+        return resource_types.get(endpoint)
+
+    def validate_data(
+        self, resource_types: Dict[str, Type[BaseModel]], **kwargs: Any
+    ) -> Optional[BaseModel]:
+        """Validate the operation 'data' attribute with the model returned by
+        :meth:`get_data_model`.
+
+        POST data is validated in the
+        :attr:`~scim2_models.Context.RESOURCE_CREATION_REQUEST` context, and
+        PUT data is validated in the
+        :attr:`~scim2_models.Context.RESOURCE_REPLACEMENT_REQUEST` context.
+
+        :param resource_types: The resource models, by endpoint.
+        :param kwargs: Parameters passed to
+            :meth:`~scim2_models.BaseModel.model_validate`.
+        :return: The validated data, or :data:`None` if there is no data
+            model for the operation.
+        """
+
+        model = self.get_data_model(resource_types)
+        if model is None or self.data is None:
+            return None
+
+        if isinstance(self.data, model):
+            return self.data
+
+        data = self.data
+        scim_ctx = Context.DEFAULT
+        if self.method == BulkOperation.Method.post:
+            scim_ctx = Context.RESOURCE_CREATION_REQUEST
+        elif self.method == BulkOperation.Method.put:
+            scim_ctx = Context.RESOURCE_REPLACEMENT_REQUEST
+        elif isinstance(data, list):
+            # bare list of patch operations
+            data = {"Operations": data}
+
+        return model.model_validate(data, scim_ctx=scim_ctx, **kwargs)
+
+    def make_error_response(
+        self, status: int, detail: str, scim_type: Optional[str] = None
+    ) -> "BulkOperation":
+        """Build an operation response representing an error for this
+        operation."""
+
+        return BulkOperation(
+            method=self.method,
+            bulk_id=self.bulk_id,
+            status=status,
+            response=Error(status=status, scim_type=scim_type, detail=detail),
+        )
+
+
+BulkHandler = Callable[[BulkOperation], Awaitable[BulkOperation]]
+
 
 class BulkRequest(Message):
     schemas: List[str] = ["urn:ietf:params:scim:api:messages:2.0:BulkRequest"]
@@ -57,6 +214,296 @@ class BulkRequest(Message):
     operations: List[BulkOperation] = Field(None, alias="Operations")
     """Defines operations within a bulk job."""
 
+    @classmethod
+    def from_stream(
+        cls,
+        stream: Union[IO[bytes], Iterable[bytes]],
+        bulk: Optional[Bulk] = None,
+        chunk_size: int = 65536,
+        **kwargs,
+    ) -> Union["BulkRequest", Error]:
+        """Read and validate a bulk request payload, while enforcing the
+        service provider limits defined in :rfc:`RFC7644 §3.7.4
+        <7644#section-3.7.4>`.
+
+        The payload is read by chunks, and the reading stops as soon as
+        :attr:`Bulk.max_payload_size <scim2_models.Bulk.max_payload_size>` is
+        exceeded. The number of operations is checked against
+        :attr:`Bulk.max_operations <scim2_models.Bulk.max_operations>` before
+        any model is built.
+
+        :param stream: A binary file-like object, or an iterable of bytes
+            chunks, such as a HTTP request body stream.
+        :param bulk: The service provider bulk configuration. If
+            :data:`None`, no limit is enforced.
+        :param chunk_size: The size of the chunks read from file-like objects.
+        :param kwargs: Parameters passed to
+            :meth:`~scim2_models.BaseModel.model_validate`.
+        :return: The bulk request, a 413 :class:`~scim2_models.Error` if
+            one of the limits is exceeded, or a 400 'invalidSyntax'
+            :class:`~scim2_models.Error` if the payload is not valid JSON.
+            Validation errors are converted with
+            :meth:`Error.from_validation_error
+            <scim2_models.Error.from_validation_error>`.
+        """
+
+        max_payload_size = bulk.max_payload_size if bulk else None
+        max_operations = bulk.max_operations if bulk else None
+
+        if hasattr(stream, "read"):
+            reader = stream
+            stream = iter(lambda: reader.read(chunk_size), b"")
+
+        chunks = []
+        size = 0
+        for chunk in stream:
+            size += len(chunk)
+            if max_payload_size is not None and size > max_payload_size:
+                return Error.make_payload_too_large_error(
+                    max_payload_size=max_payload_size
+                )
+            chunks.append(chunk)
+
+        try:
+            payload = json.loads(b"".join(chunks))
+        except ValueError:
+            return Error.make_invalid_syntaxError()
+
+        operations = payload.get("Operations") if isinstance(payload, dict) else None
+        if (
+            max_operations is not None
+            and isinstance(operations, list)
+            and len(operations) > max_operations
+        ):
+            return Error.make_payload_too_large_error(max_operations=max_operations)
+
+        try:
+            return cls.model_validate(payload, **kwargs)
+        except ValidationError as exc:
+            return Error.from_validation_error(exc)
+
+    def get_dependencies(self) -> Dict[int, Set[int]]:
+        """Return, for each operation index, the indexes of the operations it
+        depends on through 'bulkId' references.
+
+        References to unknown 'bulkId' are ignored.
+        """
+
+        operations = self.operations or []
+        by_bulk_id = {
+            operation.bulk_id: index
+            for index, operation in enumerate(operations)
+            if operation.bulk_id
+        }
+        return {
+            index: {
+                by_bulk_id[bulk_id]
+                for bulk_id in operation.get_bulk_id_references()
+                if bulk_id in by_bulk_id
+            }
+            for index, operation in enumerate(operations)
+        }
+
+    def get_circular_operations(self) -> Set[int]:
+        """Return the indexes of the operations that are part of a circular
+        'bulkId' reference chain, as described in :rfc:`RFC7644 §3.7.1
+        <7644#section-3.7.1>`."""
+
+        dependencies = self.get_dependencies()
+        circular = set()
+
+        for start in dependencies:
+            # look for a path leading back to the starting operation
+            visited = set()
+            stack = list(dependencies[start])
+            while stack:
+                index = stack.pop()
+                if index == start:
+                    circular.add(start)
+                    break
+
+                if index not in visited:
+                    visited.add(index)
+                    stack.extend(dependencies[index])
+
+        return circular
+
+    async def process(
+        self,
+        handler: BulkHandler,
+        max_concurrency: Optional[int] = None,
+        resource_types: Optional[Dict[str, Type[BaseModel]]] = None,
+    ) -> "BulkResponse":
+        """Execute the bulk operations and build a :class:`BulkResponse`.
+
+        Operations are executed concurrently, except for operations
+        referencing the 'bulkId' of other operations, that wait for those
+        operations to be executed. The 'bulkId' references are then replaced
+        by the identifiers of the created resources, deduced from the
+        'location' of the operations responses.
+
+        Operations part of a circular reference chain, and operations
+        depending on a failed operation or on an unknown 'bulkId' are not
+        executed, and get a 409 error response.
+
+        When :attr:`fail_on_errors` is set, no operation is started once that
+        number of errors is reached, as described in :rfc:`RFC7644 §3.7.3
+        <7644#section-3.7.3>`, and the operations that are not started are
+        left out of the response. Operations are only started while the
+        number of errors and of running operations is below
+        :attr:`fail_on_errors`, so that the running operations cannot exceed
+        it.
+
+        :param handler: A coroutine function executing one operation and
+            returning the operation response. Exceptions raised by the handler
+            are reported as 500 error responses.
+        :param max_concurrency: The maximum number of operations executed at
+            the same time. If :data:`None`, there is no limit.
+        :param resource_types: The resource models, by endpoint. If set, the
+            operations 'data' are validated with :meth:`BulkOperation.validate_data`
+            right before being passed to the handler, in fail-fast mode, and
+            operations with invalid data get an error response built with
+            :meth:`Error.from_validation_error
+            <scim2_models.Error.from_validation_error>`.
+        :return: The bulk response, with operations responses in the
+            request order.
+        """
+
+        operations = self.operations or []
+        dependencies = self.get_dependencies()
+        circular = self.get_circular_operations()
+        known_bulk_ids = {
+            operation.bulk_id for operation in operations if operation.bulk_id
+        }
+        resource_ids: Dict[str, str] = {}
+        tasks: List[asyncio.Task] = []
+        semaphore = asyncio.Semaphore(max_concurrency or max(len(operations), 1))
+        errors = 0
+        running = 0
+        budget = asyncio.Condition()
+
+        def is_aborted() -> bool:
+            return bool(self.fail_on_errors) and errors >= self.fail_on_errors
+
+        def report(response: BulkOperation) -> BulkOperation:
+            nonlocal errors
+            if response.status is not None and response.status >= 400:
+                errors += 1
+            return response
+
+        async def start() -> bool:
+            """Wait for the errors budget to allow an operation to start."""
+
+            nonlocal running
+            async with budget:
+                await budget.wait_for(
+                    lambda: not self.fail_on_errors
+                    or errors + running < self.fail_on_errors
+                    or is_aborted()
+                )
+                if is_aborted():
+                    return False
+
+                running += 1
+                return True
+
+        async def stop() -> None:
+            nonlocal running
+            async with budget:
+                running -= 1
+                budget.notify_all()
+
+        async def execute(index: int) -> Optional[BulkOperation]:
+            operation = operations[index]
+            if is_aborted():
+                return None
+
+            if index in circular:
+                return report(
+                    operation.make_error_response(
+                        409, "The operation is part of a circular bulkId reference."
+                    )
+                )
+
+            unknown = operation.get_bulk_id_references() - known_bulk_ids
+            if unknown:
+                return report(
+                    operation.make_error_response(
+                        409, f"Unknown bulkId reference: {', '.join(sorted(unknown))}."
+                    )
+                )
+
+            for dependency in dependencies[index]:
+                await tasks[dependency]
+
+            if is_aborted():
+                return None
+
+            unresolved = operation.get_bulk_id_references() - set(resource_ids)
+            if unresolved:
+                return report(
+                    operation.make_error_response(
+                        409,
+                        f"The operations with bulkId {', '.join(sorted(unresolved))} failed.",
+                    )
+                )
+
+            if dependencies[index]:
+                operation = operation.resolve_bulk_ids(resource_ids)
+
+            async with semaphore:
+                if not await start():
+                    return None
+
+                try:
+                    response = await run(operation)
+                    if (
+                        operation.bulk_id
+                        and response.location
+                        and response.status is not None
+                        and response.status < 300
+                    ):
+                        resource_ids[operation.bulk_id] = response.location.rstrip(
+                            "/"
+                        ).rsplit("/", 1)[-1]
+                    return report(response)
+                finally:
+                    await stop()
+
+        async def run(operation: BulkOperation) -> BulkOperation:
+            if resource_types is not None:
+                try:
+                    data = operation.validate_data(resource_types, fail_fast=True)
+                except ValidationError as exc:
+                    error = Error.from_validation_error(exc)
+                    return operation.make_error_response(
+                        error.status, error.detail, error.scim_type
+                    )
+
+                if data is not None:
+                    operation = operation.model_copy(update={"data": data})
+
+            try:
+                return await handler(operation)
+            except Exception:
+                return operation.make_error_response(
+                    500, "The operation could not be executed."
+                )
+
+        tasks.extend(
+            asyncio.ensure_future(execute(index)) for index in range(len(operations))
+        )
+        try:
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return BulkResponse(
+            operations=[response for response in responses if response is not None]
+        )
+
 
 class BulkResponse(Message):
     schemas: List[str] = ["urn:ietf:params:scim:api:messages:2.0:BulkResponse"]
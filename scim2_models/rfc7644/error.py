@@ -1,8 +1,12 @@
+import json
 from typing import Annotated
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 
 from pydantic import PlainSerializer
+from pydantic import ValidationError
 
 from ..utils import int_to_str
 from .message import Message
@@ -115,80 +119,235 @@ class Error(Message):
 
     @classmethod
     def make_invalid_filter_error(cls):
-        return Error(
-            status=400,
-            scim_type="invalidFilter",
-            detail="""The specified filter syntax was invalid (does not comply with Figure 1 of RFC7644), or the specified attribute and filter comparison combination is not supported.""",
-        )
+        return INVALID_FILTER_ERROR.make_error()
 
     @classmethod
     def make_too_many_error(cls):
-        return Error(
-            status=400,
-            scim_type="tooMany",
-            detail="""The specified filter yields many more results than the server is willing to calculate or process.  For example, a filter such as "(userName pr)" by itself would return all entries with a "userName" and MAY not be acceptable to the service provider.""",
-        )
+        return TOO_MANY_ERROR.make_error()
 
     @classmethod
     def make_uniqueness_error(cls):
-        return Error(
-            status=409,
-            scim_type="uniqueness",
-            detail="""One or more of the attribute values are already in use or are reserved.""",
-        )
+        return UNIQUENESS_ERROR.make_error()
 
     @classmethod
     def make_mutability_error(cls):
-        return Error(
-            status=400,
-            scim_type="mutability",
-            detail="""The attempted modification is not compatible with the target attribute's mutability or current state (e.g., modification of an "immutable" attribute with an existing value).""",
-        )
+        return MUTABILITY_ERROR.make_error()
 
     @classmethod
     def make_invalid_syntaxError(cls):
-        return Error(
-            status=400,
-            scim_type="invalidSyntax",
-            detail="""The request body message structure was invalid or did not conform to the request schema.""",
-        )
+        return INVALID_SYNTAX_ERROR.make_error()
 
     @classmethod
     def make_invalid_path_error(cls):
-        return Error(
-            status=400,
-            scim_type="invalidPath",
-            detail="""The "path" attribute was invalid or malformed (see Figure 7 of RFC7644).""",
-        )
+        return INVALID_PATH_ERROR.make_error()
 
     @classmethod
     def make_no_target_error(cls):
-        return Error(
-            status=400,
-            scim_type="noTarget",
-            detail="""The specified "path" did not yield an attribute or attribute value that could be operated on.  This occurs when the specified "path" value contains a filter that yields no match.""",
-        )
+        return NO_TARGET_ERROR.make_error()
 
     @classmethod
     def make_invalid_value_error(cls):
-        return Error(
-            status=400,
-            scim_type="invalidValue",
-            detail="""A required value was missing, or the value specified was not compatible with the operation or attribute type (see Section 2.2 of RFC7643), or resource schema (see Section 4 of RFC7643).""",
-        )
+        return INVALID_VALUE_ERROR.make_error()
 
     @classmethod
     def make_invalid_version_error(cls):
-        return Error(
-            status=400,
-            scim_type="invalidVers",
-            detail="""The specified SCIM protocol version is not supported (see Section 3.13 of RFC7644).""",
-        )
+        return INVALID_VERSION_ERROR.make_error()
 
     @classmethod
     def make_sensitive_error(cls):
-        return Error(
-            status=400,
-            scim_type="sensitive",
-            detail="""The specified request cannot be completed, due to the passing of sensitive (e.g., personal) information in a request URI.  For example, personal information SHALL NOT be transmitted over request URIs.  See Section 7.5.2. of RFC7644""",
+        return SENSITIVE_ERROR.make_error()
+
+    @classmethod
+    def make_payload_too_large_error(
+        cls,
+        max_payload_size: Optional[int] = None,
+        max_operations: Optional[int] = None,
+    ):
+        """Build the error returned when a bulk request exceeds one of the
+        limits defined in :rfc:`RFC7644 §3.7.4 <7644#section-3.7.4>`."""
+
+        if max_operations is not None:
+            detail = f"The number of bulk operations exceeds the maxOperations ({max_operations})."
+        else:
+            detail = f"The size of the bulk operation exceeds the maxPayloadSize ({max_payload_size})."
+
+        return PAYLOAD_TOO_LARGE_ERROR.make_error(detail)
+
+    @classmethod
+    def make_invalid_cursor_error(cls):
+        return INVALID_CURSOR_ERROR.make_error()
+
+    @classmethod
+    def from_validation_error(cls, exc: ValidationError) -> "Error":
+        """Build a SCIM error from a pydantic validation error.
+
+        The :attr:`scim_type` is deduced from the type of the first error,
+        according to :data:`SCIM_TYPES_BY_ERROR_TYPE`, and defaults to
+        'invalidSyntax'. Validating with ``fail_fast=True`` avoids collecting
+        errors that are not reported.
+        """
+
+        error = exc.errors(include_url=False, include_context=False)[0]
+        scim_type = SCIM_TYPES_BY_ERROR_TYPE.get(error["type"])
+        if scim_type:
+            detail = error["msg"]
+        else:
+            scim_type = "invalidSyntax"
+            location = ".".join(str(item) for item in error["loc"])
+            detail = f"{location}: {error['msg']}" if location else error["msg"]
+
+        return ERROR_TEMPLATES[scim_type].make_error(detail)
+
+
+class ErrorTemplate:
+    """A precomputed error response.
+
+    Templates hold the serialized JSON payload of an :class:`Error`, so
+    common error responses can be sent without building and serializing a
+    new model each time.
+
+    .. code-block:: python
+
+        >>> template = ErrorTemplate(status=400, scim_type="invalidPath", detail="Invalid path.")
+        >>> template.to_json()
+        b'{"schemas":["urn:ietf:params:scim:api:messages:2.0:Error"],"status":"400","scimType":"invalidPath","detail":"Invalid path."}'
+        >>> template.to_json(detail="Unknown path.")
+        b'{"schemas":["urn:ietf:params:scim:api:messages:2.0:Error"],"status":"400","scimType":"invalidPath","detail":"Unknown path."}'
+    """
+
+    __slots__ = ("status", "scim_type", "detail", "_json", "_json_prefix")
+
+    def __init__(
+        self, status: int, scim_type: Optional[str] = None, detail: Optional[str] = None
+    ):
+        self.status = status
+        self.scim_type = scim_type
+        self.detail = detail
+
+        payload = Error(status=status, scim_type=scim_type).model_dump()
+        self._json_prefix = self.dumps(payload)[:-1] + b',"detail":'
+        self._json = self.to_json(detail) if detail is not None else self.dumps(payload)
+
+    @staticmethod
+    def dumps(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    def make_error(self, detail: Optional[str] = None) -> Error:
+        """Build a new :class:`Error` from the template, without validation.
+
+        :param detail: A :attr:`Error.detail` overriding the template one.
+        """
+
+        return Error.model_construct(
+            status=self.status,
+            scim_type=self.scim_type,
+            detail=detail if detail is not None else self.detail,
         )
+
+    def to_json(self, detail: Optional[str] = None) -> bytes:
+        """Return the serialized error payload.
+
+        :param detail: A :attr:`Error.detail` overriding the template one.
+        """
+
+        if detail is None:
+            return self._json
+
+        # 'detail' is the last attribute of the payload
+        return self._json_prefix + json.dumps(detail).encode() + b"}"
+
+
+INVALID_FILTER_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="invalidFilter",
+    detail="""The specified filter syntax was invalid (does not comply with Figure 1 of RFC7644), or the specified attribute and filter comparison combination is not supported.""",
+)
+
+TOO_MANY_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="tooMany",
+    detail="""The specified filter yields many more results than the server is willing to calculate or process.  For example, a filter such as "(userName pr)" by itself would return all entries with a "userName" and MAY not be acceptable to the service provider.""",
+)
+
+UNIQUENESS_ERROR = ErrorTemplate(
+    status=409,
+    scim_type="uniqueness",
+    detail="""One or more of the attribute values are already in use or are reserved.""",
+)
+
+MUTABILITY_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="mutability",
+    detail="""The attempted modification is not compatible with the target attribute's mutability or current state (e.g., modification of an "immutable" attribute with an existing value).""",
+)
+
+INVALID_SYNTAX_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="invalidSyntax",
+    detail="""The request body message structure was invalid or did not conform to the request schema.""",
+)
+
+INVALID_PATH_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="invalidPath",
+    detail="""The "path" attribute was invalid or malformed (see Figure 7 of RFC7644).""",
+)
+
+NO_TARGET_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="noTarget",
+    detail="""The specified "path" did not yield an attribute or attribute value that could be operated on.  This occurs when the specified "path" value contains a filter that yields no match.""",
+)
+
+INVALID_VALUE_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="invalidValue",
+    detail="""A required value was missing, or the value specified was not compatible with the operation or attribute type (see Section 2.2 of RFC7643), or resource schema (see Section 4 of RFC7643).""",
+)
+
+INVALID_VERSION_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="invalidVers",
+    detail="""The specified SCIM protocol version is not supported (see Section 3.13 of RFC7644).""",
+)
+
+SENSITIVE_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="sensitive",
+    detail="""The specified request cannot be completed, due to the passing of sensitive (e.g., personal) information in a request URI.  For example, personal information SHALL NOT be transmitted over request URIs.  See Section 7.5.2. of RFC7644""",
+)
+
+INVALID_CURSOR_ERROR = ErrorTemplate(
+    status=400,
+    scim_type="invalidCursor",
+    detail="""Cursor value is invalid. Cursor value should be empty to request the first page and set to the value of the nextCursor or previousCursor attribute to request the next or previous page.""",
+)
+
+PAYLOAD_TOO_LARGE_ERROR = ErrorTemplate(status=413)
+
+ERROR_TEMPLATES: Dict[str, ErrorTemplate] = {
+    template.scim_type: template
+    for template in (
+        INVALID_FILTER_ERROR,
+        TOO_MANY_ERROR,
+        UNIQUENESS_ERROR,
+        MUTABILITY_ERROR,
+        INVALID_SYNTAX_ERROR,
+        INVALID_PATH_ERROR,
+        NO_TARGET_ERROR,
+        INVALID_VALUE_ERROR,
+        INVALID_VERSION_ERROR,
+        SENSITIVE_ERROR,
+        INVALID_CURSOR_ERROR,
+    )
+}
+"""The predefined error templates, by :attr:`Error.scim_type`."""
+
+SCIM_TYPES_BY_ERROR_TYPE: Dict[str, str] = {
+    "mutability_error": "mutability",
+    "returned_error": "invalidValue",
+    "required_error": "invalidValue",
+    "no_resource_error": "invalidValue",
+}
+"""The :attr:`Error.scim_type` matching the scim2-models validation error
+types."""
@@ -12,6 +12,7 @@ from pydantic_core import PydanticCustomError
 from typing_extensions import Self
 
 from ..base import Context
+from ..base import raise_scim_error
 from ..rfc7643.resource import AnyResource
 from ..rfc7643.resource import tagged_resource_union
 from .message import Message
@@ -36,6 +37,15 @@ class ListResponse(Message, Generic[AnyResource]):
     items_per_page: Optional[int] = None
     """The number of resources returned in a list response page."""
 
+    next_cursor: Optional[str] = None
+    """A cursor that can be used in a subsequent request to retrieve the next
+    page of results, as defined in the SCIM cursor pagination extension."""
+
+    previous_cursor: Optional[str] = None
+    """A cursor that can be used in a subsequent request to retrieve the
+    previous page of results, as defined in the SCIM cursor pagination
+    extension."""
+
     resources: Optional[List[AnyResource]] = Field(None, alias="Resources")
     """A multi-valued list of complex objects containing the requested
     resources."""
@@ -58,9 +68,10 @@ class ListResponse(Message, Generic[AnyResource]):
             return obj
 
         if obj.total_results > 0 and not obj.resources:
-            raise PydanticCustomError(
+            error = PydanticCustomError(
                 "no_resource_error",
                 "Field 'resources' is missing or null but 'total_results' is non-zero.",
             )
+            raise_scim_error(error, info, ("Resources",), value)
 
         return obj
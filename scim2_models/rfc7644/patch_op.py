@@ -1,11 +1,23 @@
+import json
 from enum import Enum
 from typing import Any
+from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
 
 from pydantic import Field
+from pydantic_core import to_jsonable_python
 
+from ..base import BaseModel
+from ..base import ColumnarList
 from ..base import ComplexAttribute
+from ..base import Context
+from ..base import Mutability
+from ..rfc7643.resource import Resource
 from .message import Message
 
 
@@ -33,3 +45,290 @@ class PatchOp(Message):
     operations: List[PatchOperation] = Field(None, alias="Operations")
     """The body of an HTTP PATCH request MUST contain the attribute
     "Operations", whose value is an array of one or more PATCH operations."""
+
+    @classmethod
+    def from_diff(cls, old: Resource, new: Resource) -> "PatchOp":
+        """Build the PATCH request turning a resource into another one, as
+        defined in :rfc:`RFC7644 §3.5.2 <7644#section-3.5.2>`.
+
+        :attr:`~scim2_models.Mutability.read_only` and
+        :attr:`~scim2_models.Mutability.immutable` attributes are ignored.
+        Items of multi-valued complex attributes are matched by their 'value'
+        sub-attribute, and are individually added, removed or modified with
+        filtered paths such as ``members[value eq "2819c223"]``.
+
+        :param old: The current state of the resource.
+        :param new: The expected state of the resource. It must be an instance
+            of the same model than `old`.
+        """
+
+        if type(old) is not type(new):
+            raise TypeError(
+                f"Cannot compare '{type(old).__name__}' and '{type(new).__name__}' objects"
+            )
+
+        operations = diff_attributes(type(old), old, new, "")
+        for schema, extension_model in type(old).get_extension_models().items():
+            old_extension = getattr(old, schema, None)
+            new_extension = getattr(new, schema, None)
+            if old_extension == new_extension:
+                continue
+
+            operations.extend(
+                diff_values(
+                    schema, extension_model, old_extension, new_extension, False
+                )
+                if old_extension is None or new_extension is None
+                else diff_attributes(
+                    extension_model, old_extension, new_extension, f"{schema}:"
+                )
+            )
+
+        return cls(operations=operations)
+
+
+def is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, (list, ColumnarList)) and not value)
+
+
+def serialize_value(value: Any) -> Any:
+    """Serialize a model, or a list of models, to be sent as a PATCH
+    operation value."""
+
+    if isinstance(value, Resource):
+        # extensions values do not hold their schema
+        payload = value.model_dump(scim_ctx=Context.RESOURCE_CREATION_REQUEST)
+        payload.pop("schemas", None)
+        return payload
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(scim_ctx=Context.RESOURCE_CREATION_REQUEST)
+
+    if isinstance(value, (list, ColumnarList)):
+        return [serialize_value(item) for item in value]
+
+    return value
+
+
+def diff_attributes(
+    model: Type[BaseModel], old: BaseModel, new: BaseModel, prefix: str
+) -> List[PatchOperation]:
+    """Compare the writable attributes of two model instances."""
+
+    operations = []
+    for field_name, field in model.model_fields.items():
+        mutability = model.get_field_annotation(field_name, Mutability)
+        if field_name == "schemas" or mutability in (
+            Mutability.read_only,
+            Mutability.immutable,
+        ):
+            continue
+
+        old_value = getattr(old, field_name)
+        new_value = getattr(new, field_name)
+        if old_value == new_value:
+            continue
+
+        path = prefix + (field.alias or field_name)
+        multiple = isinstance(
+            new_value if old_value is None else old_value, (list, ColumnarList)
+        )
+        attribute_type = model.get_field_root_type(field_name)
+        operations.extend(
+            diff_values(path, attribute_type, old_value, new_value, multiple)
+        )
+
+    return operations
+
+
+def diff_values(
+    path: str, attribute_type: Type, old_value: Any, new_value: Any, multiple: bool
+) -> List[PatchOperation]:
+    """Compare two values of an attribute."""
+
+    if is_empty(new_value):
+        return [PatchOperation(op=PatchOperation.Op.remove, path=path)]
+
+    if is_empty(old_value):
+        return [
+            PatchOperation(
+                op=PatchOperation.Op.add, path=path, value=serialize_value(new_value)
+            )
+        ]
+
+    is_model = isinstance(attribute_type, type) and issubclass(
+        attribute_type, BaseModel
+    )
+    if not is_model:
+        return [
+            PatchOperation(op=PatchOperation.Op.replace, path=path, value=new_value)
+        ]
+
+    if not multiple:
+        return diff_attributes(attribute_type, old_value, new_value, f"{path}.")
+
+    try:
+        diff = diff_multi_valued(old_value, new_value)
+    except ValueError:
+        # items cannot be identified by their value
+        return [
+            PatchOperation(
+                op=PatchOperation.Op.replace,
+                path=path,
+                value=serialize_value(new_value),
+            )
+        ]
+
+    return diff.to_patch_operations(path)
+
+
+class MultiValuedDiff(NamedTuple):
+    """The differences between two lists of multi-valued complex attribute
+    items, as returned by :func:`diff_multi_valued`."""
+
+    added: List[ComplexAttribute]
+    """The items of the new list that are not in the old list."""
+
+    removed: List[ComplexAttribute]
+    """The items of the old list that are not in the new list."""
+
+    changed: List[Tuple[ComplexAttribute, ComplexAttribute]]
+    """The old and new versions of the items present in both lists, but with
+    different sub-attributes."""
+
+    key: str = "value"
+    """The alias of the sub-attribute identifying the items."""
+
+    def to_patch_operations(self, path: str) -> List[PatchOperation]:
+        """Build the PATCH operations applying the differences to the
+        multi-valued attribute at 'path'.
+
+        Removed items and changed sub-attributes are targeted with filtered
+        paths such as ``members[value eq "2819c223"]``, and added items are
+        added in a single operation.
+        """
+
+        def item_path(item: ComplexAttribute) -> str:
+            field_name = next(
+                field_name
+                for field_name, field in item.model_fields.items()
+                if (field.alias or field_name) == self.key
+            )
+            value = getattr(item, field_name)
+            return f"{path}[{self.key} eq {json.dumps(to_jsonable_python(value))}]"
+
+        operations = [
+            PatchOperation(op=PatchOperation.Op.remove, path=item_path(item))
+            for item in self.removed
+        ]
+
+        if self.added:
+            operations.append(
+                PatchOperation(
+                    op=PatchOperation.Op.add,
+                    path=path,
+                    value=serialize_value(self.added),
+                )
+            )
+
+        for old_item, new_item in self.changed:
+            operations.extend(
+                diff_attributes(
+                    type(new_item), old_item, new_item, f"{item_path(new_item)}."
+                )
+            )
+
+        return operations
+
+
+def index_items(
+    items: Union[List[ComplexAttribute], ColumnarList], key: str
+) -> Dict[Any, Tuple[int, Tuple]]:
+    """Index items by their 'key' sub-attribute, with their position and the
+    values of all their sub-attributes."""
+
+    if isinstance(items, ColumnarList):
+        field_names = list(items.item_type.model_fields)
+        keys = items.get_column(key)
+        rows = zip(*(items.get_column(field_name) for field_name in field_names))
+    else:
+        field_names = list(type(items[0]).model_fields) if items else []
+        keys = [getattr(item, key, None) for item in items]
+        rows = (
+            tuple(item.__dict__.get(field_name) for field_name in field_names)
+            for item in items
+        )
+
+    index = {}
+    for position, (item_key, row) in enumerate(zip(keys, rows)):
+        if item_key is None or item_key in index:
+            raise ValueError(
+                f"Items cannot be identified by their '{key}' sub-attribute"
+            )
+        index[item_key] = (position, row)
+
+    return index
+
+
+def diff_multi_valued(
+    old: Optional[Union[List[ComplexAttribute], ColumnarList]],
+    new: Optional[Union[List[ComplexAttribute], ColumnarList]],
+    key: str = "value",
+) -> MultiValuedDiff:
+    """Compare two lists of multi-valued complex attribute items, in linear
+    time.
+
+    Items are matched with their `key` sub-attribute using hash tables.
+    :class:`~scim2_models.ColumnarList` sub-attributes are compared straight
+    from their columns, and only the differing items are materialized.
+
+    :param old: The old items.
+    :param new: The new items.
+    :param key: The name of the sub-attribute identifying the items.
+    :raises ValueError: If some items have no `key` value, or share the same
+        `key` value.
+
+    .. code-block:: python
+
+        >>> old = [GroupMember(value="1"), GroupMember(value="2")]
+        >>> new = [GroupMember(value="2"), GroupMember(value="3")]
+        >>> diff = diff_multi_valued(old, new)
+        >>> [item.value for item in diff.added], [item.value for item in diff.removed]
+        (['3'], ['1'])
+        >>> PatchOp(operations=diff.to_patch_operations("members")).model_dump()
+        {'schemas': ['urn:ietf:params:scim:api:messages:2.0:PatchOp'], 'Operations': [{'op': 'remove', 'path': 'members[value eq "1"]'}, {'op': 'add', 'path': 'members', 'value': [{'value': '3'}]}]}
+    """
+
+    old = old or []
+    new = new or []
+    old_index = index_items(old, key)
+    new_index = index_items(new, key)
+
+    removed = [
+        old[position]
+        for item_key, (position, _) in old_index.items()
+        if item_key not in new_index
+    ]
+    added = [
+        new[position]
+        for item_key, (position, _) in new_index.items()
+        if item_key not in old_index
+    ]
+    changed = [
+        (old[old_index[item_key][0]], new[position])
+        for item_key, (position, row) in new_index.items()
+        if item_key in old_index and old_index[item_key][1] != row
+    ]
+
+    item_type = next(
+        (
+            items.item_type if isinstance(items, ColumnarList) else type(items[0])
+            for items in (new, old)
+            if items
+        ),
+        None,
+    )
+    field = item_type.model_fields.get(key) if item_type else None
+    alias = (field.alias if field else None) or key
+
+    return MultiValuedDiff(added, removed, changed, alias)
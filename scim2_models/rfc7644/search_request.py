@@ -1,12 +1,109 @@
+import heapq
 from enum import Enum
+from typing import Any
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
 
 from pydantic import field_validator
+from pydantic_core import to_jsonable_python
 
+from ..attributes import extract_schema_and_attribut_base
+from ..base import BaseModel
+from ..base import CaseExact
+from ..base import ColumnarList
+from ..cursor import CursorEncoder
+from ..rfc7643.resource import Resource
+from ..utils import class_cache
+from .error import Error
+from .list_response import ListResponse
 from .message import Message
 
 
+@class_cache
+def get_sort_attribute_path(
+    model: Type[Resource], sort_by: str
+) -> Tuple[Optional[str], Tuple[str, ...], bool]:
+    """Resolve a 'sortBy' attribute path for a resource model.
+
+    :return: The schema of the extension holding the attribute if any, the
+        field names leading to the attribute, and whether the attribute is
+        case sensitive. The field names are empty if the model has no such
+        attribute.
+    """
+
+    schema, attribute_base = extract_schema_and_attribut_base(sort_by)
+    extension = None
+    if schema and schema != model.model_fields["schemas"].default[0]:
+        model = model.get_extension_models().get(schema)
+        extension = schema
+
+    field_names = []
+    case_exact = False
+    for attribute_name in attribute_base.split("."):
+        if model is None or not issubclass(model, BaseModel):
+            return extension, (), False
+
+        by_alias = {
+            (field.alias or field_name).lower(): field_name
+            for field_name, field in model.model_fields.items()
+        }
+        field_name = by_alias.get(attribute_name.lower())
+        if field_name is None:
+            return extension, (), False
+
+        field_names.append(field_name)
+        case_exact = bool(model.get_field_annotation(field_name, CaseExact))
+        model = model.get_field_root_type(field_name)
+
+    # multi-valued complex attributes are sorted by their 'value' sub-attribute
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        if "value" not in model.model_fields:
+            return extension, (), False
+        field_names.append("value")
+        case_exact = bool(model.get_field_annotation("value", CaseExact))
+
+    return extension, tuple(field_names), case_exact
+
+
+def get_sort_value(resource: Resource, sort_by: str) -> Any:
+    """Return the value of the 'sortBy' attribute of a resource, or
+    :data:`None`.
+
+    As defined in :rfc:`RFC7644 §3.4.2.3 <7644#section-3.4.2.3>`,
+    multi-valued attributes are sorted by their primary value if any, or
+    else by their first value.
+    """
+
+    extension, field_names, case_exact = get_sort_attribute_path(
+        type(resource), sort_by
+    )
+    value = getattr(resource, extension, None) if extension else resource
+    for field_name in field_names:
+        if value is None:
+            return None
+
+        value = getattr(value, field_name, None)
+        if isinstance(value, (list, ColumnarList)):
+            values = list(value)
+            value = next(
+                (item for item in values if getattr(item, "primary", False)),
+                values[0] if values else None,
+            )
+
+    if not field_names or value is None:
+        return None
+
+    if isinstance(value, str):
+        value = str(value)
+        return value if case_exact else value.casefold()
+
+    return value
+
+
 class SearchRequest(Message):
     """SearchRequest object defined at https://datatracker.ietf.org/doc/html/rfc7644#section-3.4.3"""
 
@@ -64,3 +161,164 @@ class SearchRequest(Message):
         """
 
         return None if value is None else max(1, value)
+
+    cursor: Optional[str] = None
+    """A string indicating the position of the page to return when using
+    cursor-based pagination, as defined in the SCIM cursor pagination
+    extension.
+
+    An empty string requests the first page, other values come from the
+    :attr:`~scim2_models.ListResponse.next_cursor` and
+    :attr:`~scim2_models.ListResponse.previous_cursor` attributes of a
+    previous response.
+    """
+
+    def get_sort_key(self, resource: Resource) -> Tuple:
+        """Return a key ordering resources according to :attr:`sort_by`.
+
+        Resources with no value for :attr:`sort_by` are ordered last with the
+        ascending order, and first with the descending order.
+        """
+
+        value = get_sort_value(resource, self.sort_by) if self.sort_by else None
+        return (1,) if value is None else (0, value)
+
+    def get_cursor_key(self, resource: Resource) -> List:
+        """Return a key ordering resources according to :attr:`sort_by`, that
+        can be stored in a cursor.
+
+        The resource 'id' is used as a tiebreaker, so resources are totally
+        ordered.
+        """
+
+        return to_jsonable_python([*self.get_sort_key(resource), resource.id or ""])
+
+    def paginate(
+        self,
+        resources: Iterable[Resource],
+        list_response: Optional[Type[ListResponse]] = None,
+        cursor_encoder: Optional[CursorEncoder] = None,
+    ) -> Union[ListResponse, Error]:
+        """Sort a set of resources according to :attr:`sort_by` and
+        :attr:`sort_order`, and return the page selected by
+        :attr:`start_index` and :attr:`count`, as defined in :rfc:`RFC7644
+        §3.4.2.3 <7644#section-3.4.2.3>` and :rfc:`RFC7644 §3.4.2.4
+        <7644#section-3.4.2.4>`.
+
+        Only the first :attr:`start_index` + :attr:`count` resources are
+        selected, instead of sorting the whole set. Filtering and attribute
+        projection are not applied.
+
+        :param resources: The resources to sort and paginate.
+        :param list_response: The :class:`~scim2_models.ListResponse` model to
+            build. If :data:`None`, it is built from the resources types.
+        :param cursor_encoder: The encoder used to read :attr:`cursor` and
+            build the response cursors. If set and :attr:`cursor` is not
+            :data:`None`, cursor-based pagination is used instead of
+            :attr:`start_index`.
+        :return: The :class:`~scim2_models.ListResponse` containing the page
+            resources, or an :class:`~scim2_models.Error` if :attr:`cursor` is
+            invalid.
+        """
+
+        resources = list(resources)
+        if list_response is None:
+            resource_types = list(
+                dict.fromkeys(type(resource) for resource in resources)
+            )
+            list_response = ListResponse.of(*resource_types or [Resource])
+
+        if cursor_encoder is not None and self.cursor is not None:
+            return self.paginate_with_cursor(resources, list_response, cursor_encoder)
+
+        start_index = max(1, self.start_index or 1)
+        end = start_index - 1 + self.count if self.count is not None else None
+
+        if self.sort_by:
+            descending = self.sort_order == SearchRequest.SortOrder.descending
+            if end is None:
+                ordered = sorted(resources, key=self.get_sort_key, reverse=descending)
+            elif descending:
+                ordered = heapq.nlargest(end, resources, key=self.get_sort_key)
+            else:
+                ordered = heapq.nsmallest(end, resources, key=self.get_sort_key)
+        else:
+            ordered = resources
+
+        page = ordered[start_index - 1 : end]
+        return list_response(
+            total_results=len(resources),
+            start_index=start_index,
+            items_per_page=len(page),
+            resources=page,
+        )
+
+    def paginate_with_cursor(
+        self,
+        resources: List[Resource],
+        list_response: Type[ListResponse],
+        cursor_encoder: CursorEncoder,
+    ) -> Union[ListResponse, Error]:
+        """Return the page of resources selected by :attr:`cursor` and
+        :attr:`count`.
+
+        Cursors hold the key of the resource the page starts after or ends
+        before, so pages are selected by comparing keys instead of counting
+        resources from the start of the set.
+        """
+
+        sorting = [self.sort_by, self.sort_order]
+        position = {}
+        if self.cursor:
+            try:
+                position = cursor_encoder.decode(self.cursor)
+            except ValueError:
+                return Error.make_invalid_cursor_error()
+
+            if not isinstance(position, dict) or position.get("sort") != sorting:
+                return Error.make_invalid_cursor_error()
+
+        descending = self.sort_order == SearchRequest.SortOrder.descending
+        keyed = [(self.get_cursor_key(resource), resource) for resource in resources]
+
+        def is_after(key, reference):
+            return key < reference if descending else key > reference
+
+        def first(items):
+            select = heapq.nlargest if descending else heapq.nsmallest
+            if self.count is None:
+                return sorted(items, key=lambda item: item[0], reverse=descending)
+            return select(self.count, items, key=lambda item: item[0])
+
+        def last(items):
+            select = heapq.nsmallest if descending else heapq.nlargest
+            if self.count is None:
+                return sorted(items, key=lambda item: item[0], reverse=descending)
+            return select(self.count, items, key=lambda item: item[0])[::-1]
+
+        if "before" in position:
+            page = last(item for item in keyed if is_after(position["before"], item[0]))
+        elif "after" in position:
+            page = first(item for item in keyed if is_after(item[0], position["after"]))
+        else:
+            page = first(keyed)
+
+        next_cursor = previous_cursor = None
+        if page:
+            first_key, last_key = page[0][0], page[-1][0]
+            if any(is_after(key, last_key) for key, _ in keyed):
+                next_cursor = cursor_encoder.encode(
+                    {"after": last_key, "sort": sorting}
+                )
+            if any(is_after(first_key, key) for key, _ in keyed):
+                previous_cursor = cursor_encoder.encode(
+                    {"before": first_key, "sort": sorting}
+                )
+
+        return list_response(
+            total_results=len(resources),
+            items_per_page=len(page),
+            resources=[resource for _, resource in page],
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
+        )
@@ -1,5 +1,42 @@
+from functools import wraps
+from typing import Any
+from typing import Callable
 from typing import Optional
+from typing import TypeVar
+
+Function = TypeVar("Function", bound=Callable[..., Any])
 
 
 def int_to_str(status: Optional[int]) -> Optional[str]:
     return None if status is None else str(status)
+
+
+def class_cache(function: Function) -> Function:
+    """Memoize a function whose first parameter is a class, in the class
+    itself.
+
+    Unlike :func:`functools.lru_cache`, the results do not keep the classes
+    alive, so dynamic models, such as the ones built by
+    :meth:`Schema.make_model <scim2_models.Schema.make_model>`, can be garbage
+    collected along with their memoized results.
+    """
+
+    name = function.__qualname__
+
+    @wraps(function)
+    def wrapper(cls: type, *args: Any) -> Any:
+        # the results are looked up in the class own dictionary, so
+        # subclasses do not inherit the results of their parents
+        cache = cls.__dict__.get("__scim_cache__")
+        if cache is None:
+            cache = {}
+            setattr(cls, "__scim_cache__", cache)
+
+        key = (name, *args)
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = function(cls, *args)
+            return result
+
+    return wrapper  # type: ignore[return-value]
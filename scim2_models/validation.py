@@ -0,0 +1,94 @@
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from pydantic import ValidationError
+
+from .base import BaseModel
+from .base import Context
+from .rfc7643.resource import Resource
+
+
+def validate_chunk(
+    model_or_registry: Union[Type[BaseModel], List[Type[Resource]]],
+    payloads: List[Dict[str, Any]],
+    scim_ctx: Optional[Context] = Context.DEFAULT,
+) -> List[Union[BaseModel, ValidationError, ValueError]]:
+    """Validate a list of payloads, and return the validated models or the
+    validation errors in the same order."""
+
+    results = []
+    for payload in payloads:
+        try:
+            if isinstance(model_or_registry, list):
+                model = Resource.get_by_payload(
+                    model_or_registry, payload, with_extensions=False
+                )
+                if not model:
+                    raise ValueError("No resource type matching the payload schemas")
+            else:
+                model = model_or_registry
+
+            results.append(model.model_validate(payload, scim_ctx=scim_ctx))
+
+        except (ValidationError, ValueError) as exc:
+            results.append(exc)
+
+    return results
+
+
+def validate_many(
+    model_or_registry: Union[Type[BaseModel], List[Type[Resource]]],
+    payloads: Iterable[Dict[str, Any]],
+    scim_ctx: Optional[Context] = Context.DEFAULT,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 1000,
+) -> List[Union[BaseModel, ValidationError, ValueError]]:
+    """Validate a batch of payloads.
+
+    :param model_or_registry: The model to validate the payloads with, or a
+        list of resource types in which the model is looked for, according
+        to the payloads 'schemas' attribute.
+    :param payloads: The payloads to validate.
+    :param scim_ctx: The SCIM context passed to
+        :meth:`~scim2_models.BaseModel.model_validate`.
+    :param executor: A :class:`~concurrent.futures.Executor` the payload
+        chunks are dispatched to. With a
+        :class:`~concurrent.futures.ProcessPoolExecutor`, the models must be
+        importable so they can be pickled by reference.
+        If :data:`None`, the payloads are validated in the current thread.
+    :param chunk_size: The number of payloads sent to the executor at once.
+    :return: The validated models, in the order of `payloads`. Payloads that
+        could not be validated are represented by their exception.
+
+    .. code-block:: python
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> payloads = [{"userName": "bjensen"}, {"userName": 42}]
+        >>> with ThreadPoolExecutor() as executor:
+        ...     results = validate_many(User, payloads, executor=executor)
+        >>> [type(result).__name__ for result in results]
+        ['User', 'ValidationError']
+    """
+
+    payloads = iter(payloads)
+    chunks = iter(lambda: list(islice(payloads, chunk_size)), [])
+
+    if executor is None:
+        return [
+            result
+            for chunk in chunks
+            for result in validate_chunk(model_or_registry, chunk, scim_ctx)
+        ]
+
+    futures = [
+        executor.submit(validate_chunk, model_or_registry, chunk, scim_ctx)
+        for chunk in chunks
+    ]
+    return [result for future in futures for result in future.result()]
@@ -0,0 +1,461 @@
+import asyncio
+import io
+import json
+
+from scim2_models import Bulk
+from scim2_models import BulkOperation
+from scim2_models import BulkRequest
+from scim2_models import BulkResponse
+from scim2_models import Error
+from scim2_models import Group
+from scim2_models import PatchOp
+from scim2_models import User
+
+RESOURCE_TYPES = {"/Users": User, "/Groups": Group}
+
+
+def make_handler(calls, failures=()):
+    """Build a bulk handler creating resources with predictable ids."""
+
+    async def handler(operation):
+        calls.append(operation)
+        await asyncio.sleep(0)
+        if operation.bulk_id in failures:
+            return operation.make_error_response(400, "Invalid payload")
+
+        return BulkOperation(
+            method=operation.method,
+            bulk_id=operation.bulk_id,
+            location=f"https://example.com/v2{operation.path}/id-{operation.bulk_id}",
+            status=201,
+        )
+
+    return handler
+
+
+def test_bulk_id_references(load_sample):
+    payload = load_sample("rfc7644-3.7.2-bulk_request-temporary_identifier.json")
+    request = BulkRequest.model_validate(payload)
+
+    assert request.operations[0].get_bulk_id_references() == set()
+    assert request.operations[1].get_bulk_id_references() == {"qwerty"}
+    assert BulkOperation(path="/Groups/bulkId:abc").get_bulk_id_references() == {"abc"}
+    assert request.get_dependencies() == {0: set(), 1: {0}}
+    assert request.get_circular_operations() == set()
+
+
+def test_resolve_bulk_ids():
+    operation = BulkOperation(
+        method=BulkOperation.Method.patch,
+        path="/Groups/bulkId:abc",
+        data={"Operations": [{"op": "add", "value": [{"value": "bulkId:def"}]}]},
+    )
+    resolved = operation.resolve_bulk_ids({"abc": "123", "def": "456"})
+
+    assert resolved.path == "/Groups/123"
+    assert resolved.data == {"Operations": [{"op": "add", "value": [{"value": "456"}]}]}
+    assert operation.path == "/Groups/bulkId:abc"
+
+
+def test_circular_references(load_sample):
+    payload = load_sample("rfc7644-3.7.1-bulk_request-circular_conflict.json")
+    request = BulkRequest.model_validate(payload)
+    request.operations.append(
+        BulkOperation(
+            method=BulkOperation.Method.post,
+            path="/Groups",
+            bulk_id="azerty",
+            data={"members": [{"value": "bulkId:qwerty"}]},
+        )
+    )
+    assert request.get_circular_operations() == {0, 1}
+
+    calls = []
+    response = asyncio.run(request.process(make_handler(calls)))
+
+    assert calls == []
+    assert [operation.status for operation in response.operations] == [409] * 3
+    assert isinstance(response.operations[0].response, Error)
+
+
+def test_process_temporary_identifiers(load_sample):
+    payload = load_sample("rfc7644-3.7.2-bulk_request-temporary_identifier.json")
+    request = BulkRequest.model_validate(payload)
+
+    calls = []
+    response = asyncio.run(request.process(make_handler(calls)))
+
+    assert isinstance(response, BulkResponse)
+    assert [operation.bulk_id for operation in calls] == ["qwerty", "ytrewq"]
+    assert calls[1].data["members"] == [{"type": "User", "value": "id-qwerty"}]
+    assert response.model_dump() == {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:BulkResponse"],
+        "Operations": [
+            {
+                "method": "POST",
+                "bulkId": "qwerty",
+                "location": "https://example.com/v2/Users/id-qwerty",
+                "status": "201",
+            },
+            {
+                "method": "POST",
+                "bulkId": "ytrewq",
+                "location": "https://example.com/v2/Groups/id-ytrewq",
+                "status": "201",
+            },
+        ],
+    }
+
+
+def test_process_failed_and_unknown_dependencies():
+    request = BulkRequest(
+        operations=[
+            BulkOperation(method="POST", path="/Users", bulk_id="a", data={}),
+            BulkOperation(
+                method="POST", path="/Groups", bulk_id="b", data={"x": "bulkId:a"}
+            ),
+            BulkOperation(
+                method="POST", path="/Groups", bulk_id="c", data={"x": "bulkId:z"}
+            ),
+            BulkOperation(method="POST", path="/Users", bulk_id="d", data={}),
+        ]
+    )
+
+    calls = []
+    response = asyncio.run(request.process(make_handler(calls, failures=["a"])))
+
+    assert [operation.bulk_id for operation in calls] == ["a", "d"]
+    assert [operation.status for operation in response.operations] == [
+        400,
+        409,
+        409,
+        201,
+    ]
+    assert response.model_dump()["Operations"][1] == {
+        "method": "POST",
+        "bulkId": "b",
+        "status": "409",
+        "response": {
+            "schemas": ["urn:ietf:params:scim:api:messages:2.0:Error"],
+            "status": "409",
+            "detail": "The operations with bulkId a failed.",
+        },
+    }
+
+
+def test_process_concurrently():
+    """Independent operations are executed concurrently: the first
+    operation can only complete once the second one has started."""
+
+    request = BulkRequest(
+        operations=[
+            BulkOperation(method="DELETE", path="/Users/1"),
+            BulkOperation(method="DELETE", path="/Users/2"),
+        ]
+    )
+
+    async def run():
+        second_started = asyncio.Event()
+
+        async def handler(operation):
+            if operation.path == "/Users/2":
+                second_started.set()
+            else:
+                await asyncio.wait_for(second_started.wait(), timeout=1)
+            return BulkOperation(method=operation.method, status=204)
+
+        return await request.process(handler)
+
+    response = asyncio.run(run())
+    assert [operation.status for operation in response.operations] == [204, 204]
+
+
+def test_process_fail_on_errors(load_sample):
+    payload = load_sample("rfc7644-3.7.3-bulk_request-multiple_operations.json")
+    request = BulkRequest.model_validate(payload)
+
+    async def handler(operation):
+        calls.append(operation)
+        return operation.make_error_response(400, "Invalid payload", "invalidSyntax")
+
+    calls = []
+    response = asyncio.run(request.process(handler, max_concurrency=1))
+    assert len(calls) == 1
+    assert [operation.status for operation in response.operations] == [400]
+
+    calls = []
+    request.fail_on_errors = 2
+    response = asyncio.run(request.process(handler, max_concurrency=1))
+    assert len(calls) == 2
+    assert [operation.status for operation in response.operations] == [400, 400]
+
+    calls = []
+    request.fail_on_errors = None
+    response = asyncio.run(request.process(handler, max_concurrency=1))
+    assert len(calls) == 4
+    assert len(response.operations) == 4
+
+
+def test_process_fail_on_errors_without_max_concurrency():
+    request = BulkRequest(
+        fail_on_errors=1,
+        operations=[
+            BulkOperation(method="DELETE", path=f"/Users/{index}")
+            for index in range(10)
+        ],
+    )
+
+    async def handler(operation):
+        calls.append(operation)
+        await asyncio.sleep(0)
+        return operation.make_error_response(404, "Resource not found")
+
+    calls = []
+    response = asyncio.run(request.process(handler))
+    assert len(calls) == 1
+    assert [operation.status for operation in response.operations] == [404]
+
+    # operations run concurrently within the errors budget
+    running = 0
+    max_running = 0
+
+    async def slow_handler(operation):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return BulkOperation(method=operation.method, status=204)
+
+    request.fail_on_errors = 3
+    response = asyncio.run(request.process(slow_handler))
+    assert max_running == 3
+    assert len(response.operations) == 10
+
+    # rejected operations count as errors
+    request = BulkRequest(
+        fail_on_errors=1,
+        operations=[
+            BulkOperation(method="DELETE", path="/Users/1", data={"id": "bulkId:a"}),
+            BulkOperation(method="DELETE", path="/Users/2", data={"id": "bulkId:b"}),
+        ],
+    )
+    calls = []
+    response = asyncio.run(request.process(handler))
+    assert calls == []
+    assert [operation.status for operation in response.operations] == [409]
+
+
+def test_process_handler_exceptions():
+    request = BulkRequest(
+        operations=[
+            BulkOperation(method="DELETE", path="/Users/1"),
+            BulkOperation(method="DELETE", path="/Users/2"),
+        ]
+    )
+
+    async def handler(operation):
+        if operation.path == "/Users/1":
+            raise RuntimeError("Database unavailable")
+        return BulkOperation(method=operation.method, status=204)
+
+    response = asyncio.run(request.process(handler))
+    assert [operation.status for operation in response.operations] == [500, 204]
+    assert response.operations[0].response.status == 500
+    assert "Database" not in response.operations[0].response.detail
+
+
+def test_process_cancellation():
+    request = BulkRequest(
+        operations=[
+            BulkOperation(method="DELETE", path=f"/Users/{index}") for index in range(2)
+        ]
+    )
+    cancelled = []
+
+    async def handler(operation):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(operation.path)
+            raise
+
+    async def run():
+        task = asyncio.ensure_future(request.process(handler))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    assert sorted(cancelled) == ["/Users/0", "/Users/1"]
+
+
+def test_process_max_concurrency():
+    request = BulkRequest(
+        operations=[
+            BulkOperation(method="DELETE", path=f"/Users/{index}") for index in range(6)
+        ]
+    )
+    running = set()
+    max_running = 0
+
+    async def handler(operation):
+        nonlocal max_running
+        running.add(operation.path)
+        max_running = max(max_running, len(running))
+        # the first operations are the slowest to complete
+        await asyncio.sleep(0.01 * (6 - int(operation.path[-1])))
+        running.remove(operation.path)
+        return BulkOperation(method=operation.method, location=operation.path)
+
+    response = asyncio.run(request.process(handler, max_concurrency=2))
+    assert max_running == 2
+    assert [operation.location for operation in response.operations] == [
+        f"/Users/{index}" for index in range(6)
+    ]
+
+
+def test_validate_data(load_sample):
+    payload = load_sample("rfc7644-3.7.3-bulk_request-multiple_operations.json")
+    post, put, patch, delete = BulkRequest.model_validate(payload).operations
+
+    assert post.get_data_model(RESOURCE_TYPES) is User
+    assert put.get_data_model(RESOURCE_TYPES) is User
+    assert patch.get_data_model(RESOURCE_TYPES) is PatchOp
+    assert delete.get_data_model(RESOURCE_TYPES) is None
+    assert post.get_data_model({}) is None
+
+    # the RFC example uses an invalid schema
+    post.data["schemas"] = ["urn:ietf:params:scim:schemas:core:2.0:User"]
+    user = post.validate_data(RESOURCE_TYPES)
+    assert isinstance(user, User)
+    assert user.user_name == "Alice"
+    assert isinstance(post.data, dict)
+
+    # 'id' is ignored in replacement requests
+    user = put.validate_data(RESOURCE_TYPES)
+    assert user.user_name == "Bob"
+    assert user.id is None
+
+    patch_op = patch.validate_data(RESOURCE_TYPES)
+    assert [operation.op for operation in patch_op.operations] == ["remove", "add"]
+
+    assert delete.validate_data(RESOURCE_TYPES) is None
+
+
+def test_process_validates_data_lazily():
+    request = BulkRequest(
+        fail_on_errors=1,
+        operations=[
+            BulkOperation(method="POST", path="/Users", data={"userName": 42}),
+            BulkOperation(method="POST", path="/Users", data={"userName": "bjensen"}),
+        ],
+    )
+    calls = []
+
+    async def handler(operation):
+        calls.append(operation)
+        return BulkOperation(method=operation.method, status=201)
+
+    response = asyncio.run(
+        request.process(handler, max_concurrency=1, resource_types=RESOURCE_TYPES)
+    )
+    assert calls == []
+    assert [operation.status for operation in response.operations] == [400]
+    error = response.operations[0].response
+    assert error.scim_type == "invalidSyntax"
+    assert error.detail == "userName: Input should be a valid string"
+
+    request.fail_on_errors = None
+    response = asyncio.run(
+        request.process(handler, max_concurrency=1, resource_types=RESOURCE_TYPES)
+    )
+    assert len(calls) == 1
+    assert isinstance(calls[0].data, User)
+    assert calls[0].data.user_name == "bjensen"
+    assert [operation.status for operation in response.operations] == [400, 201]
+
+
+def test_process_data_errors():
+    """Invalid data are reported with the SCIM error matching the first
+    validation error."""
+
+    request = BulkRequest(
+        operations=[
+            BulkOperation(
+                method="PUT",
+                path="/Groups/1",
+                data={"displayName": "Tour Guides", "members": [{"value": "1"}]},
+            ),
+        ],
+    )
+
+    calls = []
+    response = asyncio.run(
+        request.process(make_handler(calls), resource_types=RESOURCE_TYPES)
+    )
+    assert calls == []
+    error = response.operations[0].response
+    assert response.operations[0].status == 400
+    assert error.scim_type == "mutability"
+    assert "errors.pydantic.dev" not in error.detail
+
+
+def test_from_stream(load_sample):
+    payload = load_sample("rfc7644-3.7.2-bulk_request-temporary_identifier.json")
+    body = json.dumps(payload).encode()
+
+    request = BulkRequest.from_stream(io.BytesIO(body), chunk_size=16)
+    assert request == BulkRequest.model_validate(payload)
+
+    bulk = Bulk(supported=True, max_operations=2, max_payload_size=len(body))
+    request = BulkRequest.from_stream([body[:10], body[10:]], bulk)
+    assert isinstance(request, BulkRequest)
+
+
+def test_from_stream_payload_too_large(load_sample):
+    body = b"x" * 100
+    chunks_read = 0
+
+    def stream():
+        nonlocal chunks_read
+        for index in range(0, len(body), 10):
+            chunks_read += 1
+            yield body[index : index + 10]
+
+    bulk = Bulk(supported=True, max_operations=10, max_payload_size=25)
+    error = BulkRequest.from_stream(stream(), bulk)
+    assert chunks_read == 3
+    assert error.model_dump() == {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:Error"],
+        "status": "413",
+        "detail": "The size of the bulk operation exceeds the maxPayloadSize (25).",
+    }
+
+    bulk.max_payload_size = 1048576
+    error = BulkRequest.from_stream(io.BytesIO(b"x" * 1048577), bulk)
+    assert error.model_dump() == load_sample(
+        "rfc7644-3.7.4-error-payload_too_large.json"
+    )
+
+
+def test_from_stream_invalid_syntax():
+    for body in (b'{"Operations": [', b"\xff", b"[1, 2]", b'{"Operations": [1]}'):
+        error = BulkRequest.from_stream(io.BytesIO(body))
+        assert error.status == 400
+        assert error.scim_type == "invalidSyntax"
+
+
+def test_from_stream_too_many_operations(load_sample):
+    payload = load_sample("rfc7644-3.7.3-bulk_request-multiple_operations.json")
+    body = json.dumps(payload).encode()
+
+    bulk = Bulk(supported=True, max_operations=3, max_payload_size=len(body))
+    error = BulkRequest.from_stream(io.BytesIO(body), bulk)
+    assert error.status == 413
+    assert (
+        error.detail == "The number of bulk operations exceeds the maxOperations (3)."
+    )
@@ -0,0 +1,103 @@
+import pytest
+
+from scim2_models import ColumnarList
+from scim2_models import EnterpriseUser
+from scim2_models import Group
+from scim2_models import GroupMember
+from scim2_models import Name
+from scim2_models import User
+
+ENTERPRISE_SCHEMA = "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
+
+
+def test_clone_shares_attributes(load_sample):
+    user = User.model_validate(load_sample("rfc7643-8.2-user-full.json"))
+
+    clone = user.clone()
+    assert clone is not user
+    assert clone.model_dump() == user.model_dump()
+    assert clone.emails is user.emails
+    assert clone.name is user.name
+
+    clone = user.clone({"name.givenName": "Babs", "nickName": None})
+    assert clone.name.given_name == "Babs"
+    assert clone.name.family_name == "Jensen"
+    assert clone.nick_name is None
+    assert clone.emails is user.emails
+    assert user.name.given_name == "Barbara"
+    assert user.nick_name == "Babs"
+
+
+def test_clone_multi_valued_attributes():
+    members = [GroupMember(value=str(index)) for index in range(1000)]
+    group = Group(display_name="Tour Guides", members=members)
+
+    clone = group.clone({'members[value eq "42"].display': "Babs"})
+    assert clone.members is not group.members
+    assert clone.members[42].display == "Babs"
+    assert group.members[42].display is None
+    assert all(clone.members[index] is members[index] for index in range(42))
+
+    clone = group.clone({'members[value eq "42"]': None})
+    assert len(clone.members) == 999
+    assert len(group.members) == 1000
+
+    clone = group.clone({"members.display": "Member"})
+    assert {member.display for member in clone.members} == {"Member"}
+
+
+def test_clone_columnar_list():
+    class BigGroup(Group):
+        members: ColumnarList[GroupMember] = None
+
+    group = BigGroup.model_validate({"members": [{"value": "1"}, {"value": "2"}]})
+    clone = group.clone({'members[value eq "2"].display': "Jim"})
+    assert [member.display for member in clone.members] == [None, "Jim"]
+    assert [member.display for member in group.members] == [None, None]
+
+    clone = group.clone({'members[value eq "2"]': None})
+    assert isinstance(clone.members, ColumnarList)
+    assert [member.value for member in clone.members] == ["1"]
+
+
+def test_clone_extensions():
+    user = User[EnterpriseUser](user_name="bjensen", name=Name(given_name="Barbara"))
+    clone = user.clone(
+        {
+            f"{ENTERPRISE_SCHEMA}:manager.value": "26118915",
+            "urn:ietf:params:scim:schemas:core:2.0:User:userName": "babs",
+        }
+    )
+
+    assert clone[EnterpriseUser].manager.value == "26118915"
+    assert clone.user_name == "babs"
+    assert clone.name is user.name
+    assert getattr(user, ENTERPRISE_SCHEMA, None) is None
+    assert user.user_name == "bjensen"
+
+    clone = clone.clone({ENTERPRISE_SCHEMA: None})
+    assert clone[EnterpriseUser] is None
+
+
+def test_clone_resets_etag():
+    user = User(user_name="bjensen")
+    etag = user.compute_etag()
+    clone = user.clone({"userName": "babs"})
+    assert clone.compute_etag() != etag
+    assert user.compute_etag() == etag
+
+
+def test_clone_invalid_paths():
+    user = User(user_name="bjensen")
+
+    with pytest.raises(ValueError):
+        user.clone({"invalid": "value"})
+
+    with pytest.raises(ValueError):
+        user.clone({"userName.invalid": "value"})
+
+    with pytest.raises(ValueError):
+        user.clone({"emails[value eq bjensen].type": "work"})
+
+    with pytest.raises(ValueError):
+        user.clone({"emails[value eq 'bjensen'": "work"})
@@ -0,0 +1,142 @@
+import copy
+import sys
+from typing import List
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError
+
+from scim2_models import ColumnarList
+from scim2_models import Context
+from scim2_models import Group
+from scim2_models import GroupMember
+
+
+class BigGroup(Group):
+    members: Optional[ColumnarList[GroupMember]] = None
+
+
+def test_validation_and_access(load_sample):
+    payload = load_sample("rfc7643-8.4-group.json")
+    obj = BigGroup.model_validate(payload)
+
+    assert isinstance(obj.members, ColumnarList)
+    assert len(obj.members) == 2
+    assert obj.members[0].model_dump() == {
+        "value": "2819c223-7f76-453a-919d-413861904646",
+        "$ref": "https://example.com/v2/Users/2819c223-7f76-453a-919d-413861904646",
+        "display": "Babs Jensen",
+    }
+    assert obj.members[-1].display == "Mandy Pepperidge"
+    assert (
+        obj.members[0]._schema == "urn:ietf:params:scim:schemas:core:2.0:Group:members"
+    )
+    assert [member.value for member in obj.members[:1]] == [
+        "2819c223-7f76-453a-919d-413861904646"
+    ]
+    assert obj.members == Group.model_validate(payload).members
+
+    with pytest.raises(IndexError):
+        obj.members[2]
+
+
+def test_interned_values():
+    first = BigGroup.model_validate({"members": [{"value": "abc", "type": "User"}]})
+    second = BigGroup.model_validate({"members": [{"value": "abc", "type": "User"}]})
+
+    assert first.members._columns["type"][0] is second.members._columns["type"][0]
+
+    # unique values are not interned
+    value = "".join(["user-", "1"])
+    group = BigGroup.model_validate({"members": [{"value": value}]})
+    assert group.members._columns["value"][0] is not sys.intern("user-1")
+    assert copy.copy(group.members)._interned == {"type": {"User", "Group"}}
+
+
+def test_membership():
+    obj = BigGroup.model_validate(
+        {"members": [{"value": str(i), "display": f"User {i}"} for i in range(100)]}
+    )
+
+    assert "42" in obj.members
+    assert "foobar" not in obj.members
+    assert obj.members.index_of("42") == 42
+    assert GroupMember(value="42", display="User 42") in obj.members
+    assert GroupMember(value="42") not in obj.members
+
+
+def test_modification():
+    obj = BigGroup(members=ColumnarList(GroupMember, [GroupMember(value="1")]))
+    assert "2" not in obj.members
+
+    obj.members.append(GroupMember(value="2"))
+    assert "2" in obj.members
+
+    obj.members[0] = GroupMember(value="3")
+    assert "1" not in obj.members
+    assert [member.value for member in obj.members] == ["3", "2"]
+
+    # materialized items are copies
+    obj.members[0].value = "4"
+    assert obj.members[0].value == "3"
+
+
+def test_serialization(load_sample):
+    payload = load_sample("rfc7643-8.4-group.json")
+    obj = BigGroup.model_validate(payload)
+
+    assert obj.model_dump() == payload
+    assert (
+        obj.model_dump(scim_ctx=None)["members"]
+        == Group.model_validate(payload).model_dump(scim_ctx=None)["members"]
+    )
+    assert obj.model_dump(
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE, attributes=["members.value"]
+    ) == {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:Group"],
+        "id": "e9e30dba-f08f-4109-8486-d5c6a331660a",
+        "members": [
+            {"value": "2819c223-7f76-453a-919d-413861904646"},
+            {"value": "902c246b-6245-4190-8e05-00816be7344a"},
+        ],
+    }
+    assert obj.model_dump(scim_ctx=Context.RESOURCE_CREATION_REQUEST)["members"] == [
+        {
+            "value": "2819c223-7f76-453a-919d-413861904646",
+            "$ref": "https://example.com/v2/Users/2819c223-7f76-453a-919d-413861904646",
+        },
+        {
+            "value": "902c246b-6245-4190-8e05-00816be7344a",
+            "$ref": "https://example.com/v2/Users/902c246b-6245-4190-8e05-00816be7344a",
+        },
+    ]
+
+
+def test_validation_context():
+    with pytest.raises(ValidationError, match="mutability"):
+        BigGroup.model_validate(
+            {"members": [{"value": "1"}]},
+            scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST,
+        )
+
+
+def test_schema():
+    schema = BigGroup.to_schema()
+    attribute = schema.attributes[0]
+
+    assert attribute.name == "members"
+    assert attribute.multi_valued
+    assert {sub_attribute.name for sub_attribute in attribute.sub_attributes} == {
+        "value",
+        "$ref",
+        "type",
+        "display",
+    }
+
+
+def test_root_type():
+    class Foobar(Group):
+        big_members: ColumnarList[GroupMember]
+        members: List[GroupMember]
+
+    assert Foobar.get_field_root_type("big_members") is GroupMember
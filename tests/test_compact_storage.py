@@ -0,0 +1,116 @@
+import copy
+from typing import List
+
+import pytest
+from pydantic import PrivateAttr
+
+from scim2_models import Group
+from scim2_models import GroupMember
+from scim2_models.base import SharedPrivateAttributes
+
+
+@pytest.fixture
+def compact_members(monkeypatch):
+    monkeypatch.setattr(GroupMember, "compact_storage", True)
+
+
+def make_group(size):
+    return Group.model_validate(
+        {
+            "schemas": ["urn:ietf:params:scim:schemas:core:2.0:Group"],
+            "id": "group",
+            "members": [
+                {"value": f"user-{i}", "display": f"User {i}"} for i in range(size)
+            ],
+        }
+    )
+
+
+def test_compacted_members_share_bookkeeping(compact_members):
+    group = make_group(3)
+    first, second, _ = group.members
+
+    assert first.__pydantic_fields_set__ is second.__pydantic_fields_set__
+    assert first.__pydantic_private__ is second.__pydantic_private__
+    assert first._schema == "urn:ietf:params:scim:schemas:core:2.0:Group:members"
+
+
+def test_members_are_not_compacted_by_default():
+    group = make_group(2)
+    first, second = group.members
+
+    assert first.__pydantic_fields_set__ is not second.__pydantic_fields_set__
+    assert first.__pydantic_private__ is not second.__pydantic_private__
+
+
+def test_compacted_members_access_and_dump(compact_members, load_sample):
+    payload = load_sample("rfc7643-8.4-group.json")
+    group = Group.model_validate(payload)
+
+    assert group.members[0].value == "2819c223-7f76-453a-919d-413861904646"
+    assert group.members[1].display == "Mandy Pepperidge"
+    assert group.model_dump() == payload
+    assert group.members[0].model_dump(exclude_unset=True) == {
+        "value": "2819c223-7f76-453a-919d-413861904646",
+        "$ref": "https://example.com/v2/Users/2819c223-7f76-453a-919d-413861904646",
+        "display": "Babs Jensen",
+    }
+
+
+def test_compacted_members_assignment(compact_members):
+    group = make_group(2)
+    first, second = group.members
+
+    first.type = "User"
+    first._schema = "urn:example"
+
+    assert first.model_fields_set == {"value", "display", "type"}
+    assert second.model_fields_set == {"value", "display"}
+    assert first._schema == "urn:example"
+    assert second._schema == "urn:ietf:params:scim:schemas:core:2.0:Group:members"
+
+
+def test_compacted_members_copy(compact_members):
+    group = make_group(1)
+    member = group.members[0]
+
+    for copied in (
+        member.model_copy(update={"type": "User"}),
+        member.model_copy(update={"type": "User"}, deep=True),
+        copy.copy(member),
+    ):
+        assert copied.value == "user-0"
+        assert "type" not in member.model_fields_set
+
+
+def test_compacted_members_memoized_dumps(compact_members, monkeypatch):
+    group = make_group(2).frozen()
+    group.members[0].model_dump_json()
+    assert group.members[0]._cache
+    assert group.members[0].__pydantic_private__ is not (
+        group.members[1].__pydantic_private__
+    )
+
+    group = Group.model_validate(group)
+    assert group.members[0].is_compact()
+    assert group.members[0]._cache is None
+
+    monkeypatch.setattr(GroupMember, "dump_cache_size", 2)
+    group = make_group(2)
+    group.members[0].model_dump()
+    frozen = group.frozen()
+    assert frozen.members[0].__pydantic_private__ is (
+        frozen.members[1].__pydantic_private__
+    )
+    assert frozen.members[0].model_dump()["value"] == "user-0"
+    assert frozen.members[1].model_dump()["value"] == "user-1"
+
+
+def test_unhashable_private_attributes_are_not_shared():
+    class TaggedMember(GroupMember):
+        _tags: List[str] = PrivateAttr(default_factory=list)
+
+    member = TaggedMember(value="user-0")
+    member.compact()
+    assert member.is_compact()
+    assert not isinstance(member.__pydantic_private__, SharedPrivateAttributes)
@@ -0,0 +1,27 @@
+import pytest
+
+from scim2_models import CursorEncoder
+
+
+def test_encode_decode():
+    encoder = CursorEncoder(b"secret")
+    cursor = encoder.encode({"after": [0, "bjensen", "1"]})
+    assert "=" not in cursor
+    assert encoder.decode(cursor) == {"after": [0, "bjensen", "1"]}
+
+
+def test_invalid_cursors():
+    encoder = CursorEncoder(b"secret")
+    cursor = encoder.encode({"after": [0, "bjensen", "1"]})
+
+    with pytest.raises(ValueError, match="signature"):
+        CursorEncoder(b"other secret").decode(cursor)
+
+    _, signature = cursor.split(".")
+    forged = CursorEncoder(b"secret").encode({"after": [0, "alice", "2"]})
+    with pytest.raises(ValueError, match="signature"):
+        encoder.decode(f"{forged.split('.')[0]}.{signature}")
+
+    for malformed in ("", "foobar", f"{cursor}.foobar", "!!!.???"):
+        with pytest.raises(ValueError):
+            encoder.decode(malformed)
@@ -1,9 +1,12 @@
 import datetime
+import gc
+import weakref
 from typing import ForwardRef
 from typing import Union
 
 from scim2_models.base import CaseExact
 from scim2_models.base import ComplexAttribute
+from scim2_models.base import Context
 from scim2_models.base import ExternalReference
 from scim2_models.base import MultiValuedComplexAttribute
 from scim2_models.base import Mutability
@@ -14,6 +17,7 @@ from scim2_models.base import Uniqueness
 from scim2_models.base import URIReference
 from scim2_models.rfc7643.resource import is_multiple
 from scim2_models.rfc7643.schema import Schema
+from scim2_models.rfc7644.search_request import SearchRequest
 
 
 def test_make_group_model_from_schema(load_sample):
@@ -2791,3 +2795,25 @@ def test_make_schema_model_from_schema(load_sample):
     )
 
     assert obj.model_dump(exclude_unset=True) == payload
+
+
+def test_dynamic_models_are_garbage_collected(load_sample):
+    """The results memoized for dynamic models do not keep them alive."""
+
+    def use_model():
+        schema = Schema.model_validate(load_sample("rfc7643-8.7.1-schema-group.json"))
+        Group = schema.make_model()
+        group = Group.model_validate(
+            {"displayName": "Tour Guides", "members": [{"value": "1"}]},
+            scim_ctx=Context.RESOURCE_CREATION_REQUEST,
+            fail_fast=True,
+        )
+        group.model_dump(scim_ctx=Context.RESOURCE_CREATION_REQUEST)
+        group.model_dump()
+        Group.from_trusted({"displayName": "Tour Guides"})
+        SearchRequest(sort_by="displayName").get_sort_key(group)
+        return weakref.ref(Group)
+
+    model = use_model()
+    gc.collect()
+    assert model() is None
@@ -1,7 +1,12 @@
 import operator
+from typing import List
+from typing import Optional
+from typing import Union
 
+from scim2_models.base import Reference
 from scim2_models.rfc7643.enterprise_user import EnterpriseUser
 from scim2_models.rfc7643.group import Group
+from scim2_models.rfc7643.resource import Resource
 from scim2_models.rfc7643.resource_type import ResourceType
 from scim2_models.rfc7643.schema import Schema
 from scim2_models.rfc7643.service_provider_config import ServiceProviderConfig
@@ -122,3 +127,17 @@ def test_dynamic_schema_schema(load_sample):
     canonic_schema(schema)
     canonic_schema(sample)
     assert sample == schema
+
+
+def test_dynamic_schema_resource_references():
+    class Foobar(Resource):
+        schemas: List[str] = ["org:example:Foobar"]
+
+        bff: Optional[Reference[User]] = None
+        managers: Optional[Reference[Union[User, "Group"]]] = None
+
+    schema = Foobar.to_schema()
+    assert [attribute.reference_types for attribute in schema.attributes] == [
+        ["User"],
+        ["User", "Group"],
+    ]
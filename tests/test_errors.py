@@ -1,3 +1,13 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from scim2_models import Context
+from scim2_models import ErrorTemplate
+from scim2_models import ListResponse
+from scim2_models import User
+from scim2_models.rfc7644.error import ERROR_TEMPLATES
 from scim2_models.rfc7644.error import Error
 
 
@@ -13,5 +23,76 @@ def test_predefined_errors():
         Error.make_invalid_value_error,
         Error.make_invalid_version_error,
         Error.make_sensitive_error,
+        Error.make_invalid_cursor_error,
     ):
         assert isinstance(gen(), Error)
+
+
+def test_predefined_errors_are_distinct_objects():
+    error = Error.make_invalid_path_error()
+    error.detail = "Custom detail"
+    error.schemas.append("urn:example:foobar")
+
+    assert Error.make_invalid_path_error().detail != "Custom detail"
+    assert Error.make_invalid_path_error().schemas == [
+        "urn:ietf:params:scim:api:messages:2.0:Error"
+    ]
+
+
+def test_error_templates():
+    for scim_type, template in ERROR_TEMPLATES.items():
+        error = template.make_error()
+        assert error.scim_type == scim_type
+        assert error == Error(
+            status=template.status, scim_type=scim_type, detail=template.detail
+        )
+        assert json.loads(template.to_json()) == error.model_dump()
+
+        error = template.make_error(detail='Custom "detail"')
+        assert error.detail == 'Custom "detail"'
+        assert json.loads(template.to_json('Custom "detail"')) == error.model_dump()
+
+
+def test_error_template_without_detail():
+    template = ErrorTemplate(status=500)
+    assert template.to_json() == (
+        b'{"schemas":["urn:ietf:params:scim:api:messages:2.0:Error"],"status":"500"}'
+    )
+    assert json.loads(template.to_json(detail="Internal error")) == {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:Error"],
+        "status": "500",
+        "detail": "Internal error",
+    }
+
+
+def test_from_validation_error():
+    with pytest.raises(ValidationError) as exc_info:
+        User.model_validate(
+            {"userName": "bjensen", "password": "foobar"},
+            scim_ctx=Context.RESOURCE_QUERY_REQUEST,
+        )
+    error = Error.from_validation_error(exc_info.value)
+    assert error.status == 400
+    assert error.scim_type == "mutability"
+    assert error.detail == (
+        "Field 'password' has mutability 'writeOnly' but this in not valid in resource query request context"
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        User.model_validate({}, scim_ctx=Context.RESOURCE_CREATION_REQUEST)
+    error = Error.from_validation_error(exc_info.value)
+    assert error.scim_type == "invalidValue"
+    assert error.detail == "Field 'user_name' is required but value is missing or null"
+
+    with pytest.raises(ValidationError) as exc_info:
+        ListResponse[User].model_validate(
+            {"totalResults": 1}, scim_ctx=Context.RESOURCE_QUERY_RESPONSE
+        )
+    error = Error.from_validation_error(exc_info.value)
+    assert error.scim_type == "invalidValue"
+
+    with pytest.raises(ValidationError) as exc_info:
+        User.model_validate({"userName": 42, "displayName": 42})
+    error = Error.from_validation_error(exc_info.value)
+    assert error.scim_type == "invalidSyntax"
+    assert error.detail == "userName: Input should be a valid string"
@@ -0,0 +1,76 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from scim2_models import Email
+from scim2_models import EnterpriseUser
+from scim2_models import Meta
+from scim2_models import Name
+from scim2_models import User
+
+
+def test_etag_is_canonical(load_sample):
+    payload = load_sample("rfc7643-8.3-enterprise_user.json")
+    user = User[EnterpriseUser].model_validate(payload)
+    etag = user.compute_etag()
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == User[EnterpriseUser].model_validate(payload).compute_etag()
+
+    # key order does not matter
+    reordered = dict(reversed(payload.items()))
+    assert etag == User[EnterpriseUser].model_validate(reordered).compute_etag()
+
+    # meta and never returned attributes are ignored
+    other = User[EnterpriseUser].model_validate(payload)
+    other.meta = Meta(version='W/"foobar"')
+    other.password = "foobar"
+    assert etag == other.compute_etag()
+
+    other[EnterpriseUser].employee_number = "foobar"
+    other.display_name = "foobar"
+    assert etag != other.compute_etag()
+
+
+def test_etag_normalizes_datetimes():
+    class Resource(User):
+        date: datetime = None
+
+    date = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    paris = date.astimezone(timezone(timedelta(hours=1)))
+    assert (
+        Resource(user_name="bjensen", date=date).compute_etag()
+        == Resource(user_name="bjensen", date=paris).compute_etag()
+        == Resource(user_name="bjensen", date=date.replace(tzinfo=None)).compute_etag()
+    )
+
+
+def test_etag_cache():
+    user = User(user_name="bjensen")
+    etag = user.compute_etag()
+    frozen = user.frozen()
+    assert frozen.compute_etag() == etag
+    assert frozen.compute_etag() is frozen.compute_etag()
+    assert frozen.model_copy(update={"user_name": "babs"}).compute_etag() != etag
+
+    user.user_name = "bjensen2"
+    assert user.compute_etag() != etag
+
+    user.user_name = "bjensen"
+    assert user.compute_etag() == etag
+
+    copy = user.model_copy(update={"name": Name(given_name="Barbara")})
+    assert copy.compute_etag() != etag
+    assert user.model_copy().compute_etag() == etag
+
+
+def test_etag_sub_attributes_modifications():
+    user = User(user_name="bjensen", name=Name(given_name="Barbara"), emails=[])
+    etag = user.compute_etag()
+
+    user.name.given_name = "Babs"
+    assert user.compute_etag() != etag
+
+    etag = user.compute_etag()
+    user.emails.append(Email(value="bjensen@example.com"))
+    assert user.compute_etag() != etag
@@ -0,0 +1,98 @@
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from scim2_models import ColumnarList
+from scim2_models import Context
+from scim2_models import EnterpriseUser
+from scim2_models import Group
+from scim2_models import GroupMember
+from scim2_models import User
+
+
+@pytest.mark.parametrize(
+    "model,sample",
+    [
+        (User, "rfc7643-8.2-user-full.json"),
+        (User[EnterpriseUser], "rfc7643-8.3-enterprise_user.json"),
+        (Group, "rfc7643-8.4-group.json"),
+    ],
+)
+def test_from_trusted_matches_validation(load_sample, model, sample):
+    payload = load_sample(sample)
+    validated = model.model_validate(payload)
+    trusted = model.from_trusted(payload)
+
+    assert type(trusted) is model
+    assert trusted.__dict__ == validated.__dict__
+    assert trusted.__pydantic_extra__ == validated.__pydantic_extra__
+    assert trusted.model_fields_set == validated.model_fields_set
+    assert trusted.model_dump(
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE
+    ) == validated.model_dump(scim_ctx=Context.RESOURCE_QUERY_RESPONSE)
+
+
+def test_from_trusted_conversions():
+    user = User.from_trusted(
+        {
+            "userName": "bjensen",
+            "emails": [{"value": "bjensen@example.com", "type": "work"}],
+            "x509Certificates": [
+                {"value": "MIIDQzCCAqygAwIBAgICEAAwDQYJKoZIhvcNAQEFBQAw"}
+            ],
+            "meta": {"created": "2010-01-23T04:56:22Z"},
+        }
+    )
+
+    assert user.emails[0].type == user.emails[0].Type.work
+    assert user.x509_certificates[0].value == (
+        b"MIIDQzCCAqygAwIBAgICEAAwDQYJKoZIhvcNAQEFBQAw"
+    )
+    assert user.meta.created == datetime(2010, 1, 23, 4, 56, 22, tzinfo=timezone.utc)
+    assert user.schemas == ["urn:ietf:params:scim:schemas:core:2.0:User"]
+    assert user.schemas is not User.from_trusted({}).schemas
+
+
+def test_from_trusted_marks_complex_attributes(load_sample):
+    user = User[EnterpriseUser].from_trusted(
+        load_sample("rfc7643-8.3-enterprise_user.json")
+    )
+
+    assert user.name._schema == "urn:ietf:params:scim:schemas:core:2.0:User:name"
+    assert user.emails[0]._schema == "urn:ietf:params:scim:schemas:core:2.0:User:emails"
+    assert (
+        user[EnterpriseUser].manager._schema
+        == "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:manager"
+    )
+    dump = user.model_dump(
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE, attributes=["name.givenName"]
+    )
+    assert dump["name"] == {"givenName": "Barbara"}
+    assert "emails" not in dump
+
+
+def test_from_trusted_large_groups():
+    class BigGroup(Group):
+        members: ColumnarList[GroupMember] = None
+
+    payload = {"members": [{"value": str(index)} for index in range(1000)]}
+    group = BigGroup.from_trusted(payload)
+    assert isinstance(group.members, ColumnarList)
+    assert "999" in group.members
+
+    GroupMember.compact_storage = True
+    try:
+        group = Group.from_trusted(payload)
+        assert all(member.is_compact() for member in group.members)
+        group.members[0].display = "Babs"
+        assert group.members[1].display is None
+    finally:
+        GroupMember.compact_storage = False
+
+
+def test_from_trusted_unknown_attributes():
+    payload = {"userName": "bjensen", "unknown": "value"}
+    user = User.from_trusted(payload)
+    assert user.user_name == "bjensen"
+    assert user.__pydantic_extra__ == User.model_validate(payload).__pydantic_extra__
@@ -0,0 +1,201 @@
+import copy
+import pickle
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from scim2_models import ColumnarList
+from scim2_models import Context
+from scim2_models import EnterpriseUser
+from scim2_models import Group
+from scim2_models import GroupMember
+from scim2_models import User
+
+
+def test_frozen_models_cannot_be_modified(load_sample):
+    user = User[EnterpriseUser].model_validate(
+        load_sample("rfc7643-8.3-enterprise_user.json")
+    )
+    frozen = user.frozen()
+
+    assert frozen is not user
+    assert frozen.is_frozen()
+    assert not user.is_frozen()
+    assert frozen.frozen() is frozen
+    assert frozen.model_dump() == user.model_dump()
+
+    with pytest.raises(ValidationError):
+        frozen.user_name = "babs"
+
+    with pytest.raises(ValidationError):
+        frozen.name.given_name = "Babs"
+
+    with pytest.raises(ValidationError):
+        frozen[EnterpriseUser] = None
+
+    with pytest.raises(ValidationError):
+        frozen[EnterpriseUser].employee_number = "42"
+
+    with pytest.raises(TypeError):
+        frozen.emails.append(frozen.emails[0])
+
+    with pytest.raises(TypeError):
+        frozen.emails[0] = None
+
+    user.user_name = "babs"
+    assert frozen.user_name == "bjensen@example.com"
+
+
+def test_frozen_columnar_list():
+    class BigGroup(Group):
+        members: ColumnarList[GroupMember] = None
+
+    group = BigGroup.model_validate({"members": [{"value": "1"}]}).frozen()
+    with pytest.raises(TypeError):
+        group.members.append(GroupMember(value="2"))
+
+    clone = group.clone({'members[value eq "1"].display': "Babs"})
+    assert [member.display for member in clone.members] == ["Babs"]
+    assert [member.display for member in group.members] == [None]
+
+
+def test_frozen_models_hash():
+    user = User(user_name="bjensen")
+    with pytest.raises(TypeError):
+        hash(user)
+
+    frozen = user.frozen()
+    assert hash(frozen) == hash(User(user_name="bjensen").frozen())
+    assert hash(frozen) != hash(User(user_name="babs").frozen())
+    assert hash(frozen) == hash(frozen.compute_etag())
+    assert len({frozen, User(user_name="bjensen").frozen()}) == 1
+
+    group = Group(members=[GroupMember(value="1")]).frozen()
+    assert hash(group.members[0]) == hash(GroupMember(value="1").frozen())
+
+
+def test_frozen_models_equality(load_sample):
+    payload = load_sample("rfc7643-8.4-group.json")
+    group = Group.model_validate(payload)
+    frozen = group.frozen()
+    other = Group.model_validate(payload).frozen()
+    assert group == frozen
+    assert frozen == other
+
+    cache = {frozen: "cached"}
+    frozen.model_dump_json()
+    frozen.compute_etag()
+    assert frozen == other
+    assert other in cache
+    assert cache[Group.model_validate(payload).frozen()] == "cached"
+
+    assert frozen != Group.model_validate({**payload, "displayName": "Guides"})
+    assert frozen != User(user_name="bjensen").frozen()
+    assert frozen != "Tour Guides"
+
+
+def test_frozen_models_memoize_json_dumps(load_sample):
+    group = Group.model_validate(load_sample("rfc7643-8.4-group.json")).frozen()
+
+    dump = group.model_dump_json()
+    assert group.model_dump_json() is dump
+    assert (
+        group.model_dump_json(scim_ctx=Context.RESOURCE_QUERY_RESPONSE)
+        == group.model_dump_json()
+    )
+
+    dump = group.model_dump_json(
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE, attributes=["displayName"]
+    )
+    assert "members" not in dump
+    assert (
+        group.model_dump_json(
+            scim_ctx=Context.RESOURCE_QUERY_RESPONSE, attributes=["displayName"]
+        )
+        is dump
+    )
+
+
+def test_frozen_models_clone():
+    group = Group(
+        display_name="Tour Guides",
+        members=[GroupMember(value="1"), GroupMember(value="2")],
+    ).frozen()
+    clone = group.clone({"displayName": "Guides"})
+
+    assert not clone.is_frozen()
+    assert clone.members is group.members
+    clone.display_name = "Tour Guides"
+    assert group.display_name == "Tour Guides"
+
+    clone = group.clone({'members[value eq "1"].display': "Babs"})
+    assert clone.members[0].display == "Babs"
+    assert clone.members[1] is group.members[1]
+    assert group.members[0].display is None
+
+
+def test_frozen_models_shared_between_threads(load_sample):
+    group = Group.model_validate(load_sample("rfc7643-8.4-group.json")).frozen()
+    expected = group.model_dump_json(scim_ctx=Context.RESOURCE_QUERY_RESPONSE)
+    results = []
+
+    def dump():
+        for _ in range(50):
+            results.append(
+                group.model_dump_json(scim_ctx=Context.RESOURCE_QUERY_RESPONSE)
+                == expected
+                and hash(group) == hash(group.compute_etag())
+            )
+
+    threads = [threading.Thread(target=dump) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results) and len(results) == 200
+
+
+def test_frozen_models_copies(load_sample):
+    group = Group.model_validate(load_sample("rfc7643-8.4-group.json")).frozen()
+    group.model_dump_json()
+
+    copy = group.model_copy(update={"display_name": "Guides"})
+    assert '"displayName":"Guides"' in copy.model_dump_json()
+
+
+def test_frozen_models_do_not_share_dump_dicts(load_sample):
+    user = User.model_validate(load_sample("rfc7643-8.2-user-full.json")).frozen()
+
+    dump = user.model_dump()
+    dump["userName"] = "babs"
+    assert user.model_dump()["userName"] == "bjensen@example.com"
+    assert user.model_dump() is not user.model_dump()
+
+
+def test_frozen_models_deep_copies_and_pickles(load_sample):
+    user = User.model_validate(load_sample("rfc7643-8.2-user-full.json"))
+    frozen = user.frozen()
+
+    for copied in (
+        copy.deepcopy(frozen),
+        frozen.model_copy(deep=True),
+        pickle.loads(pickle.dumps(frozen)),
+    ):
+        assert copied.is_frozen()
+        assert copied.model_dump() == user.model_dump()
+        assert hash(copied) == hash(frozen)
+        with pytest.raises(TypeError):
+            copied.emails.append(copied.emails[0])
+
+
+def test_frozen_models_attributes_cannot_be_deleted():
+    user = User(user_name="bjensen", display_name="Babs").frozen()
+    with pytest.raises(ValidationError):
+        del user.display_name
+    assert user.display_name == "Babs"
+
+    user = User(user_name="bjensen", display_name="Babs")
+    del user.display_name
+    assert "display_name" not in user.__dict__
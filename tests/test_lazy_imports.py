@@ -0,0 +1,100 @@
+import subprocess
+import sys
+
+import pytest
+
+import scim2_models
+
+
+def imported_modules(statement):
+    """Return the modules of the package imported by a statement, in a fresh
+    interpreter."""
+
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        "print(' '.join(name for name in sys.modules if name.startswith(('scim2_models', 'email_validator'))))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    return set(output.split())
+
+
+def test_models_are_imported_on_first_access():
+    modules = imported_modules("import scim2_models")
+    assert "scim2_models.base" in modules
+    assert "scim2_models.rfc7643.resource" not in modules
+    assert "scim2_models.rfc7644.error" not in modules
+
+    modules = imported_modules(
+        "from scim2_models import Error\nError(status=404).model_dump_json()"
+    )
+    assert "scim2_models.rfc7644.error" in modules
+    assert "scim2_models.rfc7643.user" not in modules
+    assert "email_validator" not in modules
+
+    modules = imported_modules("from scim2_models import PatchOp")
+    assert "scim2_models.rfc7644.patch_op" in modules
+    assert "scim2_models.rfc7643.user" not in modules
+
+
+def import_time(*statements, runs=7):
+    """Return the best duration of each statement over several fresh
+    interpreters, in seconds.
+
+    The statements are run alternately so they are measured under the same
+    load, and the dependencies are imported beforehand so only the package
+    is measured."""
+
+    times = [[] for _ in statements]
+    for _ in range(runs):
+        for statement, durations in zip(statements, times):
+            code = (
+                "import time\n"
+                "import pydantic.main\n"
+                "start = time.perf_counter()\n"
+                f"{statement}\n"
+                "print(time.perf_counter() - start)"
+            )
+            output = subprocess.check_output([sys.executable, "-c", code], text=True)
+            durations.append(float(output))
+    return [min(durations) for durations in times]
+
+
+def test_import_time():
+    """Importing a single message does not pay for the other models."""
+
+    error, everything = import_time(
+        "from scim2_models import Error\nError(status=404).model_dump_json()",
+        "import scim2_models\n"
+        "for name in scim2_models.__all__:\n"
+        "    getattr(scim2_models, name)",
+    )
+    assert error < everything * 0.9
+
+
+def test_lazy_exports():
+    for name in scim2_models.__all__:
+        assert getattr(scim2_models, name) is not None
+        assert name in dir(scim2_models)
+
+    from scim2_models.rfc7643.user import User
+
+    assert scim2_models.User is User
+
+    with pytest.raises(AttributeError):
+        scim2_models.Unknown
+
+
+def test_deferred_schema_build():
+    """Models are built on first use, and the field aliases are available
+    beforehand."""
+
+    code = (
+        "from scim2_models import Manager\n"
+        "assert not Manager.__pydantic_complete__\n"
+        "assert Manager.model_fields['display_name'].alias == 'displayName'\n"
+        "manager = Manager.model_validate({'value': '1', 'displayName': 'Babs'})\n"
+        "assert Manager.__pydantic_complete__\n"
+        "assert manager.model_dump() == {'value': '1', 'displayName': 'Babs'}\n"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import pytest
+
+from scim2_models import ColumnarList
+from scim2_models import Context
+from scim2_models import EnterpriseUser
+from scim2_models import Group
+from scim2_models import GroupMember
+from scim2_models import RowMapper
+from scim2_models import User
+
+ENTERPRISE_SCHEMA = "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
+
+
+def test_map_row():
+    mapper = RowMapper(
+        User,
+        [
+            "id",
+            "urn:ietf:params:scim:schemas:core:2.0:User:userName",
+            None,
+            "name.givenName",
+            "name.familyName",
+            "meta.created",
+            "emails",
+        ],
+    )
+    user = mapper.map_row(
+        (
+            "2819c223",
+            "bjensen",
+            "ignored",
+            "Barbara",
+            None,
+            datetime(2010, 1, 23, 4, 56, 22),
+            "bjensen@example.com",
+        )
+    )
+
+    assert isinstance(user, User)
+    assert user.model_dump(scim_ctx=Context.RESOURCE_QUERY_RESPONSE) == {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "id": "2819c223",
+        "userName": "bjensen",
+        "name": {"givenName": "Barbara"},
+        "meta": {"created": "2010-01-23T04:56:22"},
+        "emails": [{"value": "bjensen@example.com"}],
+    }
+    assert user.name.model_fields_set == {"given_name"}
+
+    user = mapper.map_row(("2819c223", "bjensen", None, None, None, None, None))
+    assert user.name is None
+    assert user.emails is None
+
+
+def test_map_rows_merges_multi_valued_attributes():
+    mapper = RowMapper(
+        User[EnterpriseUser],
+        [
+            "id",
+            "userName",
+            "emails.value",
+            "emails.type",
+            "groups.value",
+            f"{ENTERPRISE_SCHEMA}:employeeNumber",
+            f"{ENTERPRISE_SCHEMA}:manager.value",
+        ],
+    )
+    rows = [
+        ("1", "bjensen", "bjensen@example.com", "work", "g1", "701984", "2"),
+        ("1", "bjensen", "bjensen@example.com", "work", "g2", "701984", "2"),
+        ("1", "bjensen", "babs@jensen.org", "home", "g1", "701984", "2"),
+        ("2", "jsmith", None, None, None, None, None),
+    ]
+
+    bjensen, jsmith = mapper.map_rows(iter(rows))
+    assert [(email.value, email.type) for email in bjensen.emails] == [
+        ("bjensen@example.com", "work"),
+        ("babs@jensen.org", "home"),
+    ]
+    assert [group.value for group in bjensen.groups] == ["g1", "g2"]
+    assert bjensen[EnterpriseUser].employee_number == "701984"
+    assert bjensen[EnterpriseUser].manager.value == "2"
+    assert bjensen.model_dump(scim_ctx=Context.RESOURCE_QUERY_RESPONSE)[
+        ENTERPRISE_SCHEMA
+    ]["manager"] == {"value": "2"}
+
+    assert jsmith.user_name == "jsmith"
+    assert jsmith.emails is None
+    assert getattr(jsmith, ENTERPRISE_SCHEMA, None) is None
+
+
+def test_map_rows_without_key():
+    mapper = RowMapper(Group, ["displayName", "members.value"])
+    assert mapper.key is None
+    groups = list(mapper.map_rows([("Tour Guides", "1"), ("Tour Guides", "2")]))
+    assert len(groups) == 2
+
+    mapper = RowMapper(Group, ["displayName", "members.value"], key=0)
+    (group,) = mapper.map_rows([("Tour Guides", "1"), ("Tour Guides", "2")])
+    assert [member.value for member in group.members] == ["1", "2"]
+
+
+def test_map_rows_columnar_list():
+    class BigGroup(Group):
+        members: ColumnarList[GroupMember] = None
+
+    mapper = RowMapper(BigGroup, ["id", "members.value", "members.display"])
+    (group,) = mapper.map_rows(
+        ("1", str(index), f"User {index}") for index in range(1000)
+    )
+    assert isinstance(group.members, ColumnarList)
+    assert len(group.members) == 1000
+    assert "999" in group.members
+
+
+def test_invalid_mapping():
+    with pytest.raises(ValueError):
+        RowMapper(User, ["invalid"])
+
+    with pytest.raises(ValueError):
+        RowMapper(User, ["userName.invalid"])
@@ -6,9 +6,15 @@ import pytest
 
 from scim2_models.base import ComplexAttribute
 from scim2_models.base import Context
+from scim2_models.base import MultiValuedComplexAttribute
 from scim2_models.base import Mutability
 from scim2_models.base import Returned
+from scim2_models.rfc7643.enterprise_user import EnterpriseUser
+from scim2_models.rfc7643.group import Group
+from scim2_models.rfc7643.group import GroupMember
 from scim2_models.rfc7643.resource import Resource
+from scim2_models.rfc7643.user import User
+from scim2_models.rfc7644.list_response import ListResponse
 
 
 class SubRetModel(ComplexAttribute):
@@ -344,3 +350,162 @@ def test_dump_response(context, ret_resource):
             "defaultReturned": "x",
         },
     }
+
+
+def test_dump_cache(load_sample):
+    payload = load_sample("rfc7643-8.4-group.json")
+    group = Group.model_validate(payload)
+    assert group.model_dump() is not group.model_dump()
+
+    Group.dump_cache_size = 2
+    try:
+        group = Group.model_validate(payload)
+        default_dump = group.model_dump()
+        assert group.model_dump() is default_dump
+        assert (
+            group.model_dump(scim_ctx=Context.RESOURCE_QUERY_RESPONSE)
+            is not default_dump
+        )
+
+        # attributes are normalized
+        dump = group.model_dump_json(
+            scim_ctx=Context.RESOURCE_QUERY_RESPONSE,
+            attributes=[
+                "displayName",
+                "urn:ietf:params:scim:schemas:core:2.0:Group:id",
+            ],
+        )
+        assert (
+            group.model_dump_json(
+                scim_ctx=Context.RESOURCE_QUERY_RESPONSE,
+                attributes=["id", "displayName"],
+            )
+            is dump
+        )
+
+        # the least recently used results are dropped
+        assert len(group._cache) == 2
+        assert group.model_dump() is not default_dump
+
+        # assignments invalidate the cache
+        group.display_name = "Tour Guides"
+        assert group.model_dump()["displayName"] == "Tour Guides"
+
+        # unhashable parameters are not memoized
+        assert group.model_dump(include={"display_name"}) is not group.model_dump(
+            include={"display_name"}
+        )
+
+        # copies do not share the memoized results
+        copy = group.model_copy(update={"display_name": "Guides"})
+        assert copy.model_dump()["displayName"] == "Guides"
+        assert group.model_copy(deep=True)._cache is None
+        assert group.model_dump()["displayName"] == "Tour Guides"
+
+        # memoized results do not change comparisons
+        other = Group.model_validate(payload)
+        assert Group.model_validate(payload) == other
+        other.model_dump()
+        assert Group.model_validate(payload) == other
+    finally:
+        Group.dump_cache_size = 0
+
+
+def test_plain_serializer(load_sample):
+    """Dumps without SCIM projections are performed by pydantic-core alone,
+    with the same results."""
+
+    payload = load_sample("rfc7643-8.3-enterprise_user.json")
+    user = User[EnterpriseUser].model_validate(payload)
+    user.nick_name = None
+
+    # unsupported parameters are handled by the SCIM serializers
+    for scim_ctx in (Context.DEFAULT, None):
+        assert user.model_dump(scim_ctx=scim_ctx) == user.model_dump(
+            scim_ctx=scim_ctx, warnings=True
+        )
+        assert user.model_dump_json(scim_ctx=scim_ctx) == user.model_dump_json(
+            scim_ctx=scim_ctx, warnings=True
+        )
+
+    assert "nickName" not in user.model_dump()
+    assert user.model_dump(exclude={"emails"}) == user.model_dump(
+        exclude={"emails"}, warnings=True
+    )
+    assert user.model_dump(scim_ctx=None)["user_name"] == "bjensen@example.com"
+
+    serializer = User[EnterpriseUser].get_plain_serializer()
+    assert serializer is User[EnterpriseUser].get_plain_serializer()
+    assert serializer is not User[EnterpriseUser].__pydantic_serializer__
+
+
+def test_request_exclude(load_sample):
+    """Dumps in request contexts use precomputed exclusions, with the same
+    results as the SCIM serializers."""
+
+    exclude = User[EnterpriseUser].get_request_exclude(
+        Context.RESOURCE_REPLACEMENT_REQUEST
+    )
+    assert exclude["id"] is True
+    assert exclude["meta"] is True
+    assert exclude["groups"] is True
+    assert exclude["addresses"] == {"__all__": {"display": True}}
+    assert exclude["urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"][
+        "manager"
+    ] == {"display": True, "display_name": True}
+    assert exclude is User[EnterpriseUser].get_request_exclude(
+        Context.RESOURCE_REPLACEMENT_REQUEST
+    )
+
+    # recursive and polymorphic models are handled by the SCIM serializers
+    class Node(ComplexAttribute):
+        value: Optional[str] = None
+        children: Optional[List["Node"]] = None
+
+    assert Node.get_request_exclude(Context.RESOURCE_CREATION_REQUEST) is None
+    assert (
+        ListResponse.of(User, Group).get_request_exclude(Context.SEARCH_REQUEST) is None
+    )
+
+    user = User[EnterpriseUser].model_validate(
+        load_sample("rfc7643-8.3-enterprise_user.json")
+    )
+    for scim_ctx in (
+        Context.RESOURCE_CREATION_REQUEST,
+        Context.RESOURCE_QUERY_REQUEST,
+        Context.RESOURCE_REPLACEMENT_REQUEST,
+        Context.SEARCH_REQUEST,
+    ):
+        assert user.model_dump(scim_ctx=scim_ctx) == user.model_dump(
+            scim_ctx=scim_ctx, warnings=True
+        )
+        assert user.model_dump_json(scim_ctx=scim_ctx) == user.model_dump_json(
+            scim_ctx=scim_ctx, warnings=True
+        )
+    dump = user.model_dump(scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST)
+    assert "id" not in dump
+    assert "meta" not in dump
+
+
+def test_request_exclude_subclasses():
+    """Exclusions built from declared models do not apply to instances of
+    subclasses, that are handled by the SCIM serializers."""
+
+    class Box(Resource):
+        schemas: List[str] = ["org:example:Box"]
+        items: Optional[List[MultiValuedComplexAttribute]] = None
+
+    box = Box(items=[GroupMember(value="1")])
+    assert box.model_dump(scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST)["items"] == [
+        {}
+    ]
+    assert box.model_dump_json(
+        scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST
+    ) == box.model_dump_json(
+        scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST, warnings=True
+    )
+
+    box = Box(items=[MultiValuedComplexAttribute(value="1")])
+    assert box.model_dump(scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST)["items"] == [
+        {"value": "1"}
+    ]
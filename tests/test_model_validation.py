@@ -1,15 +1,22 @@
+import copy
+import json
 from typing import Annotated
 from typing import List
 from typing import Optional
 
 import pytest
 from pydantic import ValidationError
+from pydantic import field_validator
 
 from scim2_models.base import Context
 from scim2_models.base import Mutability
 from scim2_models.base import Required
 from scim2_models.base import Returned
+from scim2_models.rfc7643.group import Group
+from scim2_models.rfc7643.group import GroupMember
 from scim2_models.rfc7643.resource import Resource
+from scim2_models.rfc7643.user import User
+from scim2_models.rfc7644.list_response import ListResponse
 
 
 class RetResource(Resource):
@@ -468,3 +475,198 @@ def test_validate_query_and_search_request_necessity(context):
         id="x",
         optional="x",
     )
+
+
+def test_validation_interns_canonical_values():
+    """Schemas, resource types and canonical values are shared between
+    validated objects."""
+
+    def make_payload():
+        # build new string objects for each payload
+        return json.loads(
+            json.dumps(
+                {
+                    "schemas": ["urn:ietf:params:scim:schemas:core:2.0:Group"],
+                    "displayName": "foobar",
+                    "members": [{"value": "123", "type": "User"}],
+                    "meta": {"resourceType": "Group"},
+                }
+            )
+        )
+
+    first = Group.model_validate(make_payload())
+    second = Group.model_validate(make_payload())
+
+    assert first.schemas[0] is second.schemas[0]
+    assert first.meta.resource_type is second.meta.resource_type
+    assert first.members[0].type is second.members[0].type
+    assert first.display_name is not second.display_name
+    assert Group.get_interned_fields() == {
+        "schemas": {"urn:ietf:params:scim:schemas:core:2.0:Group"}
+    }
+    assert GroupMember.get_interned_fields() == {"type": {"User", "Group"}}
+
+
+def test_validation_does_not_intern_unknown_values():
+    """Values that are not canonical values, such as the ones sent by
+    clients, are not interned."""
+
+    def make_payload():
+        return json.loads(
+            json.dumps(
+                {
+                    "schemas": ["urn:ietf:params:scim:schemas:core:2.0:Group"],
+                    "members": [{"value": "123", "type": "Unknown"}],
+                    "meta": {"resourceType": "Unknown"},
+                }
+            )
+        )
+
+    first = Group.model_validate(make_payload())
+    second = Group.model_validate(make_payload())
+
+    assert first.schemas[0] is second.schemas[0]
+    assert first.members[0].type is not second.members[0].type
+    assert first.meta.resource_type is not second.meta.resource_type
+
+
+def test_validation_does_not_modify_validated_instances():
+    """Validating existing instances again, such as frozen or shared ones,
+    does not replace their attributes."""
+
+    user = User(user_name="bjensen")
+    schemas = user.schemas
+    frozen = user.frozen()
+    frozen_schemas = frozen.schemas
+
+    ListResponse[User](total_results=2, resources=[user, frozen])
+    assert user.schemas is schemas
+    assert frozen.schemas is frozen_schemas
+    with pytest.raises(TypeError):
+        frozen.schemas.append("urn:example")
+
+
+def test_validate_fail_fast():
+    """In fail-fast mode, the validation stops at the first SCIM error."""
+
+    class Resource(MutResource):
+        other_immutable: Annotated[Optional[str], Mutability.immutable] = None
+
+    payload = {"immutable": "x", "otherImmutable": "x"}
+    with pytest.raises(ValidationError) as exc_info:
+        Resource.model_validate(payload, scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST)
+    assert exc_info.value.error_count() == 2
+
+    with pytest.raises(ValidationError) as exc_info:
+        Resource.model_validate(
+            payload, scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST, fail_fast=True
+        )
+    assert exc_info.value.title == "Resource"
+    assert exc_info.value.errors(include_url=False) == [
+        {
+            "type": "mutability_error",
+            "loc": ("immutable",),
+            "msg": "Field 'immutable' has mutability 'immutable' but this in not valid in resource replacement request context",
+            "input": "x",
+            "ctx": {
+                "field_name": "immutable",
+                "field_mutability": Mutability.immutable,
+                "context": "resource replacement request",
+            },
+        }
+    ]
+
+    with pytest.raises(ValidationError, match="required_error"):
+        ReqResource.model_validate(
+            {}, scim_ctx=Context.RESOURCE_CREATION_REQUEST, fail_fast=True
+        )
+
+    with pytest.raises(ValidationError, match="returned_error"):
+        RetResource.model_validate(
+            {"id": "x", "neverReturned": "x"},
+            scim_ctx=Context.RESOURCE_QUERY_RESPONSE,
+            fail_fast=True,
+        )
+
+
+def test_validate_fail_fast_nested_locations():
+    """In fail-fast mode, the errors raised by nested models are located in
+    the whole payload."""
+
+    payload = {"displayName": "Tour Guides", "members": [{}, {"value": "1"}]}
+    with pytest.raises(ValidationError) as exc_info:
+        Group.model_validate(
+            payload, scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST, fail_fast=True
+        )
+    assert exc_info.value.errors()[0]["loc"] == ("members", 1, "value")
+
+    payload = {
+        "totalResults": 1,
+        "Resources": [
+            {
+                "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+                "id": "1",
+                "userName": "bjensen",
+                "password": "secret",
+            }
+        ],
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        ListResponse[User].model_validate(
+            payload, scim_ctx=Context.RESOURCE_QUERY_RESPONSE, fail_fast=True
+        )
+    assert exc_info.value.errors()[0]["loc"] == ("Resources", 0, "password")
+
+    class CopyingGroup(Group):
+        @field_validator("members", mode="before")
+        @classmethod
+        def copy_members(cls, value):
+            return copy.deepcopy(value)
+
+    # nested models inputs that cannot be found in the payload are not located
+    with pytest.raises(ValidationError) as exc_info:
+        CopyingGroup.model_validate(
+            {"members": [{"value": "1"}]},
+            scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST,
+            fail_fast=True,
+        )
+    assert exc_info.value.errors()[0]["loc"] == ()
+
+
+def test_forbidden_attributes():
+    assert MutResource.get_forbidden_attributes(Context.RESOURCE_QUERY_REQUEST) == {
+        "writeOnly": "write_only"
+    }
+    assert MutResource.get_forbidden_attributes(
+        Context.RESOURCE_REPLACEMENT_REQUEST
+    ) == {"immutable": "immutable"}
+    assert MutResource.get_forbidden_attributes(Context.RESOURCE_CREATION_REQUEST) == {}
+    assert RetResource.get_forbidden_attributes(Context.RESOURCE_QUERY_RESPONSE) == {
+        "neverReturned": "never_returned"
+    }
+
+
+def test_validate_fail_fast_before_attributes_validation():
+    """In fail-fast mode, forbidden attributes are detected before the other
+    attributes are validated."""
+
+    payload = {"readWrite": 42, "immutable": "x"}
+    with pytest.raises(ValidationError) as exc_info:
+        MutResource.model_validate(
+            payload, scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST
+        )
+    assert exc_info.value.error_count() == 2
+
+    with pytest.raises(ValidationError) as exc_info:
+        MutResource.model_validate(
+            payload, scim_ctx=Context.RESOURCE_REPLACEMENT_REQUEST, fail_fast=True
+        )
+    assert [error["type"] for error in exc_info.value.errors()] == ["mutability_error"]
+
+    # null values of 'never' returned attributes are accepted
+    obj = RetResource.model_validate(
+        {"id": "x", "alwaysReturned": "x", "neverReturned": None},
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE,
+        fail_fast=True,
+    )
+    assert obj.never_returned is None
@@ -0,0 +1,178 @@
+import pytest
+
+from scim2_models import ColumnarList
+from scim2_models import Email
+from scim2_models import EnterpriseUser
+from scim2_models import Group
+from scim2_models import GroupMember
+from scim2_models import Name
+from scim2_models import PatchOp
+from scim2_models import PatchOperation
+from scim2_models import User
+from scim2_models import X509Certificate
+from scim2_models import diff_multi_valued
+
+
+def test_diff_identical_resources(load_sample):
+    payload = load_sample("rfc7643-8.2-user-full.json")
+    assert PatchOp.from_diff(
+        User.model_validate(payload), User.model_validate(payload)
+    ) == PatchOp(operations=[])
+
+
+def test_diff_simple_and_complex_attributes():
+    old = User(
+        id="1",
+        user_name="bjensen",
+        name=Name(given_name="Barbara"),
+        active=True,
+        nick_name="Babs",
+    )
+    new = User(
+        id="2",
+        user_name="bjensen",
+        name=Name(given_name="Barb", family_name="Jensen"),
+        active=False,
+    )
+
+    assert PatchOp.from_diff(old, new).model_dump()["Operations"] == [
+        {"op": "add", "path": "name.familyName", "value": "Jensen"},
+        {"op": "replace", "path": "name.givenName", "value": "Barb"},
+        {"op": "remove", "path": "nickName"},
+        {"op": "replace", "path": "active", "value": False},
+    ]
+
+
+def test_diff_multi_valued_attributes():
+    old = Group(
+        display_name="Tour Guides",
+        members=[GroupMember(value="1"), GroupMember(value="2", display="Babs")],
+    )
+    new = Group(
+        display_name="Tour Guides",
+        members=[
+            GroupMember(value="1"),
+            GroupMember(value='3"', type="User", display="Jim"),
+        ],
+    )
+
+    assert PatchOp.from_diff(old, new).model_dump()["Operations"] == [
+        {"op": "remove", "path": 'members[value eq "2"]'},
+        {"op": "add", "path": "members", "value": [{"type": "User", "value": '3"'}]},
+    ]
+
+    old = User(emails=[Email(value="bjensen@example.com", primary=True)])
+    new = User(emails=[Email(value="bjensen@example.com", type=Email.Type.work)])
+    assert PatchOp.from_diff(old, new).model_dump()["Operations"] == [
+        {
+            "op": "add",
+            "path": 'emails[value eq "bjensen@example.com"].type',
+            "value": "work",
+        },
+        {"op": "remove", "path": 'emails[value eq "bjensen@example.com"].primary'},
+    ]
+
+    old = Group(members=[])
+    new = Group(members=[GroupMember(value="1")])
+    assert PatchOp.from_diff(old, new).operations == [
+        PatchOperation(op="add", path="members", value=[{"value": "1"}])
+    ]
+    assert PatchOp.from_diff(new, Group()).operations == [
+        PatchOperation(op="remove", path="members")
+    ]
+
+
+def test_diff_multi_valued_bytes_values():
+    old = User(x509_certificates=[X509Certificate(value=b"MIIDQzCCA")])
+    new = User(x509_certificates=[X509Certificate(value=b"MIIDQzCCB")])
+    assert PatchOp.from_diff(old, new).model_dump()["Operations"] == [
+        {"op": "remove", "path": 'x509Certificates[value eq "MIIDQzCCA"]'},
+        {"op": "add", "path": "x509Certificates", "value": [{"value": "MIIDQzCCB"}]},
+    ]
+
+
+def test_diff_extensions():
+    old = User[EnterpriseUser](user_name="bjensen")
+    new = User[EnterpriseUser](user_name="bjensen")
+    new[EnterpriseUser] = EnterpriseUser(employee_number="701984")
+    schema = "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User"
+
+    assert PatchOp.from_diff(old, new).model_dump()["Operations"] == [
+        {"op": "add", "path": schema, "value": {"employeeNumber": "701984"}},
+    ]
+
+    old[EnterpriseUser] = EnterpriseUser(employee_number="1", cost_center="4130")
+    assert PatchOp.from_diff(old, new).model_dump()["Operations"] == [
+        {"op": "replace", "path": f"{schema}:employeeNumber", "value": "701984"},
+        {"op": "remove", "path": f"{schema}:costCenter"},
+    ]
+
+
+def test_diff_different_models():
+    with pytest.raises(TypeError):
+        PatchOp.from_diff(User(), Group())
+
+
+def test_diff_multi_valued():
+    old = [GroupMember(value="1"), GroupMember(value="2"), GroupMember(value="3")]
+    new = [
+        GroupMember(value="4"),
+        GroupMember(value="3", display="Jim"),
+        GroupMember(value="1"),
+    ]
+
+    diff = diff_multi_valued(old, new)
+    assert diff.added == [new[0]]
+    assert diff.removed == [old[1]]
+    assert diff.changed == [(old[2], new[1])]
+
+    diff = diff_multi_valued(None, new)
+    assert diff.added == new
+    assert diff.removed == diff.changed == []
+
+    with pytest.raises(ValueError):
+        diff_multi_valued(old, [GroupMember(value="1"), GroupMember(value="1")])
+
+    with pytest.raises(ValueError):
+        diff_multi_valued(old, [GroupMember(display="Jim")])
+
+
+def test_diff_multi_valued_custom_key():
+    old = [Email(type="work", value="bjensen@example.com")]
+    new = [Email(type="work", value="babs@example.com")]
+
+    diff = diff_multi_valued(old, new, key="type")
+    assert diff.changed == [(old[0], new[0])]
+    assert diff.to_patch_operations("emails") == [
+        PatchOperation(
+            op="replace",
+            path='emails[type eq "work"].value',
+            value="babs@example.com",
+        )
+    ]
+
+
+def test_diff_multi_valued_columnar_list():
+    count = 20000
+    old = ColumnarList(
+        GroupMember, [GroupMember(value=str(index)) for index in range(count)]
+    )
+    new = ColumnarList(
+        GroupMember, [GroupMember(value=str(index)) for index in range(1, count + 1)]
+    )
+    new[0] = GroupMember(value="1", display="Babs")
+
+    diff = diff_multi_valued(old, new)
+    assert [item.value for item in diff.added] == [str(count)]
+    assert [item.value for item in diff.removed] == ["0"]
+    assert [(a.display, b.display) for a, b in diff.changed] == [(None, "Babs")]
+
+    # columnar lists can be compared with regular lists
+    diff = diff_multi_valued(list(old), new)
+    assert [item.value for item in diff.added] == [str(count)]
+    assert len(diff.changed) == 1
+
+    assert diff.to_patch_operations("members") == [
+        PatchOperation(op="remove", path='members[value eq "0"]'),
+        PatchOperation(op="add", path="members", value=[{"value": str(count)}]),
+    ]
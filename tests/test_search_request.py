@@ -1,3 +1,15 @@
+from typing import Annotated
+from typing import Optional
+
+from scim2_models import CaseExact
+from scim2_models import CursorEncoder
+from scim2_models import Email
+from scim2_models import EnterpriseUser
+from scim2_models import Error
+from scim2_models import Group
+from scim2_models import ListResponse
+from scim2_models import Name
+from scim2_models import User
 from scim2_models.rfc7644.search_request import SearchRequest
 
 
@@ -42,3 +54,177 @@ def test_count_floor():
 
     sr = SearchRequest(count=-1)
     assert sr.count == 1
+
+
+def make_users():
+    return [
+        User(id="1", user_name="bob", emails=[Email(value="b@example.com")]),
+        User(
+            id="2",
+            user_name="Alice",
+            emails=[
+                Email(value="z@example.com"),
+                Email(value="a@example.com", primary=True),
+            ],
+        ),
+        User(id="3", user_name="carol"),
+        User(
+            id="4",
+            user_name="dave",
+            name=Name(family_name="Doe"),
+            emails=[Email(value="c@example.com")],
+        ),
+    ]
+
+
+def test_paginate_sort_by():
+    users = make_users()
+
+    response = SearchRequest(sort_by="userName").paginate(users)
+    assert [user.id for user in response.resources] == ["2", "1", "3", "4"]
+    assert response.total_results == 4
+    assert response.start_index == 1
+    assert response.items_per_page == 4
+
+    response = SearchRequest(
+        sort_by="userName", sort_order=SearchRequest.SortOrder.descending
+    ).paginate(users)
+    assert [user.id for user in response.resources] == ["4", "3", "1", "2"]
+
+
+def test_paginate_sort_by_multi_valued_attribute():
+    """Multi-valued attributes are sorted by their primary or first value,
+    and resources with no value are ordered last with the ascending
+    order."""
+
+    users = make_users()
+
+    response = SearchRequest(sort_by="emails").paginate(users)
+    assert [user.id for user in response.resources] == ["2", "1", "4", "3"]
+
+    response = SearchRequest(
+        sort_by="emails.value", sort_order=SearchRequest.SortOrder.descending
+    ).paginate(users)
+    assert [user.id for user in response.resources] == ["3", "4", "1", "2"]
+
+    response = SearchRequest(sort_by="name.familyName").paginate(users)
+    assert [user.id for user in response.resources] == ["4", "1", "2", "3"]
+
+
+def test_paginate_sort_by_extension_attribute():
+    users = [
+        User[EnterpriseUser](id="1", user_name="bob"),
+        User[EnterpriseUser](id="2", user_name="alice"),
+    ]
+    users[0][EnterpriseUser] = EnterpriseUser(employee_number="2")
+    users[1][EnterpriseUser] = EnterpriseUser(employee_number="1")
+
+    response = SearchRequest(
+        sort_by="urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:employeeNumber"
+    ).paginate(users)
+    assert [user.id for user in response.resources] == ["2", "1"]
+
+
+def test_paginate_case_exact():
+    class Resource(User):
+        code: Annotated[Optional[str], CaseExact.true] = None
+
+    resources = [Resource(id="1", code="b"), Resource(id="2", code="B")]
+    response = SearchRequest(sort_by="code").paginate(resources)
+    assert [resource.id for resource in response.resources] == ["2", "1"]
+
+
+def test_paginate_start_index_and_count():
+    users = make_users()
+
+    response = SearchRequest(sort_by="userName", start_index=2, count=2).paginate(users)
+    assert [user.id for user in response.resources] == ["1", "3"]
+    assert response.total_results == 4
+    assert response.start_index == 2
+    assert response.items_per_page == 2
+
+    response = SearchRequest(start_index=4, count=10).paginate(users)
+    assert [user.id for user in response.resources] == ["4"]
+
+    response = SearchRequest(start_index=10, count=10).paginate(users)
+    assert response.resources == []
+    assert response.items_per_page == 0
+
+
+def test_paginate_list_response_model():
+    users = make_users()
+    groups = [Group(id="5", display_name="group")]
+
+    response = SearchRequest(count=1).paginate(users + groups)
+    assert response.model_dump()["totalResults"] == 5
+
+    response = SearchRequest().paginate(users, list_response=ListResponse[User])
+    assert isinstance(response, ListResponse[User])
+
+
+def test_paginate_with_cursor():
+    users = [User(id=str(index), user_name=f"user{index:02}") for index in range(10)]
+    encoder = CursorEncoder(b"secret")
+
+    request = SearchRequest(sort_by="userName", count=4, cursor="")
+    response = request.paginate(users, cursor_encoder=encoder)
+    assert [user.id for user in response.resources] == ["0", "1", "2", "3"]
+    assert response.total_results == 10
+    assert response.items_per_page == 4
+    assert response.start_index is None
+    assert response.previous_cursor is None
+
+    request.cursor = response.next_cursor
+    response = request.paginate(users, cursor_encoder=encoder)
+    assert [user.id for user in response.resources] == ["4", "5", "6", "7"]
+
+    request.cursor = response.next_cursor
+    response = request.paginate(users, cursor_encoder=encoder)
+    assert [user.id for user in response.resources] == ["8", "9"]
+    assert response.next_cursor is None
+
+    request.cursor = response.previous_cursor
+    response = request.paginate(users, cursor_encoder=encoder)
+    assert [user.id for user in response.resources] == ["4", "5", "6", "7"]
+
+    request.cursor = response.previous_cursor
+    response = request.paginate(users, cursor_encoder=encoder)
+    assert [user.id for user in response.resources] == ["0", "1", "2", "3"]
+    assert response.previous_cursor is None
+    assert response.model_dump()["nextCursor"] == response.next_cursor
+
+
+def test_paginate_with_cursor_descending_order():
+    users = [User(id=str(index), user_name="same") for index in range(5)]
+    users.append(User(id="5"))
+    encoder = CursorEncoder(b"secret")
+
+    request = SearchRequest(
+        sort_by="userName",
+        sort_order=SearchRequest.SortOrder.descending,
+        count=4,
+        cursor="",
+    )
+    response = request.paginate(users, cursor_encoder=encoder)
+    assert [user.id for user in response.resources] == ["5", "4", "3", "2"]
+
+    request.cursor = response.next_cursor
+    response = request.paginate(users, cursor_encoder=encoder)
+    assert [user.id for user in response.resources] == ["1", "0"]
+
+
+def test_paginate_with_invalid_cursor():
+    users = [User(id=str(index), user_name=f"user{index}") for index in range(10)]
+    encoder = CursorEncoder(b"secret")
+
+    request = SearchRequest(sort_by="userName", count=4, cursor="foobar")
+    error = request.paginate(users, cursor_encoder=encoder)
+    assert isinstance(error, Error)
+    assert error.scim_type == "invalidCursor"
+
+    # cursors cannot be reused with different sorting parameters
+    request.cursor = ""
+    request.cursor = request.paginate(users, cursor_encoder=encoder).next_cursor
+    request.sort_by = "id"
+    error = request.paginate(users, cursor_encoder=encoder)
+    assert error.scim_type == "invalidCursor"
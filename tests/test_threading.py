@@ -0,0 +1,141 @@
+"""Concurrency stress tests.
+
+Those tests are mostly meaningful on free-threaded Python builds, but
+they also check that shared objects are not modified by concurrent
+reads on regular builds.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from typing import Optional
+
+from scim2_models import ColumnarList
+from scim2_models import Context
+from scim2_models import EnterpriseUser
+from scim2_models import Group
+from scim2_models import GroupMember
+from scim2_models import ListResponse
+from scim2_models import Resource
+from scim2_models import Schema
+from scim2_models import User
+
+THREADS = 16
+ITERATIONS = 20
+
+
+def run_concurrently(func, threads=THREADS):
+    """Run 'func' in several threads starting at the same time, and return
+    the results."""
+
+    barrier = threading.Barrier(threads)
+
+    def wrapped(index):
+        barrier.wait()
+        return func(index)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(wrapped, range(threads)))
+
+
+def test_concurrent_validation_and_serialization(load_sample):
+    payload = load_sample("rfc7643-8.3-enterprise_user.json")
+    model = User[EnterpriseUser]
+    reference = model.model_validate(payload)
+    expected = reference.model_dump()
+    expected_partial = reference.model_dump(
+        scim_ctx=Context.RESOURCE_QUERY_RESPONSE, attributes=["userName"]
+    )
+
+    def work(index):
+        for _ in range(ITERATIONS):
+            obj = model.model_validate(payload)
+            assert obj.model_dump() == expected
+            assert (
+                obj.model_dump(
+                    scim_ctx=Context.RESOURCE_QUERY_RESPONSE, attributes=["userName"]
+                )
+                == expected_partial
+            )
+        return True
+
+    assert all(run_concurrently(work))
+
+
+def test_concurrent_serialization_of_a_shared_object(load_sample):
+    payload = load_sample("rfc7643-8.2-user-full.json")
+    obj = User.model_validate(payload)
+    context = {"scim": Context.RESOURCE_QUERY_RESPONSE}
+
+    def work(index):
+        attributes = ["userName"] if index % 2 else ["displayName"]
+        for _ in range(ITERATIONS):
+            dump = obj.model_dump(context=context, attributes=attributes)
+            assert set(dump) == {"schemas", "id", attributes[0]}
+
+            # revalidating a shared object does not modify it
+            assert User.model_validate(obj) is obj
+        return True
+
+    assert all(run_concurrently(work))
+    assert context == {"scim": Context.RESOURCE_QUERY_RESPONSE}
+    assert obj.model_dump() == payload
+
+
+def test_concurrent_generic_specialization():
+    class Extension(Resource):
+        schemas: List[str] = ["urn:example:schemas:Extension"]
+        foobar: Optional[str] = None
+
+    results = run_concurrently(lambda index: User[Extension])
+    assert all(result is results[0] for result in results)
+
+    results = run_concurrently(lambda index: ListResponse[User[Extension]])
+    assert all(result is results[0] for result in results)
+
+
+def test_concurrent_dynamic_models(load_sample):
+    payload = load_sample("rfc7643-8.7.1-schema-group.json")
+    schema = Schema.model_validate(payload)
+
+    def work(index):
+        model = schema.make_model()
+        obj = model.model_validate(
+            {
+                "schemas": ["urn:ietf:params:scim:schemas:core:2.0:Group"],
+                "displayName": f"group-{index}",
+                "members": [{"value": str(index)}],
+            }
+        )
+        assert obj.members[0].value == str(index)
+        assert obj.members[0].__class__ is model.Members
+        return obj.display_name
+
+    assert run_concurrently(work) == [f"group-{i}" for i in range(THREADS)]
+
+
+def test_concurrent_compact_storage(monkeypatch):
+    monkeypatch.setattr(GroupMember, "compact_storage", True)
+    payload = {"members": [{"value": str(i)} for i in range(50)]}
+
+    def work(index):
+        for _ in range(ITERATIONS):
+            obj = Group.model_validate(payload)
+            assert obj.model_dump(scim_ctx=None, exclude_unset=True) == payload
+            obj.members[0].display = "foobar"
+            assert obj.members[1].model_fields_set == {"value"}
+        return True
+
+    assert all(run_concurrently(work))
+
+
+def test_concurrent_columnar_list_lookups():
+    class BigGroup(Group):
+        members: Optional[ColumnarList[GroupMember]] = None
+
+    obj = BigGroup.model_validate({"members": [{"value": str(i)} for i in range(1000)]})
+
+    def work(index):
+        return all(obj.members.index_of(str(i)) == i for i in range(1000))
+
+    assert all(run_concurrently(work))
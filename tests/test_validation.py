@@ -0,0 +1,69 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from scim2_models import Context
+from scim2_models import Group
+from scim2_models import User
+from scim2_models import validate_many
+
+PAYLOADS = [
+    {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "userName": f"user-{i}",
+    }
+    for i in range(10)
+] + [
+    {"schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"], "userName": 42},
+    {"schemas": ["urn:ietf:params:scim:schemas:core:2.0:Group"], "displayName": "x"},
+    {"schemas": ["urn:example:unknown"]},
+]
+
+
+def check_results(results):
+    assert len(results) == 13
+    assert [result.user_name for result in results[:10]] == [
+        f"user-{i}" for i in range(10)
+    ]
+    assert isinstance(results[10], ValidationError)
+    assert isinstance(results[11], Group)
+    assert isinstance(results[12], ValueError)
+
+
+def test_validate_many_with_model():
+    results = validate_many(User, PAYLOADS[:11], chunk_size=3)
+    assert [type(result) for result in results] == [User] * 10 + [ValidationError]
+
+
+def test_validate_many_with_registry():
+    check_results(validate_many([User, Group], PAYLOADS, chunk_size=3))
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_validate_many_with_executor(executor_class):
+    with executor_class(max_workers=2) as executor:
+        results = validate_many(
+            [User, Group], PAYLOADS, executor=executor, chunk_size=4
+        )
+
+    check_results(results)
+    assert results[0].model_dump() == PAYLOADS[0]
+
+
+def test_validate_many_context():
+    results = validate_many(
+        User,
+        [{"userName": "x", "id": "123"}, {"id": "123"}],
+        scim_ctx=Context.RESOURCE_CREATION_REQUEST,
+    )
+
+    assert results[0].id is None
+    assert isinstance(results[1], ValidationError)
+
+
+def test_validate_many_iterator():
+    payloads = ({"userName": f"user-{i}"} for i in range(5))
+    assert len(validate_many(User, payloads, chunk_size=2)) == 5
+    assert validate_many(User, []) == []